@@ -1,90 +1,3418 @@
+import io
 import os
 import sys
+import gc
+import json
+import time
+import re
 import random
-from dataclasses import dataclass
-from typing import List, Optional
+import bisect
+import queue
+import socket
+import shutil
+import subprocess
+import asyncio
+import hashlib
+import hmac
+import secrets
+import mmap
+import zlib
+import zipfile
+import tarfile
+import sqlite3
+import argparse
+import struct
+import codecs
+import locale
+import logging
+import logging.handlers
+import traceback
+import importlib
+import importlib.util
+import threading
+import multiprocessing
+from array import array
+from itertools import accumulate, chain, compress, repeat
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import Counter, OrderedDict, deque
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Startzeitpunkt für die Zeitmessung "Start -> erster Inhalt"
+T_START = time.perf_counter()
 
 # nervige Qt-Logs ausblenden
 os.environ.setdefault("QT_LOGGING_RULES", "qt.core.qfuture.continuations=false")
 
-from PySide6.QtCore import Qt, QTimer, QSize, QUrl, Slot, Signal, QObject, QEvent, QRect
-from PySide6.QtGui import QPalette, QColor, QPixmap, QAction, QKeySequence, QIcon, QPainter
+from PySide6.QtCore import (
+    Qt, QTimer, QSize, QUrl, Slot, Signal, QObject, QEvent, QRect, QRectF, QBuffer, QIODevice
+)
+from PySide6.QtGui import (
+    QPalette, QColor, QPixmap, QImage, QImageReader, QImageIOHandler, QAction, QKeySequence, QIcon, QPainter
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog,
     QHBoxLayout, QVBoxLayout, QLabel, QListWidget, QListWidgetItem,
     QSplitter, QMessageBox, QToolButton, QSlider, QStyle, QMenu, QWidgetAction,
-    QComboBox, QSpinBox, QCheckBox, QDialog, QFrame
+    QComboBox, QSpinBox, QCheckBox, QDialog, QFrame, QInputDialog, QLineEdit
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink
 
 
-# ---- Formate ----------------------------------------------------------------
+# ---- Formate ----------------------------------------------------------------
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"}
+VIDEO_EXTS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".mpeg", ".mpg", ".m4v"}
+ARCHIV_EXTS = {".zip", ".cbz", ".tar", ".cbt"}
+
+
+def is_image(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTS
+
+
+def is_video(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in VIDEO_EXTS
+
+
+def is_archiv(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in ARCHIV_EXTS
+
+
+FILTER_OPTIONEN = ["Alles", "Nur ausgewähltes", "Nur Bilder", "Nur Videos"]
+
+
+# ---- Theme ------------------------------------------------------------------
+
+def apply_dark_palette(app: QApplication) -> None:
+    pal = QPalette()
+    pal.setColor(QPalette.Window, QColor(18, 18, 20))
+    pal.setColor(QPalette.Base, QColor(24, 24, 28))
+    pal.setColor(QPalette.AlternateBase, QColor(32, 32, 36))
+
+    # ALLE Schrift weiß
+    pal.setColor(QPalette.WindowText, QColor(255, 255, 255))
+    pal.setColor(QPalette.Text, QColor(255, 255, 255))
+    pal.setColor(QPalette.ButtonText, QColor(255, 255, 255))
+    try:
+        pal.setColor(QPalette.PlaceholderText, QColor(200, 200, 200))
+    except Exception:
+        pass
+
+    pal.setColor(QPalette.Button, QColor(28, 28, 32))
+    pal.setColor(QPalette.Highlight, QColor(78, 130, 255))
+    pal.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
+    pal.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
+    pal.setColor(QPalette.ToolTipText, QColor(0, 0, 0))
+    app.setPalette(pal)
+
+
+def apply_light_palette(app: QApplication) -> None:
+    app.setPalette(app.style().standardPalette())
+
+
+# ---- Datenmodell ------------------------------------------------------------
+
+@dataclass
+class MediaItem:
+    path: str
+    # Position in all_items (stabil, nur Anhängen); Grundlage für Zufall und Filter
+    nr: int = field(default=-1, compare=False)
+    # Herkunft (Ordner, Archiv oder Playlist), wenn mehrere Quellen gemischt werden
+    quelle: str = field(default="", compare=False)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def kind(self) -> str:
+        if is_image(self.path):
+            return "bild"
+        if is_video(self.path):
+            return "video"
+        return "anders"
+
+
+def sammle_medien(folder: str) -> List[MediaItem]:
+    """Alle Bilder/Videos eines Ordners (nicht rekursiv), nach Name sortiert. Archive wie Ordner."""
+    if is_archiv(folder) and os.path.isfile(folder):
+        return sammle_archiv(folder)
+    items: List[MediaItem] = []
+    for name in sorted(os.listdir(folder), key=lambda s: s.lower()):
+        path = os.path.join(folder, name)
+        if not os.path.isfile(path):
+            continue
+        ext = os.path.splitext(path)[1].lower()
+        if ext in IMAGE_EXTS or ext in VIDEO_EXTS:
+            items.append(MediaItem(path))
+    return items
+
+
+def sammle_quelle(pfad: str) -> List[MediaItem]:
+    """Medien einer Quelle: Ordner/Archiv wie sammle_medien, Playlist mit ihren Einträgen, sonst die Datei selbst."""
+    if os.path.isdir(pfad) or is_archiv(pfad):
+        items = sammle_medien(pfad)
+        herkunft = pfad
+    elif is_playlist(pfad):
+        items = [MediaItem(p) for p in lies_playlist(pfad) if is_image(p) or is_video(p)]
+        herkunft = pfad
+    elif os.path.isfile(pfad):
+        items = [MediaItem(pfad)] if is_image(pfad) or is_video(pfad) else []
+        herkunft = os.path.dirname(pfad)
+    else:
+        raise FileNotFoundError("nicht gefunden")
+    for item in items:
+        item.quelle = herkunft
+    return items
+
+
+def ohne_duplikate(items: List[MediaItem]) -> List[MediaItem]:
+    seen = set()
+    out = []
+    for item in items:
+        if item.path not in seen:
+            seen.add(item.path)
+            out.append(item)
+    return out
+
+
+# Sehr große Bilder (Panoramen, Scans) für die normale Anzeige verkleinert dekodieren;
+# Details lädt der Zoom kachelweise nach
+GROSSBILD_KANTE = 4096
+
+
+def lies_bild(path: str, ausschnitt: Optional[QRect] = None, groesse: Optional[QSize] = None,
+              max_kante: Optional[int] = None) -> QImage:
+    """
+    Bild (oder Archiv-Mitglied) über QImageReader lesen. ausschnitt wird vor dem Skalieren
+    auf groesse angewendet; JPEG dekodiert dann nur diesen Bereich in reduzierter Auflösung.
+    """
+    teile = archiv_teile(path)
+    puffer = None
+    if teile is None:
+        leser = QImageReader(path)
+    else:
+        try:
+            daten = Archiv.oeffnen(teile[0]).daten(teile[1])
+        except (OSError, KeyError, ValueError, zlib.error, zipfile.BadZipFile, tarfile.TarError):
+            return QImage()
+        puffer = QBuffer()
+        puffer.setData(daten)
+        puffer.open(QIODevice.ReadOnly)
+        leser = QImageReader(puffer)
+    if max_kante is not None:
+        g = leser.size()
+        if g.isValid() and max(g.width(), g.height()) > max_kante:
+            leser.setScaledSize(g.scaled(max_kante, max_kante, Qt.KeepAspectRatio))
+    if ausschnitt is not None:
+        leser.setClipRect(ausschnitt)
+    if groesse is not None:
+        leser.setScaledSize(groesse)
+    return leser.read()
+
+
+def bild_info(path: str) -> Tuple[QSize, bool]:
+    """(Originalgröße, Ausschnitt-Dekodierung möglich) ohne das Bild zu dekodieren."""
+    teile = archiv_teile(path)
+    if teile is not None:
+        img = lies_bild(path)  # Archiv: Kopf steckt im Mitglied, Ausschnitte lohnen nicht
+        return img.size(), False
+    leser = QImageReader(path)
+    return leser.size(), leser.supportsOption(QImageIOHandler.ImageOption.ClipRect)
+
+
+def dekodiere_bild(path: str) -> QImage:
+    """Bild dekodieren (thread-sicher, im Gegensatz zu QPixmap). Backend je Format laut Dekoderwahl."""
+    return DEKODER.dekodiere(path, GROSSBILD_KANTE)
+
+
+def medium_existiert(path: str) -> bool:
+    teile = archiv_teile(path)
+    if teile is None:
+        return os.path.exists(path)
+    try:
+        return teile[1] in Archiv.oeffnen(teile[0]).mitglieder
+    except (OSError, ValueError, zipfile.BadZipFile, tarfile.TarError):
+        return False
+
+
+def skalier_modus(skalierung: str) -> Qt.AspectRatioMode:
+    return Qt.KeepAspectRatioByExpanding if skalierung == "Füllen (Zuschneiden)" else Qt.KeepAspectRatio
+
+
+def skaliere_bild(img: QImage, ziel: QSize, skalierung: str, schnell: bool = False) -> QImage:
+    return img.scaled(ziel, skalier_modus(skalierung), Qt.FastTransformation if schnell else Qt.SmoothTransformation)
+
+
+# ab dieser Bildgröße erst schnell (grob) skaliert anzeigen, die glatte Fassung folgt aus dem Worker
+VORSCHAU_AB_PIXEL = 2_000_000
+VERWEILEN_MS = 150  # so lange muss eine Vorschau stehen, bevor voll dekodiert wird
+
+
+def lies_vorschau(path: str, ziel: QSize, skalierung: str) -> Optional[QImage]:
+    """
+    Schnelle Vorschau in Zielgröße: eingebettetes EXIF-Vorschaubild (wenige KB lesen), sonst
+    direkt verkleinert dekodiert (JPEG: DCT-Skalierung); None, wenn beides nicht geht.
+    """
+    if archiv_teile(path) is not None:
+        return None
+    leser = QImageReader(path)
+    g = leser.size()
+    if not g.isValid() or g.width() * g.height() < VORSCHAU_AB_PIXEL:
+        return None  # kleine Bilder sind direkt schnell genug
+    groesse = g.scaled(ziel, skalier_modus(skalierung))
+    daumen = exif_vorschau(path)
+    if daumen is not None:
+        # Kameras setzen z. B. 3:2-Bilder mit schwarzen Balken in 160×120: auf das Bildformat zuschneiden
+        soll = g.width() / g.height()
+        ist = daumen.width() / daumen.height()
+        if ist < soll * 0.98:
+            h = round(daumen.width() / soll) - 2  # je eine Zeile Rand, falls die Balken ungleich sind
+            daumen = daumen.copy(0, (daumen.height() - h) // 2, daumen.width(), h)
+        elif ist > soll * 1.02:
+            w = round(daumen.height() * soll) - 2
+            daumen = daumen.copy((daumen.width() - w) // 2, 0, w, daumen.height())
+        return daumen.scaled(groesse, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    if not leser.supportsOption(QImageIOHandler.ImageOption.ScaledSize):
+        return None
+    leser.setScaledSize(groesse)
+    img = leser.read()
+    return None if img.isNull() else img
+
+
+def bereite_bild_vor(path: str, img: Optional[QImage], groessen: List[QSize], skalierung: str,
+                     quelle: Optional[str] = None):
+    """Nächste Folie im Worker fertig machen: dekodieren (falls nötig) und je Ziel skalieren.
+
+    quelle: lokale Kopie von path (Staging), sonst wird path selbst gelesen.
+    Liefert (path, img, [(w, h, skaliert)], Dekodierdauer in ms oder None, Skalierdauer in ms).
+    """
+    dekodier_ms = None
+    t0 = time.perf_counter()
+    if img is None:
+        img = dekodiere_bild(quelle or path)
+        dekodier_ms = (time.perf_counter() - t0) * 1000.0
+    t1 = time.perf_counter()
+    skaliert = []
+    if not img.isNull():
+        skaliert = [(g.width(), g.height(), skaliere_bild(img, g, skalierung)) for g in groessen]
+    return path, img, skaliert, dekodier_ms, (time.perf_counter() - t1) * 1000.0
+
+
+@dataclass
+class StartOptionen:
+    """Startparameter von der Kommandozeile (Kiosk-Betrieb)."""
+    ordner: List[str] = field(default_factory=list)
+    filter_option: str = "Alles"
+    zufall: bool = False
+    seed: Optional[int] = None  # None = zufälliger Seed
+    sortierung: str = "Ladefolge"
+    intervall: int = 0
+    schleife: bool = True
+    vollbild: bool = False
+    abspielen: bool = False
+    zeitmessung: bool = False
+    bildschirme: List[int] = field(default_factory=list)  # Vollbild auf diesen Bildschirmen
+    staging_mb: int = 0  # 0 = Medien direkt von der Quelle lesen
+    staging_ordner: Optional[str] = None
+    haenger_ms: int = 1000  # 0 = kein Hänger-Wächter
+    steuer_port: Optional[int] = None
+    steuer_socket: Optional[str] = None
+    playlist: Optional[str] = None
+    # schon gescannte Medien + erstes Element der Playlist
+    items: Optional[List[MediaItem]] = None
+    ausgewaehlt: Optional[bytearray] = None  # Auswahl je items-Nummer (für "Nur ausgewähltes")
+    erstes: Optional[MediaItem] = None
+    # läuft parallel zum Fensteraufbau: Future -> (path, QImage)
+    erstes_bild: Optional[Future] = None
+
+
+# ---- Archive (ZIP/CBZ/TAR) --------------------------------------------------
+
+# Mitglieder heißen "<archiv>!/<name im archiv>", z. B. "/fotos/lieferung.zip!/tag1/IMG_1.jpg"
+ARCHIV_TRENNER = "!/"
+_ZIP_LOKALER_KOPF = struct.Struct("<4s5H3L2H")
+
+
+def archiv_teile(path: str) -> Optional[Tuple[str, str]]:
+    """(Archivdatei, Mitglied) oder None für normale Dateien."""
+    i = path.find(ARCHIV_TRENNER)
+    while i != -1:
+        if is_archiv(path[:i]):
+            return path[:i], path[i + len(ARCHIV_TRENNER):]
+        i = path.find(ARCHIV_TRENNER, i + 1)
+    return None
+
+
+class Archiv:
+    """
+    Liest Mitglieder direkt aus der speichergemappten Archivdatei, ohne Entpacken auf die Platte.
+
+    ZIP/CBZ: nur das zentrale Verzeichnis am Dateiende wird gelesen; gespeicherte
+    Mitglieder sind ein Ausschnitt der Map, komprimierte werden im Speicher entpackt.
+    TAR/CBT (unkomprimiert): nur die 512-Byte-Köpfe, die Daten werden übersprungen.
+    Die zuletzt benutzten MAX_OFFEN Archive bleiben geöffnet (thread-sicher, nur lesend);
+    eine geänderte Datei (mtime/Größe) wird neu eingelesen.
+    """
+    MAX_OFFEN = 8
+    _offen: "OrderedDict[Tuple[str, int, int], Archiv]" = OrderedDict()  # (pfad, mtime_ns, größe), LRU
+    _lock = threading.Lock()
+
+    def __init__(self, pfad: str):
+        self.pfad = pfad
+        self.ist_zip = os.path.splitext(pfad)[1].lower() in (".zip", ".cbz")
+        # Name -> (Offset Kopf bzw. Daten, gepackte Größe, Größe, Methode)
+        self.mitglieder: Dict[str, Tuple[int, int, int, int]] = {}
+        with open(pfad, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.ist_zip:
+            with zipfile.ZipFile(pfad) as z:
+                for info in z.infolist():
+                    if info.is_dir() or info.flag_bits & 0x1:  # verschlüsselt: nicht lesbar
+                        continue
+                    self.mitglieder[info.filename] = (
+                        info.header_offset, info.compress_size, info.file_size, info.compress_type
+                    )
+        else:
+            with tarfile.open(pfad, "r:") as t:
+                for m in t:
+                    if m.isfile() and not m.issparse():
+                        self.mitglieder[m.name] = (m.offset_data, m.size, m.size, zipfile.ZIP_STORED)
+
+    @classmethod
+    def oeffnen(cls, pfad: str) -> "Archiv":
+        st = os.stat(pfad)
+        key = (pfad, st.st_mtime_ns, st.st_size)
+        with cls._lock:
+            archiv = cls._offen.get(key)
+            if archiv is not None:
+                cls._offen.move_to_end(key)
+                return archiv
+            archiv = cls(pfad)
+            for alt in [k for k in cls._offen if k[0] == pfad]:  # veraltete Fassung derselben Datei
+                cls._offen.pop(alt).schliessen()
+            cls._offen[key] = archiv
+            while len(cls._offen) > cls.MAX_OFFEN:
+                cls._offen.popitem(last=False)[1].schliessen()
+            return archiv
+
+    def schliessen(self) -> None:
+        try:
+            self._map.close()
+        except BufferError:  # ein anderer Thread entpackt gerade daraus: die Map geht mit dem letzten Verweis zu
+            pass
+
+    def daten(self, name: str) -> bytes:
+        """Inhalt eines Mitglieds, direkt aus der Map (gespeichert: ein Ausschnitt, sonst entpackt)."""
+        if self._map.closed:  # inzwischen verdrängt
+            return Archiv.oeffnen(self.pfad).daten(name)
+        offset, gepackt, groesse, methode = self.mitglieder[name]
+        start = offset
+        if self.ist_zip:
+            kopf = _ZIP_LOKALER_KOPF.unpack_from(self._map, offset)
+            if kopf[0] != b"PK\x03\x04":
+                raise zipfile.BadZipFile(f"lokaler Kopf fehlt: {name}")
+            start = offset + _ZIP_LOKALER_KOPF.size + kopf[9] + kopf[10]
+        if methode == zipfile.ZIP_STORED:
+            return self._map[start:start + gepackt]
+        if methode == zipfile.ZIP_DEFLATED:
+            return zlib.decompress(memoryview(self._map)[start:start + gepackt], -15, groesse)
+        with zipfile.ZipFile(self.pfad) as z:  # bzip2/lzma: selten, über zipfile
+            return z.read(name)
+
+
+def sammle_archiv(pfad: str) -> List[MediaItem]:
+    """Bilder eines Archivs als Medien, nach Name sortiert (Videos brauchen eine echte Datei)."""
+    try:
+        archiv = Archiv.oeffnen(os.path.abspath(pfad))
+    except (ValueError, zipfile.BadZipFile, tarfile.TarError) as e:
+        raise OSError(f"Archiv nicht lesbar: {e}") from e
+    namen = [
+        n for n in archiv.mitglieder
+        if is_image(n) and not n.startswith("__MACOSX/") and not os.path.basename(n).startswith("._")
+    ]
+    namen.sort(key=lambda s: s.lower())
+    return [MediaItem(archiv.pfad + ARCHIV_TRENNER + n) for n in namen]
+
+
+# ---- Bild-Dekoder (Backends) ------------------------------------------------
+
+# Formate ohne Qt-Leser in den meisten Installationen; werden angezeigt, sobald ein Backend sie liest
+ZUSATZ_EXTS = {".heic", ".heif", ".avif", ".jxl"}
+# Module, die diese Formate nachrüsten (Pillow-Plugins registrieren sich beim Import)
+PILLOW_PLUGINS = ("pillow_heif", "pillow_avif", "pillow_jxl")
+
+
+def _qimage_aus(daten, breite: int, hoehe: int, alpha: bool) -> QImage:
+    """
+    RGB- bzw. RGBA-Pixel (Bytes oder Puffer) als eigenständiges QImage. Ein QImage über einem
+    fremden Puffer gehört diesem nicht: implizit geteilte Kopien auf der C++-Seite (Caches,
+    Signale) überleben den Puffer. Deshalb einmal kopieren.
+    """
+    if alpha:
+        return QImage(daten, breite, hoehe, breite * 4, QImage.Format_RGBA8888).copy()
+    return QImage(daten, breite, hoehe, breite * 3, QImage.Format_RGB888).copy()
+
+
+def _zielgroesse(breite: int, hoehe: int, max_kante: Optional[int]) -> Optional[Tuple[int, int]]:
+    if max_kante is None or max(breite, hoehe) <= max_kante:
+        return None
+    g = QSize(breite, hoehe).scaled(max_kante, max_kante, Qt.KeepAspectRatio)
+    return g.width(), g.height()
+
+
+class BildDekoder(ABC):
+    """
+    Backend für ganze Bilder (Anzeige, Export, Duplikate). quelle ist ein Dateipfad oder der
+    Inhalt eines Archiv-Mitglieds, max_kante begrenzt die längere Kante wie bei lies_bild.
+    Fehler: Ausnahme oder leeres QImage, die Dekoderwahl versucht dann das nächste Backend.
+    Keine EXIF-Drehung, wie bei QImageReader.
+    """
+    name = ""
+
+    def verfuegbar(self) -> bool:
+        return True
+
+    @abstractmethod
+    def kann(self, endung: str) -> bool:
+        ...
+
+    @abstractmethod
+    def dekodiere(self, quelle, max_kante: Optional[int]) -> QImage:
+        ...
+
+
+class QtDekoder(BildDekoder):
+    name = "qt"
+
+    def __init__(self):
+        self._endungen = {"." + bytes(f).decode() for f in QImageReader.supportedImageFormats()}
+
+    def kann(self, endung: str) -> bool:
+        return endung in self._endungen
+
+    def dekodiere(self, quelle, max_kante: Optional[int]) -> QImage:
+        if isinstance(quelle, str):
+            return lies_bild(quelle, max_kante=max_kante)
+        puffer = QBuffer()
+        puffer.setData(quelle)
+        puffer.open(QIODevice.ReadOnly)
+        leser = QImageReader(puffer)
+        ziel = _zielgroesse(leser.size().width(), leser.size().height(), max_kante)
+        if ziel is not None:
+            leser.setScaledSize(QSize(*ziel))
+        return leser.read()
+
+
+class PillowDekoder(BildDekoder):
+    """Pillow (JPEG über libjpeg-turbo, mit DCT-Verkleinerung); HEIC/AVIF/JXL über installierte Plugins."""
+    name = "pillow"
+
+    def verfuegbar(self) -> bool:
+        try:
+            from PIL import Image
+        except ImportError:
+            return False
+        for modul in PILLOW_PLUGINS:
+            try:
+                plugin = importlib.import_module(modul)
+            except ImportError:
+                continue
+            if hasattr(plugin, "register_heif_opener"):
+                plugin.register_heif_opener()
+        Image.init()
+        self._endungen = {e for e, f in Image.registered_extensions().items() if f in Image.OPEN}
+        return True
+
+    def kann(self, endung: str) -> bool:
+        return endung in self._endungen
+
+    def dekodiere(self, quelle, max_kante: Optional[int]) -> QImage:
+        from PIL import Image
+        with Image.open(io.BytesIO(quelle) if isinstance(quelle, bytes) else quelle) as datei:
+            ziel = _zielgroesse(datei.width, datei.height, max_kante)
+            if ziel is not None:
+                datei.draft("RGB", ziel)  # JPEG: schon beim Dekodieren auf 1/2, 1/4 oder 1/8
+            alpha = datei.mode in ("RGBA", "LA", "PA", "RGBa", "La") or "transparency" in datei.info
+            modus = "RGBA" if alpha else "RGB"
+            datei.load()
+            im = datei if datei.mode == modus else datei.convert(modus)  # convert kopiert auch bei gleichem Modus
+            if ziel is not None and im.size != ziel:
+                im = im.resize(ziel, Image.Resampling.BICUBIC, reducing_gap=2.0)
+            return _qimage_aus(im.tobytes(), im.width, im.height, alpha)
+
+
+class TurboJpegDekoder(BildDekoder):
+    """libjpeg-turbo direkt (PyTurboJPEG), nur JPEG; verkleinert per DCT und dann glatt."""
+    name = "turbojpeg"
+
+    def verfuegbar(self) -> bool:
+        try:
+            from turbojpeg import TurboJPEG
+            self._tj = TurboJPEG()
+        except (ImportError, OSError, RuntimeError):  # Modul oder libturbojpeg fehlt
+            return False
+        return True
+
+    def kann(self, endung: str) -> bool:
+        return endung in (".jpg", ".jpeg")
+
+    def dekodiere(self, quelle, max_kante: Optional[int]) -> QImage:
+        from turbojpeg import TJPF_RGB
+        if isinstance(quelle, str):
+            with open(quelle, "rb") as f:
+                quelle = f.read()
+        breite, hoehe = self._tj.decode_header(quelle)[:2]
+        ziel = _zielgroesse(breite, hoehe, max_kante)
+        faktor = None
+        if ziel is not None:
+            # kleinster DCT-Faktor, der noch mindestens die Zielgröße liefert
+            passend = [(z, n) for z, n in self._tj.scaling_factors if breite * z // n >= ziel[0] and hoehe * z // n >= ziel[1]]
+            faktor = min(passend, key=lambda f: f[0] / f[1], default=None)
+        pixel = self._tj.decode(quelle, pixel_format=TJPF_RGB, scaling_factor=faktor)
+        h, w = pixel.shape[:2]
+        img = _qimage_aus(pixel, w, h, False)
+        if ziel is not None and (w, h) != ziel:
+            img = img.scaled(QSize(*ziel), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        return img
+
+
+class VipsDekoder(BildDekoder):
+    """libvips (pyvips): thumbnail dekodiert gleich verkleinert; Formate je nach libvips-Build."""
+    name = "vips"
+
+    def verfuegbar(self) -> bool:
+        try:
+            import pyvips
+            self._endungen = {e.lower() for e in pyvips.get_suffixes()}
+        except (ImportError, OSError):  # Modul oder libvips fehlt
+            return False
+        return True
+
+    def kann(self, endung: str) -> bool:
+        return endung in self._endungen
+
+    def dekodiere(self, quelle, max_kante: Optional[int]) -> QImage:
+        import pyvips
+        bytes_quelle = isinstance(quelle, bytes)
+        if max_kante is not None:
+            if bytes_quelle:
+                img = pyvips.Image.thumbnail_buffer(quelle, max_kante, size="down", no_rotate=True)
+            else:
+                img = pyvips.Image.thumbnail(quelle, max_kante, size="down", no_rotate=True)
+        elif bytes_quelle:
+            img = pyvips.Image.new_from_buffer(quelle, "", access="sequential")
+        else:
+            img = pyvips.Image.new_from_file(quelle, access="sequential")
+        if img.interpretation != "srgb":
+            img = img.colourspace("srgb")
+        if img.format != "uchar":
+            img = img.cast("uchar")
+        alpha = img.bands == 4
+        if not alpha and img.bands != 3:
+            img = img[:3]
+        return _qimage_aus(img.write_to_memory(), img.width, img.height, alpha)
+
+
+DEKODER_KLASSEN = {k.name: k for k in (QtDekoder, PillowDekoder, TurboJpegDekoder, VipsDekoder)}
+
+
+def dekoder_datei() -> str:
+    return os.path.join(cache_ordner(), "dekoder.json")
+
+
+class Dekoderwahl:
+    """
+    Reihenfolge der Backends je Endung: aus dem Dekoder-Benchmark (dekoder.json im Cache),
+    sonst Qt vor allen anderen. Backends werden beim ersten Bild geladen; liefert eines kein
+    Bild, kommt das nächste dran.
+    """
+
+    def __init__(self, datei: Optional[str] = None):
+        self.datei = datei
+        self._lock = threading.Lock()
+        self._backends: Optional[Dict[str, BildDekoder]] = None
+        self._gemessen: Dict[str, List[str]] = {}
+        self._reihenfolgen: Dict[str, List[BildDekoder]] = {}
+        self._gemeldet: set = set()
+
+    def backends(self) -> Dict[str, BildDekoder]:
+        with self._lock:
+            if self._backends is None:
+                self._backends = {}
+                for name, klasse in DEKODER_KLASSEN.items():
+                    dek = klasse()
+                    if dek.verfuegbar():
+                        self._backends[name] = dek
+                try:
+                    with open(self.datei or dekoder_datei(), encoding="utf-8") as f:
+                        self._gemessen = json.load(f).get("reihenfolge", {})
+                except (OSError, ValueError, AttributeError):
+                    self._gemessen = {}
+            return self._backends
+
+    def reihenfolge(self, endung: str) -> List[BildDekoder]:
+        r = self._reihenfolgen.get(endung)
+        if r is None:
+            backends = self.backends()  # nimmt selbst den Lock
+            with self._lock:
+                r = self._reihenfolgen.get(endung)
+                if r is None:
+                    namen = [n for n in self._gemessen.get(endung, []) if n in backends]
+                    namen += [n for n in backends if n not in namen]  # nicht gemessen: Qt zuerst
+                    r = self._reihenfolgen[endung] = [backends[n] for n in namen if backends[n].kann(endung)]
+        return r
+
+    def dekodiere(self, path: str, max_kante: Optional[int] = None) -> QImage:
+        teile = archiv_teile(path)
+        quelle = path
+        if teile is not None:
+            try:
+                quelle = Archiv.oeffnen(teile[0]).daten(teile[1])
+            except (OSError, KeyError, ValueError, zlib.error, zipfile.BadZipFile, tarfile.TarError):
+                return QImage()
+        endung = os.path.splitext(teile[1] if teile else path)[1].lower()
+        for dek in self.reihenfolge(endung):
+            try:
+                img = dek.dekodiere(quelle, max_kante)
+            except Exception as e:  # Fremdbibliotheken: jede Ausnahme heißt "nächstes Backend"
+                with self._lock:
+                    neu = (dek.name, endung) not in self._gemeldet
+                    self._gemeldet.add((dek.name, endung))
+                if neu:
+                    grund = (str(e).strip().splitlines() or [type(e).__name__])[0]
+                    print(f"MySlide: Dekoder {dek.name} für {endung} fehlgeschlagen ({grund}), nehme den nächsten",
+                          file=sys.stderr)
+                continue
+            if not img.isNull():
+                return img
+        return QImage()
+
+
+DEKODER = Dekoderwahl()
+
+
+def erweitere_bildformate() -> None:
+    """HEIC/AVIF/JXL in IMAGE_EXTS aufnehmen, wenn Qt-Plugins oder Backend-Module sie lesen könnten."""
+    qt = {"." + bytes(f).decode() for f in QImageReader.supportedImageFormats()}
+    module = [m for m in PILLOW_PLUGINS + ("pyvips",) if importlib.util.find_spec(m) is not None]
+    for endung in ZUSATZ_EXTS:
+        if endung in qt or module:
+            IMAGE_EXTS.add(endung)
+
+
+DEKODER_PROBEN = 12         # Beispieldateien je Endung
+DEKODER_WIEDERHOLUNGEN = 3  # je Datei, gezählt wird die schnellste
+DEKODER_SPEICHER_FAKTOR = 2.0  # mehr als das Doppelte des sparsamsten Backends: nach hinten
+
+
+def _vm_hwm_kb() -> float:
+    with open("/proc/self/status") as f:
+        for zeile in f:
+            if zeile.startswith("VmHWM:"):
+                return float(zeile.split()[1])
+    raise OSError("VmHWM fehlt")
+
+
+def _dekoder_messung(name: str, pfade: List[str]) -> Optional[Tuple[float, Optional[float], int]]:
+    """Im eigenen Prozess: (Median ms je Datei, Spitzenspeicher in MB oder None, Fehlschläge)."""
+    dek = DEKODER_KLASSEN[name]()
+    if not dek.verfuegbar():
+        return None
+    messbar = False
+    vorher = 0.0
+    try:
+        # Linux: Spitzenwert (VmHWM) auf den aktuellen RSS zurücksetzen, damit Importe nicht mitzählen
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        vorher = prozess_rss() / MIB
+        messbar = True
+    except OSError:
+        pass
+
+    def spitze() -> Optional[float]:
+        """Spitzenspeicher seit dem Zurücksetzen in MB; None, wo nicht messbar."""
+        return _vm_hwm_kb() / 1024.0 - vorher if messbar else None
+    zeiten = []
+    fehler = 0
+    for path in pfade:
+        beste = None
+        for _ in range(DEKODER_WIEDERHOLUNGEN):
+            t0 = time.perf_counter()
+            try:
+                ok = not dek.dekodiere(path, GROSSBILD_KANTE).isNull()
+            except Exception:
+                ok = False
+            if not ok:
+                fehler += 1
+                break
+            ms = (time.perf_counter() - t0) * 1000.0
+            beste = ms if beste is None else min(beste, ms)
+        if beste is not None:
+            zeiten.append(beste)
+    return (_quantil(sorted(zeiten), 0.5) if zeiten else 0.0), spitze(), fehler
+
+
+def benchmark_dekoder(ordner: str) -> int:
+    """Alle verfügbaren Backends an Beispielbildern messen und die Reihenfolge je Endung speichern."""
+    proben: Dict[str, List[str]] = {}
+    for m in sammle_quelle(ordner):
+        if m.kind == "bild" and archiv_teile(m.path) is None:
+            endung = os.path.splitext(m.path)[1].lower()
+            if len(proben.setdefault(endung, [])) < DEKODER_PROBEN:
+                proben[endung].append(m.path)
+    if not proben:
+        print(f"Keine Bilder in {ordner}", file=sys.stderr)
+        return 1
+    backends = DEKODER.backends()
+    print("Backends: " + ", ".join(backends))
+    ctx = multiprocessing.get_context("spawn")
+    reihenfolge: Dict[str, List[str]] = {}
+    messungen: Dict[str, Dict[str, dict]] = {}
+    for endung, pfade in sorted(proben.items()):
+        print(f"{endung}  ({len(pfade)} Dateien)")
+        werte = {}
+        for name, dek in backends.items():
+            if not dek.kann(endung):
+                continue
+            # je Messung ein frischer Prozess, sonst verdeckt der Spitzenwert des Vorgängers den eigenen
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                ergebnis = pool.submit(_dekoder_messung, name, pfade).result()
+            if ergebnis is None:
+                continue
+            ms, mb, fehler = ergebnis
+            werte[name] = {"ms": round(ms, 2), "mb": None if mb is None else round(mb, 1), "fehler": fehler}
+            speicher = "?" if mb is None else f"{mb:.0f} MB"
+            print(f"  {name:<10} {ms:8.1f} ms  {speicher:>7}" + (f"  {fehler} Fehler" if fehler else ""))
+        if not werte:
+            continue
+        sparsamste = min((w["mb"] for w in werte.values() if w["mb"] is not None), default=None)
+
+        def zu_gross(w: dict) -> bool:
+            if sparsamste is None or w["mb"] is None:
+                return False
+            return w["mb"] > max(1.0, sparsamste) * DEKODER_SPEICHER_FAKTOR
+        reihenfolge[endung] = sorted(werte, key=lambda n: (werte[n]["fehler"] > 0, zu_gross(werte[n]), werte[n]["ms"]))
+        messungen[endung] = werte
+        print(f"  → {' > '.join(reihenfolge[endung])}")
+    datei = dekoder_datei()
+    try:
+        os.makedirs(os.path.dirname(datei), exist_ok=True)
+        with open(datei, "w", encoding="utf-8") as f:
+            json.dump({"reihenfolge": reihenfolge, "messungen": messungen}, f, ensure_ascii=False, indent=1)
+    except OSError as e:
+        print(f"Nicht gespeichert: {e}", file=sys.stderr)
+        return 1
+    print(f"Gespeichert: {datei} (gilt ab dem nächsten Start)")
+    return 0
+
+
+# ---- Filter-Index ----------------------------------------------------------
+#
+# Masken sind bytearrays über all_items (1 Byte je Medium, Wert 0/1). Als große
+# Ganzzahlen gelesen lassen sich UND/ODER/NICHT für alle Medien auf einmal in C
+# rechnen; die Playlist entsteht danach per itertools.compress.
+
+FILTER_SCOPE = {
+    "Alles": None,
+    "Nur ausgewähltes": ("ausgewaehlt",),
+    "Nur Bilder": ("art", "bild"),
+    "Nur Videos": ("art", "video"),
+}
+
+_GROESSEN_EINHEIT = {"": 1, "b": 1, "k": 1024, "kb": 1024, "m": 1024 ** 2, "mb": 1024 ** 2,
+                     "g": 1024 ** 3, "gb": 1024 ** 3}
+
+
+class FilterFehler(ValueError):
+    pass
+
+
+def _glob_regex(muster: str) -> str:
+    # führende/abschließende * brauchen keinen Anker (und machen die Suche schneller);
+    # "." reicht ohne re.S nie über das Zeilenende, der Filter bleibt so auf dem schnellen Weg
+    anfang = "" if muster.startswith("*") else "^"
+    ende = "" if muster.endswith("*") else "$"
+    out = []
+    for ch in muster.strip("*"):
+        if ch == "*":
+            out.append(".*")
+        elif ch == "?":
+            out.append(".")
+        else:
+            out.append(re.escape(ch))
+    return anfang + "".join(out) + ende
+
+
+def _glob_endung(muster: str) -> Optional[str]:
+    """"*.jpg" -> ".jpg": solche Muster beantwortet der Endungs-Code; sonst None."""
+    if muster.startswith("*.") and not any(c in muster[2:] for c in "*?.\n"):
+        return muster[1:]
+    return None
+
+
+def _regex_klein(muster: str) -> Optional[str]:
+    """
+    Regex in Kleinbuchstaben für die klein geschriebenen Namen; None, wenn Groß/Klein darin
+    mehr bedeutet als Literale (Klassen, Flags, \\N{…}, \\x41 …).
+    """
+    if "[" in muster or re.search(r"\(\?[^:=!<]", muster):
+        return None
+    out = []
+    i = 0
+    while i < len(muster):
+        c = muster[i]
+        if c == "\\" and i + 1 < len(muster):
+            d = muster[i + 1]
+            if d.isalnum() and d not in "dDsSwWbBAZ123456789":
+                return None
+            out.append(c + d)
+            i += 2
+            continue
+        if len(c.lower()) != 1:  # "İ" -> "i̇": ein Quantor dahinter gälte sonst nur dem Punkt
+            return None
+        out.append(c.lower())
+        i += 1
+    return "".join(out)
+
+
+def _atom_ende(muster: str, i: int) -> int:
+    """Position hinter der Klasse bzw. (verschachtelten) Gruppe, die bei i beginnt; -1 = nicht geschlossen."""
+    tiefe, j, n = 0, i, len(muster)
+    while j < n:
+        d = muster[j]
+        if d == "\\":
+            j += 2
+            continue
+        if d == "[":
+            j += 1
+            if muster[j:j + 1] == "^":
+                j += 1
+            if muster[j:j + 1] == "]":  # "]" gleich am Anfang gehört zur Klasse
+                j += 1
+            while j < n and muster[j] != "]":
+                j += 2 if muster[j] == "\\" else 1
+            if j >= n:
+                return -1
+            j += 1
+            if tiefe == 0:
+                return j
+            continue
+        if d == "(":
+            tiefe += 1
+        elif d == ")":
+            tiefe -= 1
+            if tiefe == 0:
+                return j + 1
+        j += 1
+    return -1
+
+
+def _pflicht_teile(muster: str) -> List[str]:
+    """
+    Zeichenfolgen (klein), die jeder Treffer des Regex enthalten muss. Vorsichtig: nur
+    Literale der obersten Ebene; Gruppen, Klassen und wiederholte Zeichen beenden einen
+    Teil, bei "|" oder unklaren Escapes gibt es keine ([]).
+    """
+    if "|" in muster or re.search(r"\(\?[a-zA-Z]*x", muster):
+        return []
+    teile: List[str] = []
+    lauf: List[str] = []
+
+    def schliessen() -> None:
+        if lauf:
+            teile.append("".join(lauf).lower())
+            lauf.clear()
+
+    i, n = 0, len(muster)
+    while i < n:
+        c = muster[i]
+        if c == "\\":
+            e = muster[i + 1:i + 2]
+            if not e or e in "xuUN0123456789":
+                return []
+            if e.isalnum():  # \d, \w, \b …: keine Literale
+                schliessen()
+            else:
+                lauf.append(e)
+            i += 2
+        elif c in "*+?{":
+            mindestens = c == "+"
+            if c == "{":
+                j = muster.find("}", i)
+                m = re.fullmatch(r"(\d*),?\d*", muster[i + 1:j]) if j > 0 else None
+                if m is None:
+                    return []
+                mindestens = int(m.group(1) or 0) > 0
+                i = j
+            if lauf and not mindestens:
+                lauf.pop()  # ein optionales Zeichen ist kein Pflichtteil
+            schliessen()
+            i += 1
+        elif c in "[(":
+            schliessen()
+            i = _atom_ende(muster, i)
+            if i < 0:
+                return []
+        elif c in ".^$)":
+            schliessen()
+            i += 1
+        else:
+            if len(c.lower()) == 1:
+                lauf.append(c)
+            else:  # "İ" -> "i̇", re.I vergleicht aber einzelne Zeichen
+                schliessen()
+            i += 1
+    schliessen()
+    return teile
+
+
+def _groesse(text: str, ende: bool = False) -> float:
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-z]*)\s*", text.lower())
+    if not m or m.group(2) not in _GROESSEN_EINHEIT:
+        raise FilterFehler(f"Ungültige Größe: {text}")
+    return float(m.group(1)) * _GROESSEN_EINHEIT[m.group(2)]
+
+
+def _datum(text: str, ende: bool = False) -> float:
+    try:
+        t = time.strptime(text.strip(), "%Y-%m-%d")
+    except ValueError:
+        raise FilterFehler(f"Ungültiges Datum (JJJJ-MM-TT): {text}")
+    return time.mktime(t) + (86400 - 0.001 if ende else 0)
+
+
+def _bereich(text: str, wert: Callable[..., float]) -> Tuple[float, float]:
+    # "a..b", "a..", "..b", ">a", "<b" oder ein einzelner Wert (beim Datum: der ganze Tag)
+    if ".." in text:
+        a, b = text.split("..", 1)
+    elif text.startswith(">"):
+        a, b = text[1:], ""
+    elif text.startswith("<"):
+        a, b = "", text[1:]
+    else:
+        a = b = text
+    return (wert(a) if a else float("-inf")), (wert(b, True) if b else float("inf"))
+
+
+def parse_filter(text: str):
+    """
+    Filterausdruck -> Baum aus Tupeln. Begriffe werden mit "und"/"oder" verknüpft
+    (und bindet stärker), "nicht" verneint. Beispiel:
+    art:bild und endung:jpg,png oder name:*urlaub* und nicht ausgewaehlt
+    """
+    oder = []
+    for teil in re.split(r"\s+(?:oder|or)\s+", text.strip(), flags=re.I):
+        und = []
+        for begriff in re.split(r"\s+(?:und|and)\s+", teil, flags=re.I):
+            begriff = begriff.strip()
+            if not begriff:
+                raise FilterFehler("Leerer Begriff im Filter")
+            nicht = False
+            while re.match(r"(?:nicht|not)\s+", begriff, flags=re.I):
+                nicht = not nicht
+                begriff = begriff.split(None, 1)[1]
+            k = _filter_begriff(begriff)
+            und.append(("nicht", k) if nicht else k)
+        oder.append(und[0] if len(und) == 1 else ("und",) + tuple(und))
+    return oder[0] if len(oder) == 1 else ("oder",) + tuple(oder)
+
+
+def _filter_begriff(begriff: str):
+    name, _, wert = begriff.partition(":")
+    name = name.lower()
+    if name in ("ausgewaehlt", "ausgewählt") and not wert:
+        return ("ausgewaehlt",)
+    if name == "duplikat" and not wert:
+        return ("duplikat",)
+    if name == "defekt" and not wert:
+        return ("defekt",)
+    if not wert:
+        raise FilterFehler(f"Unbekannter Begriff: {begriff}")
+    if name == "art":
+        if wert.lower() not in ("bild", "video"):
+            raise FilterFehler("art: bild oder video")
+        return ("art", wert.lower())
+    if name == "endung":
+        return ("oder",) + tuple(("endung", "." + e.strip().lower().lstrip(".")) for e in wert.split(",") if e.strip())
+    if name == "groesse":
+        return ("groesse",) + _bereich(wert, _groesse)
+    if name == "datum":
+        return ("datum",) + _bereich(wert, _datum)
+    if name == "ordner":
+        return ("ordner", os.path.normcase(os.path.abspath(os.path.expanduser(wert))))
+    if name == "name":
+        return ("name", wert.lower())
+    if name == "regex":
+        try:
+            re.compile(wert)
+        except re.error as e:
+            raise FilterFehler(f"Ungültiger Regex: {e}")
+        return ("regex", wert)
+    raise FilterFehler(f"Unbekannter Begriff: {begriff}")
+
+
+class _BereichsIndex:
+    """Werte (Größe, Datum) mit Eimern: ganze Eimer per Maske, nur die Randeimer werden geprüft."""
+
+    def __init__(self, eimer: Callable[[float], int]):
+        self.eimer = eimer
+        self.werte = array("d")
+        self.mitglieder: Dict[int, array] = {}
+        self.masken: Dict[int, bytearray] = {}
+
+    def haenge_an(self, werte: List[float]) -> None:
+        nr = len(self.werte)
+        self.werte.extend(werte)
+        for w in werte:
+            b = self.eimer(w)
+            self.mitglieder.setdefault(b, array("l")).append(nr)
+            nr += 1
+        self.masken.clear()
+
+    def _eimer_maske(self, b: int) -> int:
+        m = self.masken.get(b)
+        if m is None:
+            m = bytearray(len(self.werte))
+            for nr in self.mitglieder.get(b, ()):
+                m[nr] = 1
+            self.masken[b] = m
+        return int.from_bytes(m, "little")
+
+    def bereich(self, lo: float, hi: float) -> int:
+        b_lo = self.eimer(lo) if lo != float("-inf") else min(self.mitglieder, default=0)
+        b_hi = self.eimer(hi) if hi != float("inf") else max(self.mitglieder, default=0)
+        ergebnis = 0
+        rand = bytearray(len(self.werte))
+        for b in self.mitglieder:
+            if b_lo < b < b_hi:
+                ergebnis |= self._eimer_maske(b)
+            elif b == b_lo or b == b_hi:
+                for nr in self.mitglieder[b]:
+                    if lo <= self.werte[nr] <= hi:
+                        rand[nr] = 1
+        return ergebnis | int.from_bytes(rand, "little")
+
+
+class FilterIndex:
+    """
+    Vorberechnete Indizes je Merkmal über all_items (nur Anhängen, nr = Position):
+    Endung als Code-Byte je Medium (Art und Endung per bytes.translate), Ordner als
+    Mitgliederlisten, Namen als ein durchsuchbarer Text, Auswahl als Maske.
+    Größe/Datum kommen aus werte_quelle (Metadaten-Index) oder notfalls per os.stat
+    und werden erst beim ersten Gebrauch aufgebaut.
+    """
+
+    REST = 255  # Endungen jenseits von 254 verschiedenen teilen sich diesen Code
+
+    def __init__(self):
+        # optional: () -> (groessen, daten) je nr oder None, solange unvollständig
+        self.werte_quelle: Optional[Callable[[], Optional[tuple]]] = None
+        # optional: Trigramme der Suche (gleiche Nummern); vollständig grenzt er name:/regex: ein
+        self.trigramme: Optional["TrigrammIndex"] = None
+        self.leeren()
+
+    def leeren(self) -> None:
+        self.items: List[MediaItem] = []
+        self.endungen = bytearray()
+        self._endung_code: Dict[str, int] = {}
+        self._endung_rest: Dict[str, array] = {}
+        self._ordner: Dict[str, array] = {}
+        self._ordner_key: Dict[str, str] = {}
+        self.ausgewaehlt = bytearray()
+        self.duplikat = bytearray()  # 1 = fast gleich wie ein früheres Bild (Duplikatsuche)
+        self.defekt = bytearray()    # 1 = Video laut Prüfung nicht abspielbar
+        self._namen_text = ""
+        self._namen_start = array("l")
+        self._re_i_vorkommen: set = set()  # Sonderzeichen für re.I in den Namen (siehe _RE_I_GRUPPEN)
+        self._regex: Dict[tuple, Tuple[int, bytearray]] = {}
+        self._groesse: Optional[_BereichsIndex] = None
+        self._datum: Optional[_BereichsIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def haenge_an(self, items: List[MediaItem]) -> None:
+        nr = len(self.items)
+        self.items.extend(items)
+        codes = bytearray()
+        namen = []
+        pos = len(self._namen_text)
+        letzter_ordner, mitglieder = None, None
+        for m in items:
+            ordner, _, name = m.path.rpartition(os.sep)
+            name = name.lower().replace("\n", " ")
+            namen.append(name)
+            self._namen_start.append(pos)
+            pos += len(name) + 1
+            i = name.rfind(".")
+            ext = name[i:] if i > 0 else ""
+            code = self._endung_code.get(ext)
+            if code is None:
+                code = len(self._endung_code) + 1 if len(self._endung_code) < self.REST - 1 else self.REST
+                if code != self.REST:
+                    self._endung_code[ext] = code
+            if code == self.REST:
+                self._endung_rest.setdefault(ext, array("l")).append(nr)
+            codes.append(code)
+            if ordner != letzter_ordner:
+                key = self._ordner_key.get(ordner)
+                if key is None:
+                    key = self._ordner_key[ordner] = os.path.normcase(os.path.abspath(ordner or os.sep))
+                letzter_ordner, mitglieder = ordner, self._ordner.setdefault(key, array("l"))
+            mitglieder.append(nr)
+            nr += 1
+        self.endungen.extend(codes)
+        # alle Namen als ein Text mit "\n" getrennt: eine Regex-Suche über alles statt n Einzelsuchen
+        if namen:
+            neu = "\n".join(namen) + "\n"
+            self._namen_text += neu
+            self._re_i_vorkommen.update(_RE_I_ZEICHEN.intersection(neu))
+        self.ausgewaehlt.extend(bytes(len(items)))
+        self.duplikat.extend(bytes(len(items)))
+        self.defekt.extend(bytes(len(items)))
+        for index, wert in ((self._groesse, self._stat_groesse), (self._datum, self._stat_datum)):
+            if index is not None:
+                index.haenge_an([wert(m.path) for m in items])
+
+    def verwerfe_werte(self) -> None:
+        """Größe/Datum beim nächsten Gebrauch neu aufbauen (z. B. aus werte_quelle)."""
+        self._groesse = None
+        self._datum = None
+
+    def _werte(self, spalte: int, stat: Callable[[str], float]) -> List[float]:
+        quelle = self.werte_quelle() if self.werte_quelle is not None else None
+        if quelle is not None:
+            return list(quelle[spalte])
+        return [stat(m.path) for m in self.items]
+
+    def setze_ausgewaehlt(self, nr: int, an: bool) -> None:
+        if 0 <= nr < len(self.ausgewaehlt):
+            self.ausgewaehlt[nr] = 1 if an else 0
+
+    # -- Masken ---------------------------------------------------------------
+
+    def maske(self, ausdruck) -> bytearray:
+        n = len(self.items)
+        if ausdruck is None:
+            return bytearray(b"\x01" * n)
+        if ausdruck[0] in ("und", "oder", "nicht"):
+            return bytearray(self._bits(ausdruck).to_bytes(n, "little"))
+        return bytearray(self._maske(ausdruck))
+
+    def _bits(self, k) -> int:
+        art = k[0]
+        if art == "und":
+            ergebnis = self._bits(k[1])
+            for sub in k[2:]:
+                ergebnis &= self._bits(sub)
+            return ergebnis
+        if art == "oder":
+            ergebnis = 0
+            for sub in k[1:]:
+                ergebnis |= self._bits(sub)
+            return ergebnis
+        if art == "nicht":
+            return self._bits(k[1]) ^ int.from_bytes(b"\x01" * len(self.items), "little")
+        return int.from_bytes(self._maske(k), "little")
+
+    def _maske(self, k) -> bytes:
+        art = k[0]
+        if art == "art":
+            exts = IMAGE_EXTS if k[1] == "bild" else VIDEO_EXTS
+            return self._endung_maske(exts)
+        if art == "endung":
+            return self._endung_maske({k[1]})
+        if art == "ausgewaehlt":
+            return self.ausgewaehlt
+        if art == "duplikat":
+            return self.duplikat
+        if art == "defekt":
+            return self.defekt
+        if art == "ordner":
+            return self._mitglieder_maske(self._ordner.get(k[1], ()))
+        if art in ("name", "regex"):
+            return self._namens_maske(k)
+        if art == "groesse":
+            if self._groesse is None:
+                self._groesse = _BereichsIndex(self._groesse_eimer)
+                self._groesse.haenge_an(self._werte(0, self._stat_groesse))
+            return self._groesse.bereich(k[1], k[2]).to_bytes(len(self.items), "little")
+        if art == "datum":
+            if self._datum is None:
+                self._datum = _BereichsIndex(self._datum_eimer)
+                self._datum.haenge_an(self._werte(1, self._stat_datum))
+            return self._datum.bereich(k[1], k[2]).to_bytes(len(self.items), "little")
+        raise FilterFehler(f"Unbekanntes Kriterium: {art}")
+
+    def _endung_maske(self, exts) -> bytes:
+        tabelle = bytearray(256)
+        for ext in exts:
+            code = self._endung_code.get(ext)
+            if code is not None:
+                tabelle[code] = 1
+        maske = self.endungen.translate(tabelle)
+        rest = [self._endung_rest[e] for e in exts if e in self._endung_rest]
+        if rest:
+            maske = bytearray(maske)
+            for nrs in rest:
+                for nr in nrs:
+                    maske[nr] = 1
+        return maske
+
+    def _mitglieder_maske(self, nrs) -> bytearray:
+        maske = bytearray(len(self.items))
+        for nr in nrs:
+            maske[nr] = 1
+        return maske
+
+    def _namens_maske(self, k) -> bytearray:
+        """name:/regex: -> Maske; bleibt gespeichert, bis Medien dazukommen."""
+        n, maske = self._regex.get(k, (0, None))
+        if maske is not None and n == len(self.items):
+            return maske
+        art, muster = k
+        endung = _glob_endung(muster) if art == "name" else None
+        if endung is not None:
+            # Medien haben immer eine Endung, "*.jpg" ist also genau endung:.jpg
+            maske = bytearray(self._endung_maske({endung}))
+        elif art == "name":
+            maske = self._regex_maske(_glob_regex(muster), [t for t in re.split(r"[*?]", muster) if t])
+        else:
+            maske = self._regex_maske(muster, _pflicht_teile(muster))
+        if sys.flags.dev_mode:  # python -X dev: jeden schnellen Weg gegen die Einzelsuche prüfen
+            rx = re.compile(_glob_regex(muster) if art == "name" else muster, re.M | re.I)
+            assert maske == self._regex_je_name(rx), f"Namensfilter weicht ab: {k!r}"
+        self._regex[k] = (len(self.items), maske)
+        return maske
+
+    def _re_i_noetig(self, text: str) -> bool:
+        """Braucht text (klein geschrieben) re.I, weil ein Partner seiner Zeichen in den Namen vorkommt?"""
+        vorkommen = self._re_i_vorkommen
+        return bool(vorkommen) and any(p in vorkommen for c in set(text) for p in _RE_I_PARTNER.get(c, ""))
+
+    def _regex_maske(self, muster: str, teile: List[str]) -> bytearray:
+        # Namen sind klein geschrieben: ohne re.I kann re nach dem Literal-Anfang springen statt
+        # jedes Zeichen zu vergleichen
+        klein = _regex_klein(muster)
+        if klein is not None and not self._re_i_noetig(klein):
+            rx = re.compile(klein, re.M)
+        else:
+            rx = re.compile(muster, re.M | re.I)
+        je_name = _REGEX_SIEHT_ZEILENENDE.search(muster) is not None
+        kandidaten = self._kandidaten([t for t in teile if not self._re_i_noetig(t)])
+        if kandidaten is not None:
+            return self._regex_kandidaten(rx, kandidaten, je_name)
+        if je_name:
+            return self._regex_je_name(rx)
+        return self._regex_ueber_text(rx)
+
+    def _kandidaten(self, teile: List[str]) -> Optional[array]:
+        """
+        Nummern, deren Pfad alle Teile enthalten könnte: die kürzeste Trefferliste unter den
+        Trigrammen der Teile. None, wenn der Trigramm-Index fehlt, unvollständig ist oder
+        kaum eingrenzt (dann ist ein Lauf über den ganzen Namenstext schneller).
+        """
+        tri = self.trigramme
+        if tri is None or tri.n != len(self.items):
+            return None
+        kleinste = None
+        for teil in teile:
+            if " " in teil:  # "\n" im Namen steht im Namenstext als Leerzeichen, im Pfad nicht
+                continue
+            for g in {teil[i:i + 3] for i in range(len(teil) - 2)}:
+                p = tri.postings.get(g, array("l"))
+                if kleinste is None or len(p) < len(kleinste):
+                    kleinste = p
+        if kleinste is None or len(kleinste) * 16 > len(self.items):
+            return None
+        return kleinste
+
+    def _regex_kandidaten(self, rx, kandidaten, je_name: bool) -> bytearray:
+        maske = bytearray(len(self.items))
+        starts = self._namen_start
+        text = self._namen_text
+        letzte = len(starts) - 1
+        for nr in kandidaten:
+            a = starts[nr]
+            e = starts[nr + 1] - 1 if nr < letzte else len(text) - 1
+            if (rx.search(text[a:e]) if je_name else rx.search(text, a, e)) is not None:
+                maske[nr] = 1
+        return maske
+
+    def _regex_je_name(self, rx) -> bytearray:
+        return bytearray(rx.search(name) is not None for name in self._namen_text.split("\n")[:-1])
+
+    def _regex_ueber_text(self, rx) -> bytearray:
+        # Muster ohne Blick übers Zeilenende (siehe _REGEX_SIEHT_ZEILENENDE) treffen nie über
+        # eine Namensgrenze hinweg: jeder Treffer zählt für den Namen, in dem er beginnt
+        maske = bytearray(len(self.items))
+        starts = self._namen_start
+        text = self._namen_text
+        if rx.search("") is None:
+            pos = [t.start() for t in rx.finditer(text)]
+            # Name eines Treffers = Zeilenumbrüche davor, je Abstand in C gezählt (schneller als bisect)
+            for z in accumulate(map(text.count, repeat("\n"), chain((0,), pos), pos)):
+                maske[z] = 1
+            return maske
+        # kann leer treffen (x*, $ …): je Name nur den ersten Treffer, sonst träfe es jede Stelle
+        pos = 0
+        while True:
+            treffer = rx.search(text, pos)
+            if treffer is None:
+                break
+            zeile = bisect.bisect_right(starts, treffer.start()) - 1
+            maske[zeile] = 1
+            if zeile + 1 >= len(starts):
+                break
+            pos = starts[zeile + 1]
+        return maske
+
+    @staticmethod
+    def _groesse_eimer(w: float) -> int:
+        return int(w).bit_length() if 0 < w < INF else 0
+
+    @staticmethod
+    def _datum_eimer(w: float) -> int:
+        return int(w) // (7 * 86400) if w == w and abs(w) < INF else 0
+
+    @staticmethod
+    def _stat_groesse(path: str) -> float:
+        try:
+            return float(os.stat(path).st_size)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _stat_datum(path: str) -> float:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0.0
+
+
+# Muster, die "\n" treffen oder über den Namen hinaus sehen könnten (\s, [^…], \A/\Z, (?s), Steuerzeichen …):
+# für die sucht der Filter jeden Namen einzeln statt im gemeinsamen Text
+_REGEX_SIEHT_ZEILENENDE = re.compile(r"\\[sSWDAZntrfvx0-9uUN]|\[\^|\(\?[a-zA-Z]*s|[\x00-\x1f]")
+
+# Zeichen, die re.IGNORECASE über str.lower() hinaus gleichsetzt (ı~i, ſ~s, ς~σ …, wie im re-Modul):
+# nur wenn ein Partner davon in den Namen vorkommt, muss ein klein geschriebenes Muster mit re.I laufen
+_RE_I_GRUPPEN = (
+    "i\u0131 s\u017f \xb5\u03bc \u03c2\u03c3 \u03b2\u03d0 \u03b8\u03d1 \u03c6\u03d5 \u03c0\u03d6 \u03ba\u03f0 "
+    "\u03c1\u03f1 \u03b5\u03f5 \u0432\u1c80 \u0434\u1c81 \u043e\u1c82 \u0441\u1c83 \u0442\u1c84\u1c85 \u044a\u1c86 "
+    "\u0463\u1c87 \u1e61\u1e9b \u0345\u03b9\u1fbe \u0390\u1fd3 \u03b0\u1fe3 \u1c88\ua64b \ufb05\ufb06"
+)
+_RE_I_PARTNER = {c: g.replace(c, "") for g in _RE_I_GRUPPEN.split() for c in g}
+_RE_I_ZEICHEN = frozenset(_RE_I_PARTNER)
+
+
+def filter_ausdruck(scope: str, *zusaetze):
+    teile = [k for k in (FILTER_SCOPE.get(scope),) + zusaetze if k is not None]
+    if not teile:
+        return None
+    return teile[0] if len(teile) == 1 else ("und",) + tuple(teile)
+
+
+# ---- Suche (Trigramm-Index) -------------------------------------------------
+
+class TrigrammIndex:
+    """
+    Trigramme über Dateiname + relativen Pfad (klein geschrieben) -> nr-Listen.
+    Wird stückweise nachgezogen (aufholen), auch wenn Medien angehängt werden.
+    Eine Suche prüft nur die kürzeste Trefferliste ihrer Trigramme; wird die
+    Eingabe nur verlängert, werden nur die bisherigen Treffer erneut geprüft.
+    """
+
+    def __init__(self):
+        self.leeren()
+
+    def leeren(self, basis: Optional[str] = None) -> None:
+        self.basis = (basis.rstrip(os.sep) + os.sep).lower() if basis else None
+        self.texte: List[str] = []
+        self.postings: Dict[str, array] = {}
+        self._letzte: Optional[Tuple[str, int, List[int]]] = None  # (anfrage, n, treffer)
+
+    @property
+    def n(self) -> int:
+        return len(self.texte)
+
+    def _text(self, item: MediaItem) -> str:
+        text = item.path.lower()
+        if self.basis and text.startswith(self.basis):
+            text = text[len(self.basis):]
+        return text
+
+    def aufholen(self, items: List[MediaItem], max_anzahl: int) -> bool:
+        """Bis zu max_anzahl weitere Medien indizieren; True = vollständig."""
+        postings = self.postings
+        ende = min(len(items), self.n + max_anzahl)
+        for nr in range(self.n, ende):
+            text = self._text(items[nr])
+            self.texte.append(text)
+            for g in {text[i:i + 3] for i in range(len(text) - 2)}:
+                p = postings.get(g)
+                if p is None:
+                    postings[g] = array("l", (nr,))
+                else:
+                    p.append(nr)
+        return ende == len(items)
+
+    def suche(self, anfrage: str, items: List[MediaItem], limit: int) -> Tuple[List[int], bool]:
+        """-> (nr-Liste in all_items-Reihenfolge, abgeschnitten?)"""
+        q = anfrage.lower()
+        if not q:
+            return [], False
+        letzte = self._letzte
+        if letzte is not None and letzte[0] in q and letzte[1] == len(items) and len(letzte[2]) < limit:
+            # nur verlängert/eingegrenzt: die alten Treffer reichen als Kandidaten
+            kandidaten = letzte[2]
+        elif len(q) >= 3:
+            kleinste = None
+            for g in {q[i:i + 3] for i in range(len(q) - 2)}:
+                p = self.postings.get(g)
+                if p is None:
+                    kleinste = ()
+                    break
+                if kleinste is None or len(p) < len(kleinste):
+                    kleinste = p
+            kandidaten = chain(kleinste, range(self.n, len(items)))
+        else:
+            kandidaten = range(len(items))  # 1-2 Zeichen: Abbruch nach limit Treffern
+
+        treffer = []
+        texte = self.texte
+        for nr in kandidaten:
+            text = texte[nr] if nr < len(texte) else self._text(items[nr])
+            if q in text:
+                treffer.append(nr)
+                if len(treffer) >= limit:
+                    self._letzte = None
+                    return treffer, True
+        self._letzte = (q, len(items), treffer)
+        return treffer, False
+
+
+# ---- Metadaten-Index (Sortierschlüssel, EXIF, SQLite-Cache) -----------------
+
+SORTIERUNGEN = ["Ladefolge", "Name (natürlich)", "Aufnahmedatum", "Änderungsdatum", "Größe"]
+CLI_SORTIERUNG = {
+    "ladefolge": "Ladefolge",
+    "name": "Name (natürlich)",
+    "aufnahme": "Aufnahmedatum",
+    "geaendert": "Änderungsdatum",
+    "groesse": "Größe",
+}
+
+EXIF_KOPF = 128 * 1024  # APP1 (EXIF) ist höchstens 64 KiB groß und steht am Dateianfang
+NAN = float("nan")
+INF = float("inf")
+_ZIFFERN = re.compile(r"\d+")
+
+
+def natuerlicher_schluessel(name: str) -> str:
+    """IMG_2 < IMG_10: Zahlen als (Länge, Ziffern) kodiert, ein kompakter str je Medium."""
+    def zahl(m):
+        d = m.group().lstrip("0") or "0"
+        return chr(1 + min(len(d), 30)) + d
+    return _ZIFFERN.sub(zahl, name.lower())
+
+
+def cache_ordner() -> str:
+    basis = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(basis, "myslide")
+
+
+def index_pfad() -> str:
+    return os.path.join(cache_ordner(), "index.sqlite")
+
+
+class Exif:
+    """Minimaler EXIF/TIFF-Leser, arbeitet nur auf den Kopfbytes einer Datei."""
+
+    def __init__(self, tiff: bytes):
+        self.tiff = tiff
+        self.e = "<" if tiff[:2] == b"II" else ">"
+
+    @classmethod
+    def aus_kopf(cls, daten: bytes) -> Optional["Exif"]:
+        if daten[:4] in (b"II*\x00", b"MM\x00*"):
+            return cls(daten)
+        if daten[:2] != b"\xff\xd8":
+            return None
+        pos = 2
+        while pos + 4 <= len(daten):
+            if daten[pos] != 0xFF:
+                return None
+            marker = daten[pos + 1]
+            if marker in (0xD9, 0xDA):  # Ende / Bilddaten: kein EXIF mehr zu erwarten
+                return None
+            laenge = int.from_bytes(daten[pos + 2:pos + 4], "big")
+            if marker == 0xE1 and daten[pos + 4:pos + 10] == b"Exif\x00\x00":
+                return cls(daten[pos + 10:pos + 2 + laenge])
+            pos += 2 + laenge
+        return None
+
+    def _u(self, fmt: str, off: int) -> int:
+        return struct.unpack_from(self.e + fmt, self.tiff, off)[0]
+
+    def ifd0(self) -> int:
+        return self._u("I", 4)
+
+    def ifd(self, off: int) -> Dict[int, Tuple[int, int, int]]:
+        """tag -> (typ, anzahl, wert bzw. offset des Werts)"""
+        tags: Dict[int, Tuple[int, int, int]] = {}
+        if not 0 < off <= len(self.tiff) - 2:
+            return tags
+        for i in range(min(self._u("H", off), 512)):
+            p = off + 2 + i * 12
+            if p + 12 > len(self.tiff):
+                break
+            tags[self._u("H", p)] = (self._u("H", p + 2), self._u("I", p + 4), self._u("I", p + 8))
+        return tags
+
+    def naechstes_ifd(self, off: int) -> int:
+        try:
+            return self._u("I", off + 2 + self._u("H", off) * 12)
+        except struct.error:
+            return 0
+
+    def text(self, eintrag: Tuple[int, int, int]) -> str:
+        typ, anzahl, wert = eintrag
+        if typ != 2:
+            return ""
+        if anzahl <= 4:
+            roh = struct.pack(self.e + "I", wert)[:anzahl]
+        else:
+            roh = self.tiff[wert:wert + anzahl]
+        return roh.split(b"\x00", 1)[0].decode("ascii", "replace")
+
+    def vorschauen(self) -> List[Tuple[int, int]]:
+        """(offset, länge) eingebetteter JPEG-Vorschaubilder: IFD1-Thumbnail, IFD0 und SubIFDs (TIFF/DNG)."""
+        ifd0_off = self.ifd0()
+        ifds = [ifd0_off, self.naechstes_ifd(ifd0_off)]
+        ifd0 = self.ifd(ifd0_off)
+        if 0x014A in ifd0:
+            _, anzahl, wert = ifd0[0x014A]
+            if anzahl == 1:
+                ifds.append(wert)
+            else:
+                ifds.extend(self._u("I", wert + 4 * i) for i in range(min(anzahl, 8))
+                            if wert + 4 * i + 4 <= len(self.tiff))
+        bereiche = []
+        for off in ifds:
+            tags = self.ifd(off)
+            if 0x0201 in tags and 0x0202 in tags and tags[0x0202][2] > 0:
+                bereiche.append((tags[0x0201][2], tags[0x0202][2]))
+        return bereiche
+
+    def aufnahmedatum(self) -> Optional[float]:
+        """DateTimeOriginal (sonst DateTimeDigitized/DateTime) als Unix-Zeit (lokale Zeit)."""
+        ifd0 = self.ifd(self.ifd0())
+        kandidaten = []
+        if 0x8769 in ifd0:
+            exif = self.ifd(ifd0[0x8769][2])
+            kandidaten += [exif.get(0x9003), exif.get(0x9004)]
+        kandidaten.append(ifd0.get(0x0132))
+        for eintrag in kandidaten:
+            if eintrag is None:
+                continue
+            try:
+                return time.mktime(time.strptime(self.text(eintrag).strip(), "%Y:%m:%d %H:%M:%S"))
+            except (ValueError, OverflowError):
+                continue
+        return None
+
+
+def exif_aufnahmedatum(path: str) -> Optional[float]:
+    try:
+        with open(path, "rb") as f:
+            kopf = f.read(EXIF_KOPF)
+        exif = Exif.aus_kopf(kopf)
+        return exif.aufnahmedatum() if exif is not None else None
+    except (OSError, struct.error):
+        return None
+
+
+EXIF_VORSCHAU_MAX = 512 * 1024  # größere eingebettete Vorschauen lohnen sich nicht mehr
+
+
+def exif_vorschau(path: str) -> Optional[QImage]:
+    """Eingebettetes Vorschaubild (EXIF-Thumbnail, TIFF-Preview); liest nur Kopf und Vorschau."""
+    if archiv_teile(path) is not None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            kopf = f.read(EXIF_KOPF)
+            exif = Exif.aus_kopf(kopf)
+            if exif is None:
+                return None
+            bereiche = [b for b in exif.vorschauen() if b[1] <= EXIF_VORSCHAU_MAX]
+            if not bereiche:
+                return None
+            off, laenge = max(bereiche, key=lambda b: b[1])
+            if off + laenge <= len(exif.tiff):
+                daten = exif.tiff[off:off + laenge]
+            elif exif.tiff is kopf:  # TIFF-Datei: Offsets zählen ab Dateianfang
+                f.seek(off)
+                daten = f.read(laenge)
+            else:
+                return None
+    except (OSError, struct.error):
+        return None
+    img = QImage.fromData(daten, "JPEG")
+    return None if img.isNull() else img
+
+
+class MetadatenScanner(QObject):
+    """
+    Ein Hintergrund-Thread berechnet Sortierschlüssel (natürlicher Name, mtime, Größe,
+    EXIF-Aufnahmedatum) auftragsweise; Dateizugriffe laufen parallel in einem Pool.
+    Ergebnisse werden im SQLite-Index gecacht (gültig solange mtime und Größe passen).
+    """
+    teil_fertig = Signal(object)  # (scan_id, start_nr, [(natur, mtime, groesse, aufnahme), ...])
+
+    TEILGROESSE = 2000
+    SQL_PARAMS = 500
+
+    def __init__(self, db_pfad: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.db_pfad = db_pfad or index_pfad()
+        self.scan_id = 0
+        self._auftraege: "queue.Queue" = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="meta-io")
+        self._thread = threading.Thread(target=self._run, name="metadaten", daemon=True)
+        self._thread.start()
+
+    def auftrag(self, start_nr: int, pfade: List[str]) -> None:
+        if pfade:
+            self._auftraege.put((self.scan_id, start_nr, pfade))
+
+    def abbrechen(self) -> None:
+        """Alle laufenden/wartenden Aufträge verwerfen (neuer Ordner)."""
+        self.scan_id += 1
+
+    def _verbinde(self):
+        try:
+            os.makedirs(os.path.dirname(self.db_pfad), exist_ok=True)
+            db = sqlite3.connect(self.db_pfad)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                " pfad TEXT PRIMARY KEY, mtime_ns INTEGER, groesse INTEGER, aufnahme REAL)"
+            )
+            return db
+        except sqlite3.Error as e:
+            print(f"MySlide: Index nicht verfügbar ({self.db_pfad}): {e}", file=sys.stderr)
+            return None
+
+    def _run(self) -> None:
+        db = self._verbinde()
+        while True:
+            scan_id, start_nr, pfade = self._auftraege.get()
+            for i in range(0, len(pfade), self.TEILGROESSE):
+                if scan_id != self.scan_id:
+                    break
+                werte = self._berechne(db, pfade[i:i + self.TEILGROESSE])
+                self.teil_fertig.emit((scan_id, start_nr + i, werte))
+
+    @staticmethod
+    def _stat(path: str):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _berechne(self, db, pfade: List[str]) -> list:
+        stats = list(self._pool.map(self._stat, pfade))
+
+        cache: Dict[str, tuple] = {}
+        if db is not None:
+            try:
+                for j in range(0, len(pfade), self.SQL_PARAMS):
+                    teil = pfade[j:j + self.SQL_PARAMS]
+                    zeilen = db.execute(
+                        f"SELECT pfad, mtime_ns, groesse, aufnahme FROM meta WHERE pfad IN ({','.join('?' * len(teil))})",
+                        teil,
+                    )
+                    for pfad, mtime_ns, groesse, aufnahme in zeilen:
+                        cache[pfad] = (mtime_ns, groesse, aufnahme)
+            except sqlite3.Error:
+                cache = {}
+
+        fehlend = []
+        aufnahmen: Dict[str, Optional[float]] = {}
+        for path, st in zip(pfade, stats):
+            if st is None:
+                continue
+            c = cache.get(path)
+            if c is not None and c[0] == st.st_mtime_ns and c[1] == st.st_size:
+                aufnahmen[path] = c[2]
+            elif is_image(path):
+                fehlend.append(path)
+            else:
+                aufnahmen[path] = None
+        for path, aufnahme in zip(fehlend, self._pool.map(exif_aufnahmedatum, fehlend)):
+            aufnahmen[path] = aufnahme
+
+        neu = []
+        for path, st in zip(pfade, stats):
+            if st is None:
+                continue
+            c = cache.get(path)
+            if c is None or c[:2] != (st.st_mtime_ns, st.st_size):
+                neu.append((path, st.st_mtime_ns, st.st_size, aufnahmen.get(path)))
+        if db is not None and neu:
+            try:
+                db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?)", neu)
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+        werte = []
+        for path, st in zip(pfade, stats):
+            natur = natuerlicher_schluessel(os.path.basename(path))
+            if st is None:
+                werte.append((natur, NAN, NAN, NAN))
+            else:
+                a = aufnahmen.get(path)
+                werte.append((natur, st.st_mtime, float(st.st_size), NAN if a is None else a))
+        return werte
+
+
+class MetadatenIndex:
+    """Sortierschlüssel je nr (GUI-Thread); NaN = unbekannt."""
+
+    def __init__(self):
+        self.leeren()
+
+    def leeren(self) -> None:
+        self.natur: List[str] = []
+        self.mtime = array("d")
+        self.groesse = array("d")
+        self.aufnahme = array("d")
+        self.offen = 0
+
+    def erweitere(self, n: int) -> None:
+        self.natur.extend([""] * n)
+        nans = array("d", [NAN]) * n
+        self.mtime.extend(nans)
+        self.groesse.extend(nans)
+        self.aufnahme.extend(nans)
+        self.offen += n
+
+    def setze(self, start: int, werte: list) -> None:
+        for nr, (natur, mtime, groesse, aufnahme) in enumerate(werte, start):
+            self.natur[nr] = natur
+            self.mtime[nr] = mtime
+            self.groesse[nr] = groesse
+            self.aufnahme[nr] = aufnahme
+        self.offen -= len(werte)
+
+    @property
+    def fertig(self) -> bool:
+        return self.offen <= 0
+
+    def datum(self) -> List[float]:
+        # Aufnahmedatum, ersatzweise Änderungsdatum (Videos, Bilder ohne EXIF)
+        return [a if a == a else m for a, m in zip(self.aufnahme, self.mtime)]
+
+    def schluessel(self, sortierung: str):
+        if sortierung == "Name (natürlich)":
+            return self.natur
+        werte = {"Aufnahmedatum": self.datum, "Änderungsdatum": lambda: self.mtime, "Größe": lambda: self.groesse}.get(sortierung)
+        if werte is None:
+            return None
+        # fehlende Dateien ans Ende
+        return [v if v == v else INF for v in werte()]
+
+
+# ---- Video-Prüfung (Dauer, Auflösung, Codec) --------------------------------
+
+@dataclass
+class VideoInfo:
+    dauer_ms: Optional[int] = None  # None = unbekannt
+    breite: int = 0
+    hoehe: int = 0
+    codec: str = ""
+    audio: bool = False
+    fehler: str = ""  # nicht leer: nicht abspielbar, wird aus der Playlist genommen
+
+    def text(self) -> str:
+        if self.fehler:
+            return f"nicht abspielbar: {self.fehler}"
+        teile = []
+        if self.breite and self.hoehe:
+            teile.append(f"{self.breite}×{self.hoehe}")
+        if self.dauer_ms is not None:
+            teile.append(format_dauer(self.dauer_ms / 1000.0))
+        if self.dauer_ms is not None and not self.audio:
+            teile.append("ohne Ton")
+        return " · ".join(teile)
+
+
+def format_dauer(sekunden: float) -> str:
+    s = int(round(sekunden))
+    h, m = divmod(s // 60, 60)
+    return f"{h}:{m:02d}:{s % 60:02d}" if h else f"{m}:{s % 60:02d}"
+
+
+MP4_MOOV_MAX = 64 * 1024 * 1024
+
+
+def _mp4_boxen(daten: bytes, start: int = 0, ende: Optional[int] = None) -> Iterator[Tuple[bytes, int, int]]:
+    """(typ, anfang des inhalts, ende) der Boxen in daten[start:ende]."""
+    ende = len(daten) if ende is None else ende
+    pos = start
+    while pos + 8 <= ende:
+        groesse, typ = struct.unpack_from(">I4s", daten, pos)
+        kopf = 8
+        if groesse == 1:
+            groesse = struct.unpack_from(">Q", daten, pos + 8)[0]
+            kopf = 16
+        elif groesse == 0:
+            groesse = ende - pos
+        if groesse < kopf or pos + groesse > ende:
+            return
+        yield typ, pos + kopf, pos + groesse
+        pos += groesse
+
+
+def mp4_info(path: str) -> VideoInfo:
+    """Dauer/Auflösung/Codec aus dem moov-Atom einer MP4/MOV-Datei, ohne Dekodierung."""
+    moov = None
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        dateiende = f.tell()
+        pos = 0
+        while pos + 8 <= dateiende:
+            f.seek(pos)
+            kopf = f.read(16)
+            if len(kopf) < 8:
+                break
+            groesse, typ = struct.unpack_from(">I4s", kopf)
+            kopflaenge = 8
+            if groesse == 1 and len(kopf) == 16:
+                groesse = struct.unpack_from(">Q", kopf, 8)[0]
+                kopflaenge = 16
+            elif groesse == 0:
+                groesse = dateiende - pos
+            if groesse < kopflaenge:
+                break
+            if typ == b"moov":
+                if groesse > MP4_MOOV_MAX:
+                    return VideoInfo(fehler="moov zu groß")
+                f.seek(pos + kopflaenge)
+                moov = f.read(groesse - kopflaenge)
+                break
+            pos += groesse
+    if moov is None:
+        return VideoInfo(fehler="kein moov-Atom (beschädigt oder unvollständig)")
+
+    info = VideoInfo()
+    for typ, a, e in _mp4_boxen(moov):
+        if typ == b"mvhd":
+            if moov[a] == 1:
+                zeitbasis, dauer = struct.unpack_from(">IQ", moov, a + 20)
+            else:
+                zeitbasis, dauer = struct.unpack_from(">II", moov, a + 12)
+            if zeitbasis:
+                info.dauer_ms = dauer * 1000 // zeitbasis
+        elif typ == b"trak":
+            breite = hoehe = 0
+            handler = codec = b""
+            for t2, a2, e2 in _mp4_boxen(moov, a, e):
+                if t2 == b"tkhd":
+                    breite, hoehe = (v >> 16 for v in struct.unpack_from(">II", moov, e2 - 8))
+                elif t2 == b"mdia":
+                    for t3, a3, e3 in _mp4_boxen(moov, a2, e2):
+                        if t3 == b"hdlr":
+                            handler = moov[a3 + 8:a3 + 12]
+                        elif t3 == b"minf":
+                            for t4, a4, e4 in _mp4_boxen(moov, a3, e3):
+                                if t4 == b"stbl":
+                                    for t5, a5, e5 in _mp4_boxen(moov, a4, e4):
+                                        if t5 == b"stsd" and e5 - a5 >= 16:
+                                            codec = moov[a5 + 12:a5 + 16]
+            if handler == b"vide" and not info.codec:
+                info.breite, info.hoehe = breite, hoehe
+                info.codec = codec.decode("latin-1").strip()
+            elif handler == b"soun":
+                info.audio = True
+    if not info.codec:
+        info.fehler = "kein Videostream"
+    return info
+
+
+def ffprobe_info(ffprobe: str, path: str) -> VideoInfo:
+    try:
+        erg = subprocess.run(
+            [ffprobe, "-v", "error", "-print_format", "json",
+             "-show_entries", "format=duration:stream=codec_type,codec_name,width,height", path],
+            capture_output=True, timeout=30,
+        )
+    except subprocess.TimeoutExpired:
+        return VideoInfo(fehler="ffprobe: Zeitüberschreitung")
+    if erg.returncode != 0:
+        meldung = erg.stderr.decode("utf-8", "replace").strip().splitlines()
+        return VideoInfo(fehler=meldung[-1] if meldung else f"ffprobe Exit-Code {erg.returncode}")
+    daten = json.loads(erg.stdout or b"{}")
+    info = VideoInfo()
+    try:
+        info.dauer_ms = int(float(daten.get("format", {}).get("duration")) * 1000)
+    except (TypeError, ValueError):
+        pass
+    for s in daten.get("streams", []):
+        if s.get("codec_type") == "video" and not info.codec:
+            info.codec = s.get("codec_name", "")
+            info.breite, info.hoehe = int(s.get("width") or 0), int(s.get("height") or 0)
+        elif s.get("codec_type") == "audio":
+            info.audio = True
+    if not info.codec:
+        info.fehler = "kein Videostream"
+    return info
+
+
+def pruefe_video(path: str, ffprobe: Optional[str] = None) -> VideoInfo:
+    """Containerdaten eines Videos; mit ffprobe für alle Formate, sonst eingebaut für MP4/MOV."""
+    try:
+        if os.path.getsize(path) == 0:
+            return VideoInfo(fehler="leere Datei")
+        if ffprobe:
+            return ffprobe_info(ffprobe, path)
+        if os.path.splitext(path)[1].lower() in (".mp4", ".m4v", ".mov"):
+            return mp4_info(path)
+    except (OSError, struct.error, ValueError) as e:
+        return VideoInfo(fehler=str(e))
+    return VideoInfo()  # Format ohne eingebauten Leser: unbekannt, aber nicht defekt
+
+
+class VideoPruefer(QObject):
+    """
+    Prüft Videos im Hintergrund (mehrere ffprobe-Prozesse parallel, ohne ffprobe der
+    eingebaute MP4/MOV-Leser). Ergebnisse liegen im SQLite-Index (gültig solange mtime
+    und Größe passen), ein erneuter Start prüft nur neue/geänderte Dateien.
+    """
+    teil_fertig = Signal(object)  # (pruef_id, {nr: VideoInfo})
+
+    TEILGROESSE = 32
+
+    def __init__(self, db_pfad: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.db_pfad = db_pfad or index_pfad()
+        self.pruef_id = 0
+        self.ffprobe = shutil.which("ffprobe")
+        self._auftraege: "queue.Queue" = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pruefen")
+        self._thread = threading.Thread(target=self._run, name="videopruefung", daemon=True)
+        self._thread.start()
+
+    def auftrag(self, videos: List[Tuple[int, str]]) -> None:
+        if videos:
+            self._auftraege.put((self.pruef_id, videos))
+
+    def abbrechen(self) -> None:
+        self.pruef_id += 1
+
+    def _verbinde(self):
+        try:
+            os.makedirs(os.path.dirname(self.db_pfad), exist_ok=True)
+            db = sqlite3.connect(self.db_pfad)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS video ("
+                " pfad TEXT PRIMARY KEY, mtime_ns INTEGER, groesse INTEGER, dauer_ms INTEGER,"
+                " breite INTEGER, hoehe INTEGER, codec TEXT, audio INTEGER, fehler TEXT, ffprobe INTEGER)"
+            )
+            return db
+        except sqlite3.Error as e:
+            print(f"MySlide: Index nicht verfügbar ({self.db_pfad}): {e}", file=sys.stderr)
+            return None
+
+    def _run(self) -> None:
+        db = self._verbinde()
+        while True:
+            pruef_id, videos = self._auftraege.get()
+            for i in range(0, len(videos), self.TEILGROESSE):
+                if pruef_id != self.pruef_id:
+                    break
+                self.teil_fertig.emit((pruef_id, self._pruefe(db, videos[i:i + self.TEILGROESSE])))
+
+    def _pruefe(self, db, videos: List[Tuple[int, str]]) -> Dict[int, VideoInfo]:
+        stats = {}
+        for nr, path in videos:
+            try:
+                st = os.stat(path)
+                stats[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        cache = {}
+        if db is not None and stats:
+            try:
+                pfade = list(stats)
+                for zeile in db.execute(
+                    f"SELECT * FROM video WHERE pfad IN ({','.join('?' * len(pfade))})", pfade
+                ):
+                    cache[zeile[0]] = zeile
+            except sqlite3.Error:
+                cache = {}
+        ergebnis: Dict[int, VideoInfo] = {}
+        fehlend = []
+        for nr, path in videos:
+            if path not in stats:
+                ergebnis[nr] = VideoInfo(fehler="Datei fehlt")
+                continue
+            z = cache.get(path)
+            # ein Ergebnis des eingebauten Lesers gilt nicht mehr, sobald ffprobe da ist
+            if z is not None and (z[1], z[2]) == stats[path] and (z[9] or not self.ffprobe):
+                ergebnis[nr] = VideoInfo(z[3], z[4], z[5], z[6], bool(z[7]), z[8])
+            else:
+                fehlend.append((nr, path))
+        neu = []
+        for (nr, path), info in zip(fehlend, self._pool.map(lambda v: pruefe_video(v[1], self.ffprobe), fehlend)):
+            ergebnis[nr] = info
+            neu.append((path,) + stats[path] + (info.dauer_ms, info.breite, info.hoehe, info.codec,
+                                                int(info.audio), info.fehler, int(bool(self.ffprobe))))
+        if db is not None and neu:
+            try:
+                db.executemany("INSERT OR REPLACE INTO video VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", neu)
+                db.commit()
+            except sqlite3.Error:
+                pass
+        return ergebnis
+
+
+# ---- Lautheit (Lautstärke angleichen) ----------------------------------------
+
+ZIEL_LUFS = -16.0        # Zielpegel; -23 (EBU R128, Rundfunk) ist an Laptop-Lautsprechern zu leise
+MAX_ANHEBUNG_DB = 12.0   # leise Clips höchstens so weit anheben (Rauschen, Übersteuern)
+STILLE_LUFS = -60.0      # darunter praktisch stumm: nicht angleichen
+
+_LUFS_RE = re.compile(r"^\s*I:\s+(-?\d+(?:\.\d+)?) LUFS", re.M)
+
+
+def _niedrig_priorisiert(cmd: List[str]) -> List[str]:
+    """Befehl über nice starten, falls vorhanden (kein preexec_fn: unsicher in Prozessen mit Threads)."""
+    nice = shutil.which("nice")
+    return [nice, "-n", "10"] + cmd if nice else cmd
+
+
+def messe_lautheit(ffmpeg: str, path: str) -> Optional[float]:
+    """
+    Integrierte Lautheit der ersten Tonspur in LUFS (ebur128-Filter von ffmpeg, ITU-R BS.1770
+    mit Gating). Nur Ton wird dekodiert; None, wenn nicht messbar.
+    """
+    cmd = [ffmpeg, "-hide_banner", "-nostats", "-threads", "1", "-i", path,
+           "-map", "0:a:0", "-vn", "-sn", "-dn", "-af", "ebur128=framelog=quiet", "-f", "null", "-"]
+    try:
+        res = subprocess.run(
+            _niedrig_priorisiert(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=600,
+            creationflags=getattr(subprocess, "BELOW_NORMAL_PRIORITY_CLASS", 0),  # Windows: kein nice
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    werte = _LUFS_RE.findall(res.stderr.decode("utf-8", "replace"))
+    if res.returncode != 0 or not werte:
+        return None
+    return float(werte[-1])  # die letzte Angabe ist die Zusammenfassung
+
+
+def lautheit_faktor(lufs: Optional[float]) -> float:
+    """Lautstärke-Faktor, der einen Clip auf ZIEL_LUFS bringt (1.0 = unverändert)."""
+    if lufs is None or lufs < STILLE_LUFS:
+        return 1.0
+    return 10.0 ** (min(MAX_ANHEBUNG_DB, ZIEL_LUFS - lufs) / 20.0)
+
+
+class LautheitsAnalyse(QObject):
+    """
+    Misst die Lautheit von Videos mit Tonspur im Hintergrund (zwei ffmpeg-Prozesse mit
+    niedriger Priorität). Ergebnisse liegen im SQLite-Index wie bei der Videoprüfung;
+    ohne ffmpeg werden nur bereits gespeicherte Werte geliefert.
+    """
+    gemessen = Signal(object)  # (analyse_id, {pfad: lufs oder None})
+
+    def __init__(self, db_pfad: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.db_pfad = db_pfad or index_pfad()
+        self.analyse_id = 0
+        self.ffmpeg = shutil.which("ffmpeg")
+        self._auftraege: "queue.Queue" = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lautheit")
+        self._thread = threading.Thread(target=self._run, name="lautheit", daemon=True)
+        self._thread.start()
+
+    def auftrag(self, pfade: List[str]) -> None:
+        if pfade:
+            self._auftraege.put((self.analyse_id, pfade))
+
+    def abbrechen(self) -> None:
+        self.analyse_id += 1
+
+    def _verbinde(self):
+        try:
+            os.makedirs(os.path.dirname(self.db_pfad), exist_ok=True)
+            db = sqlite3.connect(self.db_pfad)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS lautheit ("
+                " pfad TEXT PRIMARY KEY, mtime_ns INTEGER, groesse INTEGER, lufs REAL)"
+            )
+            return db
+        except sqlite3.Error as e:
+            print(f"MySlide: Index nicht verfügbar ({self.db_pfad}): {e}", file=sys.stderr)
+            return None
+
+    def _run(self) -> None:
+        db = self._verbinde()
+        while True:
+            analyse_id, pfade = self._auftraege.get()
+            if analyse_id != self.analyse_id:
+                continue
+            stats = {}
+            for path in pfade:
+                try:
+                    st = os.stat(path)
+                    stats[path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    pass
+            bekannt: Dict[str, Optional[float]] = {}
+            if db is not None and stats:
+                try:
+                    liste = list(stats)
+                    for j in range(0, len(liste), 500):  # SQLite begrenzt die Zahl der Parameter
+                        teil = liste[j:j + 500]
+                        for p, mtime_ns, groesse, lufs in db.execute(
+                            f"SELECT * FROM lautheit WHERE pfad IN ({','.join('?' * len(teil))})", teil
+                        ):
+                            if (mtime_ns, groesse) == stats[p]:
+                                bekannt[p] = lufs
+                except sqlite3.Error:
+                    bekannt = {}
+            if bekannt:
+                self.gemessen.emit((analyse_id, bekannt))
+            fehlend = [p for p in stats if p not in bekannt] if self.ffmpeg else []
+            # einzeln melden: eine Messung dauert etwa so lange wie das Dekodieren des Tons
+            laufend = {self._pool.submit(messe_lautheit, self.ffmpeg, p): p for p in fehlend}
+            for fut in as_completed(laufend):
+                if analyse_id != self.analyse_id:
+                    for f in laufend:
+                        f.cancel()
+                    break
+                path = laufend[fut]
+                lufs = fut.result()
+                if db is not None:
+                    try:
+                        db.execute("INSERT OR REPLACE INTO lautheit VALUES (?, ?, ?, ?)", (path,) + stats[path] + (lufs,))
+                        db.commit()
+                    except sqlite3.Error:
+                        pass
+                self.gemessen.emit((analyse_id, {path: lufs}))
+
+
+# ---- Duplikate (Wahrnehmungs-Hash, BK-Baum) ---------------------------------
+
+DUPLIKAT_ABSTAND = 6  # max. abweichende Bits (von 64) für "fast gleich"
+
+
+def dhash_datei(path: str) -> Optional[int]:
+    """
+    64-Bit-dHash: Graustufen 9x8, je Zeile 8 Vergleiche benachbarter Pixel.
+    Läuft in Worker-Prozessen; QImageReader dekodiert JPEGs dabei gleich verkleinert.
+    """
+    if archiv_teile(path) is not None:
+        img = dekodiere_bild(path)
+    else:
+        reader = QImageReader(path)
+        groesse = reader.size()
+        if groesse.isValid() and groesse.width() > 64:
+            reader.setScaledSize(groesse.scaled(64, 64, Qt.KeepAspectRatioByExpanding))
+        img = reader.read()
+        if img.isNull():
+            img = dekodiere_bild(path)  # Format ohne Qt-Leser (HEIC, AVIF, …)
+    if img.isNull():
+        return None
+    img = img.convertToFormat(QImage.Format_Grayscale8).scaled(9, 8, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    bpl = img.bytesPerLine()
+    px = bytes(img.constBits())
+    h = 0
+    for y in range(8):
+        zeile = px[y * bpl:y * bpl + 9]
+        for x in range(8):
+            h = (h << 1) | (zeile[x] < zeile[x + 1])
+    return h
+
+
+def _dhash_paar(path: str) -> Tuple[str, Optional[int]]:
+    try:
+        return path, dhash_datei(path)
+    except Exception:
+        return path, None
+
+
+class BKBaum:
+    """BK-Baum über Hamming-Abstand: Suche im Radius r ohne alle Paare zu vergleichen."""
+
+    def __init__(self):
+        self.wurzel = None  # [hash, [nr...], {abstand: knoten}]
+
+    def einfuegen(self, h: int, nr: int) -> None:
+        if self.wurzel is None:
+            self.wurzel = [h, [nr], {}]
+            return
+        knoten = self.wurzel
+        while True:
+            d = (h ^ knoten[0]).bit_count()
+            if d == 0:
+                knoten[1].append(nr)
+                return
+            kind = knoten[2].get(d)
+            if kind is None:
+                knoten[2][d] = [h, [nr], {}]
+                return
+            knoten = kind
+
+    def suche(self, h: int, radius: int) -> List[int]:
+        treffer: List[int] = []
+        offen = [self.wurzel] if self.wurzel is not None else []
+        while offen:
+            knoten = offen.pop()
+            d = (h ^ knoten[0]).bit_count()
+            if d <= radius:
+                treffer.extend(knoten[1])
+            for k, kind in knoten[2].items():
+                if d - radius <= k <= d + radius:
+                    offen.append(kind)
+        return treffer
+
+
+def duplikat_gruppen(hashes: Dict[int, int], reihenfolge: List[int], radius: int) -> List[List[int]]:
+    """Gruppen fast gleicher Bilder (nr-Listen, erstes Element = behalten)."""
+    baum = BKBaum()
+    for nr in reihenfolge:
+        h = hashes.get(nr)
+        if h is not None:
+            baum.einfuegen(h, nr)
+    rang = {nr: i for i, nr in enumerate(reihenfolge)}
+    vergeben = set()
+    gruppen = []
+    for nr in reihenfolge:
+        h = hashes.get(nr)
+        if h is None or nr in vergeben:
+            continue
+        gruppe = sorted((n for n in baum.suche(h, radius) if n not in vergeben), key=rang.__getitem__)
+        if len(gruppe) > 1:
+            gruppen.append(gruppe)
+        vergeben.update(gruppe)
+    return gruppen
+
+
+class DuplikatSuche(QObject):
+    """Hashes im Hintergrund: Cache (SQLite-Index) zuerst, Rest im Prozess-Pool über alle Kerne."""
+    fortschritt = Signal(object)  # (such_id, fertig, gesamt)
+    fertig = Signal(object)       # (such_id, {nr: hash}, fehlertext)
+
+    def __init__(self, such_id: int, items: List[Tuple[int, str]], db_pfad: str, parent=None):
+        super().__init__(parent)
+        self.such_id = such_id
+        self.items = items
+        self.db_pfad = db_pfad
+        self._abbrechen = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="duplikate", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def abbrechen(self) -> None:
+        self._abbrechen.set()
+
+    def _run(self) -> None:
+        hashes: Dict[int, int] = {}
+        fehler = ""
+        try:
+            fehler = self._suche(hashes)
+        except Exception as e:  # unerwartet: trotzdem melden, sonst wartet die Oberfläche für immer
+            fehler = str(e)
+        finally:
+            self.fertig.emit((self.such_id, hashes, fehler))
+
+    def _suche(self, hashes: Dict[int, int]) -> str:
+        """Füllt hashes (nr -> dHash) und liefert einen Fehlertext ("" = alles geprüft)."""
+        try:
+            db = sqlite3.connect(self.db_pfad)
+            db.execute("CREATE TABLE IF NOT EXISTS dhash (pfad TEXT PRIMARY KEY, mtime_ns INTEGER, groesse INTEGER, hash INTEGER)")
+        except sqlite3.Error:
+            db = None
+
+        stats = {}
+        for nr, path in self.items:
+            try:
+                st = os.stat(path)
+                stats[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        nr_von = {path: nr for nr, path in self.items}
+
+        fehlend = []
+        cache = {}
+        if db is not None:
+            pfade = list(stats)
+            try:
+                for j in range(0, len(pfade), 500):
+                    teil = pfade[j:j + 500]
+                    for pfad, mtime_ns, groesse, h in db.execute(
+                        f"SELECT pfad, mtime_ns, groesse, hash FROM dhash WHERE pfad IN ({','.join('?' * len(teil))})",
+                        teil,
+                    ):
+                        cache[pfad] = (mtime_ns, groesse, h)
+            except sqlite3.Error as e:  # gesperrt/defekt: ohne Index weiter, alles neu berechnen
+                print(f"MySlide: Index nicht verfügbar ({self.db_pfad}): {e}", file=sys.stderr)
+                cache = {}
+                db = None
+        for path, st in stats.items():
+            c = cache.get(path)
+            if c is not None and c[:2] == st:
+                if c[2] is not None:
+                    hashes[nr_von[path]] = c[2] & M64  # SQLite speichert vorzeichenbehaftet
+            else:
+                fehlend.append(path)
+
+        gesamt = len(self.items)
+        self.fortschritt.emit((self.such_id, len(hashes), gesamt))
+        fehler = ""
+        neu = []
+        if fehlend:
+            try:
+                ctx = multiprocessing.get_context("spawn")  # kein fork aus einem Qt-Prozess mit Threads
+                with ProcessPoolExecutor(max_workers=os.cpu_count() or 2, mp_context=ctx) as pool:
+                    for i, (path, h) in enumerate(pool.map(_dhash_paar, fehlend, chunksize=32)):
+                        if self._abbrechen.is_set():
+                            pool.shutdown(cancel_futures=True)
+                            return "abgebrochen"
+                        if h is not None:
+                            hashes[nr_von[path]] = h
+                        neu.append((path,) + stats[path] + (None if h is None else h - (1 << 64) if h >= 1 << 63 else h,))
+                        if i % 200 == 0:
+                            self.fortschritt.emit((self.such_id, len(hashes), gesamt))
+            except Exception as e:  # z. B. Prozesse nicht startbar
+                fehler = str(e)
+        if db is not None and neu:
+            try:
+                db.executemany("INSERT OR REPLACE INTO dhash VALUES (?, ?, ?, ?)", neu)
+                db.commit()
+            except sqlite3.Error:
+                pass
+        return fehler
+
+
+# ---- Video-Export (ffmpeg) --------------------------------------------------
+
+EXPORT_AUFLOESUNGEN = {"1920×1080": (1920, 1080), "1280×720": (1280, 720), "3840×2160": (3840, 2160)}
+EXPORT_FPS = 25
+
+
+def export_bild(path: str, breite: int, hoehe: int, skalierung: str, dateiname: Optional[str]) -> QImage:
+    """Eine Folie offscreen zusammensetzen: schwarzer Rahmen, Bild skaliert und zentriert, optional Dateiname."""
+    rahmen = QImage(breite, hoehe, QImage.Format_RGB32)  # im Speicher BGRA, passt zu ffmpeg -pix_fmt bgra
+    rahmen.fill(Qt.black)
+    img = dekodiere_bild(path)
+    p = QPainter(rahmen)
+    if not img.isNull():
+        s = skaliere_bild(img, QSize(breite, hoehe), skalierung)
+        p.drawImage((breite - s.width()) // 2, (hoehe - s.height()) // 2, s)
+    if dateiname:
+        font = p.font()
+        font.setPixelSize(max(12, hoehe // 40))
+        p.setFont(font)
+        rand = font.pixelSize() // 2
+        box = p.fontMetrics().boundingRect(dateiname).adjusted(-rand, -rand // 2, rand, rand // 2)
+        box.moveTo(2 * rand, hoehe - box.height() - 2 * rand)
+        p.setPen(Qt.NoPen)
+        p.setBrush(QColor(0, 0, 0, 140))
+        p.drawRoundedRect(box, rand, rand)
+        p.setPen(Qt.white)
+        p.drawText(box, Qt.AlignCenter, dateiname)
+    p.end()
+    return rahmen
+
+
+class VideoExport(QObject):
+    """
+    Diashow als Video: Dekodieren + Zusammensetzen im Thread-Pool, Schreiben in einem
+    eigenen Thread, Kodieren im ffmpeg-Prozess (Rohbilder über eine Pipe). Zwischen den
+    Stufen liegen beschränkte Warteschlangen, der Speicherbedarf bleibt daher konstant.
+
+    Je Folie wird nur ein Rohbild übertragen (Eingangsrate 1/Intervall); ffmpeg wiederholt
+    es per fps-Filter auf die Ausgaberate, statt dieselben Pixel hundertfach zu pipen.
+    """
+    fortschritt = Signal(object)  # (fertig, gesamt)
+    fertig = Signal(object)       # (zielpfad, fehlertext) – leer = ok
+
+    PUFFER = 4  # Folien je Stufe im Voraus
+
+    def __init__(self, pfade: List[str], ziel: str, breite: int, hoehe: int, intervall_ms: int,
+                 skalierung: str, dateinamen: bool, parent=None):
+        super().__init__(parent)
+        self.pfade = pfade
+        self.ziel = ziel
+        self.breite, self.hoehe = breite, hoehe
+        self.intervall_ms = intervall_ms
+        self.skalierung = skalierung
+        self.dateinamen = dateinamen
+        self._abbrechen = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="export", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def abbrechen(self) -> None:
+        self._abbrechen.set()
+
+    def _befehl(self) -> List[str]:
+        return [
+            shutil.which("ffmpeg") or "ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgra", "-s", f"{self.breite}x{self.hoehe}",
+            "-framerate", f"1000/{self.intervall_ms}", "-i", "-",
+            "-vf", f"fps={EXPORT_FPS}", "-c:v", "libx264", "-preset", "veryfast", "-tune", "stillimage",
+            "-pix_fmt", "yuv420p", "-movflags", "+faststart", self.ziel,
+        ]
+
+    def _run(self) -> None:
+        try:
+            proc = subprocess.Popen(self._befehl(), stdin=subprocess.PIPE,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except OSError as e:
+            self.fertig.emit((self.ziel, f"ffmpeg nicht startbar: {e}"))
+            return
+
+        rahmen: "queue.Queue" = queue.Queue(maxsize=self.PUFFER)
+        schreibfehler: List[str] = []
+
+        def schreiben() -> None:
+            while True:
+                bild = rahmen.get()
+                if bild is None:
+                    return
+                if schreibfehler:
+                    continue  # nur noch leeren, damit der Erzeuger nicht hängt
+                try:
+                    proc.stdin.write(bild.constBits())
+                except OSError as e:  # ffmpeg beendet (BrokenPipe)
+                    schreibfehler.append(str(e))
+
+        schreiber = threading.Thread(target=schreiben, name="export-pipe", daemon=True)
+        schreiber.start()
+
+        gesamt = len(self.pfade)
+        # die letzte Folie doppelt, damit auch sie ihr volles Intervall bekommt
+        folge = self.pfade + self.pfade[-1:]
+        ok = False
+        fehler = ""
+        try:
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2), thread_name_prefix="export") as pool:
+                laufend: deque = deque()
+                try:
+                    naechster = iter(folge)
+                    for i in range(len(folge)):
+                        for path in naechster:
+                            laufend.append(pool.submit(
+                                export_bild, path, self.breite, self.hoehe, self.skalierung,
+                                os.path.basename(path) if self.dateinamen else None,
+                            ))
+                            if len(laufend) >= self.PUFFER:
+                                break
+                        rahmen.put(laufend.popleft().result())
+                        if self._abbrechen.is_set() or schreibfehler:
+                            break
+                        if i % 10 == 0 or i + 1 >= gesamt:
+                            self.fortschritt.emit((min(i + 1, gesamt), gesamt))
+                finally:
+                    for f in laufend:
+                        f.cancel()
+            ok = True
+        except Exception as e:  # z. B. eine Folie ließ sich nicht zusammensetzen
+            fehler = str(e) or type(e).__name__
+        finally:
+            if not ok or self._abbrechen.is_set():
+                proc.kill()  # zuerst: ein blockiertes Schreiben in die Pipe kehrt dann zurück
+            rahmen.put(None)
+            schreiber.join()
+
+        if not ok or self._abbrechen.is_set():
+            proc.wait()
+            try:
+                os.remove(self.ziel)
+            except OSError:
+                pass
+            self.fertig.emit((self.ziel, fehler or "abgebrochen"))
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        meldung = proc.stderr.read().decode("utf-8", "replace").strip()
+        rc = proc.wait()
+        fehler = ""
+        if rc != 0 or schreibfehler:
+            fehler = meldung or (schreibfehler[0] if schreibfehler else f"ffmpeg Exit-Code {rc}")
+        self.fertig.emit((self.ziel, fehler))
+
+
+# ---- Zufall (lazy, ohne gemischte Kopie) ----------------------------------
+
+M64 = (1 << 64) - 1
+
+
+def _mix64(x: int) -> int:
+    # splitmix64-Finalizer
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & M64
+    return x ^ (x >> 31)
+
+
+def seed_zahl(seed: Optional[str]) -> int:
+    """Fester Text -> reproduzierbarer Seed; None -> jedes Mal ein anderer."""
+    if seed is None:
+        return random.SystemRandom().getrandbits(64)
+    return int.from_bytes(hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def zufall_bits(n: int) -> int:
+    bits = max(2, (max(1, n) - 1).bit_length())
+    return bits + (bits & 1)
+
+
+class ZufallsFolge:
+    """
+    Pseudozufällige Permutation von 0..2^bits-1 als Feistel-Netz: index(schritt) und
+    schritt(index) sind Umkehrfunktionen, es wird nie eine Liste angelegt (O(1) Speicher).
+    Jeder Zyklus (Durchlauf) bekommt eigene Rundenschlüssel.
+    """
+    RUNDEN = 4
+
+    def __init__(self, bits: int, seed: int, zyklus: int = 0):
+        self.bits = bits
+        self.groesse = 1 << bits
+        self._halb = bits // 2
+        self._maske = (1 << self._halb) - 1
+        basis = _mix64((seed + zyklus * 0xD1B54A32D192ED03) & M64)
+        self._schluessel = [_mix64((basis + (r + 1) * 0x9E3779B97F4A7C15) & M64) for r in range(self.RUNDEN)]
+
+    def _f(self, k: int, x: int) -> int:
+        return _mix64(x ^ k) & self._maske
+
+    def index(self, schritt: int) -> int:
+        l, r = schritt >> self._halb, schritt & self._maske
+        for k in self._schluessel:
+            l, r = r, l ^ self._f(k, r)
+        return (l << self._halb) | r
+
+    def schritt(self, index: int) -> int:
+        l, r = index >> self._halb, index & self._maske
+        for k in reversed(self._schluessel):
+            l, r = r ^ self._f(k, l), l
+        return (l << self._halb) | r
+
+    def naechster(self, schritt: int, richtung: int, ist_drin: Callable[[int], bool]) -> Optional[Tuple[int, int]]:
+        """Ab schritt in richtung (+1/-1) bis zum nächsten passenden Index -> (schritt, index)."""
+        schritt += richtung
+        while 0 <= schritt < self.groesse:
+            i = self.index(schritt)
+            if ist_drin(i):
+                return schritt, i
+            schritt += richtung
+        return None
+
+
+def zufall_schritt(playlist: List[MediaItem], maske: bytearray, n_alle: int, bits: int, seed: int,
+                   von_pos: int, von_nr: Optional[int], zyklus: int, richtung: int,
+                   schleife: bool, rang: Optional[array] = None) -> Optional[Tuple[int, int]]:
+    """
+    Nächste/vorige Playlist-Position in Zufallsreihenfolge -> (position, zyklus); None = Ende.
+    Die Permutation läuft über die Nummern aller Medien, Filter werden nur übersprungen:
+    Filterwechsel und neu angehängte Medien ändern die Reihenfolge der übrigen nicht
+    (bis die Zweierpotenz 2^bits nicht mehr reicht). Ist die Playlist sehr klein
+    gegenüber allen Medien, ordnet ein Schlüssel je Nummer (siehe _zufall_duenn).
+    """
+    if not playlist:
+        return None
+    if len(playlist) * 16 < n_alle:
+        if von_nr is None and 0 <= von_pos < len(playlist):
+            von_nr = playlist[von_pos].nr
+        return _zufall_duenn(playlist, seed, von_nr, zyklus, richtung, schleife)
+
+    def ist_drin(i: int) -> bool:
+        return i < n_alle and maske[i] == 1
+    start = von_nr
+
+    folge = ZufallsFolge(bits, seed, zyklus)
+    if start is None:
+        schritt = -1 if richtung > 0 else folge.groesse
+    else:
+        schritt = folge.schritt(start)
+
+    # aktueller Zyklus, danach höchstens der nächste bzw. vorige
+    for _ in range(2):
+        treffer = folge.naechster(schritt, richtung, ist_drin)
+        if treffer is not None:
+            i = treffer[1]
+            if rang is None:
+                pos = bisect.bisect_left(playlist, i, key=lambda m: m.nr)
+            else:
+                pos = bisect.bisect_left(playlist, rang[i], key=lambda m: rang[m.nr])
+            return pos, zyklus
+        if not schleife:
+            return None
+        zyklus += richtung
+        folge = ZufallsFolge(bits, seed, zyklus)
+        schritt = -1 if richtung > 0 else folge.groesse
+    return None
+
+
+def _zufall_duenn(playlist: List[MediaItem], seed: int, von_nr: Optional[int], zyklus: int,
+                  richtung: int, schleife: bool) -> Optional[Tuple[int, int]]:
+    """
+    Kleine Playlist: Reihenfolge nach Schlüssel mix(Seed, Zyklus, nr), O(len(playlist)) je Schritt.
+    Der Schlüssel hängt nur an der Nummer, Filterwechsel und neue Medien mischen also nicht neu.
+    """
+    for _ in range(2):
+        basis = _mix64((seed + zyklus * 0xD1B54A32D192ED03) & M64)
+        schluessel = ((_mix64(basis ^ m.nr), m.nr, pos) for pos, m in enumerate(playlist))
+        if von_nr is not None:
+            grenze = (_mix64(basis ^ von_nr), von_nr)
+            if richtung > 0:
+                schluessel = (s for s in schluessel if s[:2] > grenze)
+            else:
+                schluessel = (s for s in schluessel if s[:2] < grenze)
+        treffer = min(schluessel, default=None) if richtung > 0 else max(schluessel, default=None)
+        if treffer is not None:
+            return treffer[2], zyklus
+        if not schleife:
+            return None
+        zyklus += richtung
+        von_nr = None
+    return None
+
+
+# ---- Playlists (M3U/M3U8/JSON) ----------------------------------------------
+
+PLAYLIST_EXTS = {".m3u", ".m3u8", ".json"}
+
+
+def is_playlist(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in PLAYLIST_EXTS
+
+
+def _playlist_pfad(eintrag: str, basis: str) -> str:
+    # Pfade werden hier nur aufgelöst, nicht geprüft (das passiert erst beim Anzeigen)
+    if eintrag.startswith("file://"):
+        eintrag = QUrl(eintrag).toLocalFile()
+    eintrag = os.path.expanduser(eintrag)
+    if not os.path.isabs(eintrag):
+        eintrag = os.path.join(basis, eintrag)
+    return os.path.normpath(eintrag)
+
+
+def _m3u_ersatzkodierung() -> str:
+    # alte .m3u-Dateien (Winamp & Co.) sind in der Systemkodierung; unter UTF-8-Systemen meist Latin-1
+    kodierung = locale.getpreferredencoding(False)
+    try:
+        return "latin-1" if codecs.lookup(kodierung).name == "utf-8" else kodierung
+    except LookupError:
+        return "latin-1"
+
+
+def _m3u_eintraege(pfad: str) -> Iterator[str]:
+    """.m3u8 ist UTF-8; .m3u hat keine feste Kodierung: je Zeile UTF-8, sonst die Ersatzkodierung."""
+    ersatz = "utf-8" if pfad.lower().endswith(".m3u8") else _m3u_ersatzkodierung()
+    with open(pfad, "rb") as f:
+        for roh in f:
+            try:
+                line = roh.decode("utf-8")
+            except UnicodeDecodeError:
+                line = roh.decode(ersatz, "replace")
+            line = line.strip().lstrip("\ufeff")
+            if line and not line.startswith("#"):
+                yield line
+
+
+_JSON_TRENNER = re.compile(r"[,\]\n]")
+JSON_MAX_EINTRAG = 1 << 16  # Zeichen; weit über jeder Pfadlänge
+
+
+def _bis_zum_trenner(f, puffer: str, pos: int, blockgroesse: int) -> Tuple[str, int]:
+    """
+    Überspringt einen kaputten Eintrag bis hinter das nächste Komma auf oberster Ebene des Arrays
+    (Klammern und Strings zählen mit; ein Zeilenumbruch beendet einen offenen String, dort geht es
+    weiter). Liefert Puffer und Position; am Array-Ende steht pos auf "]", am Dateiende ist der Puffer leer.
+    """
+    tiefe, im_string, escape = 0, False, False
+    while True:
+        for i in range(pos, len(puffer)):
+            c = puffer[i]
+            if im_string:
+                if escape:
+                    escape = False
+                elif c == "\\":
+                    escape = True
+                elif c == '"':
+                    im_string = False
+                elif c == "\n":
+                    return puffer, i + 1
+            elif c == '"':
+                im_string = True
+            elif c in "[{":
+                tiefe += 1
+            elif c in "]}":
+                if tiefe > 0:
+                    tiefe -= 1
+                elif c == "]":
+                    return puffer, i
+            elif c == "," and tiefe == 0:
+                return puffer, i + 1
+        # nur der Zustand zählt, der gelesene Teil wird nicht aufgehoben
+        puffer, pos = f.read(blockgroesse), 0
+        if not puffer:
+            return puffer, 0
+
+
+def _json_eintraege(pfad: str, blockgroesse: int = 1 << 16) -> Iterator[str]:
+    """
+    Liest das Eintrags-Array ("eintraege" oder das erste Array) stückweise mit raw_decode,
+    ohne die ganze Datei als ein Objekt zu parsen. Einträge: "pfad" oder {"pfad": ...}.
+    Ein fehlerhafter Eintrag wird bis zum nächsten Komma übersprungen, statt weiter zu puffern.
+    """
+    dec = json.JSONDecoder()
+    with open(pfad, "r", encoding="utf-8") as f:
+        puffer = f.read(blockgroesse)
+        schluessel = puffer.find('"eintraege"')
+        pos = puffer.find("[", max(0, schluessel))
+        while pos < 0:
+            block = f.read(blockgroesse)
+            if not block:
+                return
+            puffer += block
+            pos = puffer.find("[")
+        pos += 1
+
+        while True:
+            while pos < len(puffer) and puffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(puffer) and puffer[pos] == "]":
+                return
+            try:
+                if pos >= len(puffer):
+                    raise ValueError("Puffer leer")
+                wert, pos = dec.raw_decode(puffer, pos)
+            except ValueError as e:
+                # unvollständig: der Fehler reicht bis ans Pufferende (kein Trenner mehr dahinter)
+                unvollstaendig = not isinstance(e, json.JSONDecodeError) or (
+                    e.msg.startswith("Unterminated string") or not _JSON_TRENNER.search(puffer, e.pos)
+                )
+                if not unvollstaendig or len(puffer) - pos > JSON_MAX_EINTRAG:
+                    # eindeutig kaputt (oder so lang, dass es kein Pfad ist): überspringen
+                    print(f"MySlide: {pfad}: fehlerhafter Eintrag übersprungen ({e})", file=sys.stderr)
+                    puffer, pos = _bis_zum_trenner(f, puffer, pos, blockgroesse)
+                    continue
+                # Eintrag unvollständig -> nachladen
+                block = f.read(blockgroesse)
+                if not block:
+                    if pos >= len(puffer):
+                        return
+                    raise
+                puffer = puffer[pos:] + block
+                pos = 0
+                continue
+            if isinstance(wert, dict):
+                wert = wert.get("pfad") or wert.get("path")
+            if isinstance(wert, str) and wert:
+                yield wert
+
+
+def lies_playlist(pfad: str) -> Iterator[str]:
+    basis = os.path.dirname(os.path.abspath(pfad))
+    quelle = _json_eintraege(pfad) if pfad.lower().endswith(".json") else _m3u_eintraege(pfad)
+    for eintrag in quelle:
+        yield _playlist_pfad(eintrag, basis)
+
+
+def schreibe_playlist(pfad: str, items: List[MediaItem]) -> None:
+    with open(pfad, "w", encoding="utf-8", newline="\n") as f:
+        if pfad.lower().endswith(".json"):
+            f.write('{"myslide_playlist": 1,\n "eintraege": [')
+            for i, item in enumerate(items):
+                f.write(("\n  " if i == 0 else ",\n  ") + json.dumps(item.path, ensure_ascii=False))
+            f.write("\n ]}\n")
+        else:
+            f.write("#EXTM3U\n")
+            for item in items:
+                f.write(f"#EXTINF:-1,{item.name}\n{item.path}\n")
+
+
+class PlaylistImport(QObject):
+    """Parst eine Playlist im Hintergrund und liefert MediaItems häppchenweise."""
+    teil_geladen = Signal(object)  # (import_id, List[MediaItem])
+    fertig = Signal(object)        # (import_id, anzahl, fehlertext)
+
+    ERSTER_TEIL = 256      # klein, damit die Wiedergabe sofort beginnen kann
+    TEILGROESSE = 5000
+
+    def __init__(self, pfad: str, import_id: int, parent=None):
+        super().__init__(parent)
+        self.pfad = pfad
+        self.import_id = import_id
+        self._abbrechen = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="playlist-import", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def abbrechen(self) -> None:
+        self._abbrechen.set()
+
+    def _run(self) -> None:
+        teil: List[MediaItem] = []
+        groesse = self.ERSTER_TEIL
+        anzahl = 0
+        fehler = ""
+        try:
+            for path in lies_playlist(self.pfad):
+                if self._abbrechen.is_set():
+                    return
+                if not (is_image(path) or is_video(path)):
+                    continue
+                teil.append(MediaItem(path))
+                if len(teil) >= groesse:
+                    anzahl += len(teil)
+                    self.teil_geladen.emit((self.import_id, teil))
+                    teil = []
+                    groesse = self.TEILGROESSE
+        except (OSError, ValueError) as e:
+            fehler = str(e)
+        if teil and not self._abbrechen.is_set():
+            anzahl += len(teil)
+            self.teil_geladen.emit((self.import_id, teil))
+        self.fertig.emit((self.import_id, anzahl, fehler))
+
+
+class QuellenScan(QObject):
+    """
+    Liest mehrere Quellen (Ordner, Archive, Playlists, einzelne Dateien) parallel ein und
+    liefert sie in der angegebenen Reihenfolge, jede sobald sie und alle vorigen fertig sind.
+    """
+    teil_geladen = Signal(object)  # (scan_id, List[MediaItem])
+    fertig = Signal(object)        # (scan_id, anzahl, [fehlertexte])
+
+    def __init__(self, pfade: List[str], scan_id: int, parent=None):
+        super().__init__(parent)
+        self.pfade = pfade
+        self.scan_id = scan_id
+        self._abbrechen = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="quellen", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def abbrechen(self) -> None:
+        self._abbrechen.set()
+
+    @staticmethod
+    def _lies(pfad: str):
+        try:
+            return sammle_quelle(pfad), ""
+        except (OSError, ValueError) as e:
+            return [], f"{pfad}: {e}"
+
+    def _run(self) -> None:
+        anzahl = 0
+        fehler: List[str] = []
+        pool = ThreadPoolExecutor(max_workers=min(8, max(1, len(self.pfade))), thread_name_prefix="quelle")
+        try:
+            for items, f in pool.map(self._lies, self.pfade):
+                if self._abbrechen.is_set():
+                    return
+                if f:
+                    fehler.append(f)
+                if items:
+                    anzahl += len(items)
+                    self.teil_geladen.emit((self.scan_id, items))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.fertig.emit((self.scan_id, anzahl, fehler))
+
+
+# ---- Speicherbudget ---------------------------------------------------------
+
+MIB = 1024 * 1024
+
+# Verdrängungs-Reihenfolge: niedrigste Priorität zuerst, innerhalb gleicher Priorität LRU
+PRIO_ALT = 0        # früher gezeigte Folien
+PRIO_VORSCHAU = 1   # Thumbnails / Listen-Vorschau
+PRIO_NAECHSTES = 2  # vorausgeladene nächste Folien
+PRIO_AKTUELL = 3    # sichtbare Folie, letzter Videoframe
+
+
+def bild_bytes(obj) -> int:
+    if isinstance(obj, QImage):
+        return int(obj.sizeInBytes())
+    if isinstance(obj, QPixmap):
+        return obj.width() * obj.height() * max(1, obj.depth()) // 8
+    return 0
+
+
+class SpeicherBudget:
+    """
+    Zentrales Byte-Budget für alle Medien-Caches (Bilder, Pixmaps, Thumbnails, Frames).
+    Nur aus dem GUI-Thread benutzen; Worker liefern ihre Ergebnisse per Signal.
+    """
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.unter_druck = False
+        self.verdraengt = 0
+        self.belegt = 0
+        self._caches: List["MedienCache"] = []
+        # je Priorität: (cache, key) -> bytes, in LRU-Reihenfolge
+        self._lru: Dict[int, "OrderedDict[Tuple[MedienCache, object], int]"] = {
+            p: OrderedDict() for p in (PRIO_ALT, PRIO_VORSCHAU, PRIO_NAECHSTES, PRIO_AKTUELL)
+        }
+        self._prio: Dict[Tuple["MedienCache", object], int] = {}
+
+    def registriere(self, cache: "MedienCache") -> None:
+        self._caches.append(cache)
+
+    def effektives_limit(self) -> int:
+        # bei Speicherdruck nur noch die Hälfte erlauben
+        return self.limit // 2 if self.unter_druck else self.limit
+
+    def belege(self, cache: "MedienCache", key, groesse: int, prio: int) -> None:
+        self.freigeben(cache, key)
+        ref = (cache, key)
+        self._lru[prio][ref] = groesse
+        self._prio[ref] = prio
+        self.belegt += groesse
+        self._erzwinge(self.effektives_limit(), schutz=ref)
+
+    def beruehre(self, cache: "MedienCache", key) -> None:
+        ref = (cache, key)
+        prio = self._prio.get(ref)
+        if prio is not None:
+            self._lru[prio].move_to_end(ref)
+
+    def setze_prio(self, cache: "MedienCache", key, prio: int) -> None:
+        ref = (cache, key)
+        alt = self._prio.get(ref)
+        if alt is None or alt == prio:
+            return
+        groesse = self._lru[alt].pop(ref)
+        self._lru[prio][ref] = groesse
+        self._prio[ref] = prio
+
+    def freigeben(self, cache: "MedienCache", key) -> None:
+        ref = (cache, key)
+        prio = self._prio.pop(ref, None)
+        if prio is not None:
+            self.belegt -= self._lru[prio].pop(ref)
+
+    def setze_druck(self, an: bool) -> None:
+        self.unter_druck = an
+        if an:
+            self._erzwinge(self.effektives_limit())
+
+    def setze_limit(self, limit: int) -> None:
+        self.limit = max(0, int(limit))
+        self._erzwinge(self.effektives_limit())
+
+    def _erzwinge(self, ziel: int, schutz=None) -> None:
+        for prio in sorted(self._lru):
+            lru = self._lru[prio]
+            for ref in list(lru):
+                if self.belegt <= ziel:
+                    return
+                if ref == schutz:
+                    continue
+                cache, key = ref
+                self.freigeben(cache, key)
+                cache._verdraengt(key)
+                self.verdraengt += 1
+
+    def statistik(self) -> str:
+        pro_cache: Dict[str, List[int]] = {}
+        for cache in self._caches:
+            n, b = pro_cache.setdefault(cache.name, [0, 0])
+            pro_cache[cache.name] = [n + len(cache), b + cache.bytes()]
+        teile = [f"{name} {n} ({b / MIB:.1f} MiB)" for name, (n, b) in pro_cache.items() if n]
+        return (
+            f"Speicher: {self.belegt / MIB:.1f}/{self.effektives_limit() / MIB:.0f} MiB"
+            f"{' (Druck)' if self.unter_druck else ''} | "
+            f"{' · '.join(teile) or 'leer'} | verdrängt: {self.verdraengt}"
+        )
+
+
+class MedienCache:
+    """Einfacher Key->Bild-Cache, dessen Größe das SpeicherBudget verwaltet."""
+    def __init__(self, name: str, budget: SpeicherBudget):
+        self.name = name
+        self._budget = budget
+        self._daten: Dict[object, object] = {}
+        budget.registriere(self)
 
-IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"}
-VIDEO_EXTS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".mpeg", ".mpg", ".m4v"}
+    def __len__(self) -> int:
+        return len(self._daten)
 
+    def __contains__(self, key) -> bool:
+        return key in self._daten
 
-def is_image(path: str) -> bool:
-    return os.path.splitext(path)[1].lower() in IMAGE_EXTS
+    def hole(self, key):
+        obj = self._daten.get(key)
+        if obj is not None:
+            self._budget.beruehre(self, key)
+        return obj
 
+    def lege_ab(self, key, obj, prio: int) -> None:
+        self._daten[key] = obj
+        self._budget.belege(self, key, bild_bytes(obj), prio)
 
-def is_video(path: str) -> bool:
-    return os.path.splitext(path)[1].lower() in VIDEO_EXTS
+    def setze_prio(self, key, prio: int) -> None:
+        self._budget.setze_prio(self, key, prio)
 
+    def entferne(self, key) -> None:
+        if self._daten.pop(key, None) is not None:
+            self._budget.freigeben(self, key)
 
-# ---- Theme ------------------------------------------------------------------
+    def leeren(self) -> None:
+        for key in list(self._daten):
+            self.entferne(key)
 
-def apply_dark_palette(app: QApplication) -> None:
-    pal = QPalette()
-    pal.setColor(QPalette.Window, QColor(18, 18, 20))
-    pal.setColor(QPalette.Base, QColor(24, 24, 28))
-    pal.setColor(QPalette.AlternateBase, QColor(32, 32, 36))
+    def bytes(self) -> int:
+        return sum(bild_bytes(o) for o in self._daten.values())
 
-    # ALLE Schrift weiß
-    pal.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    pal.setColor(QPalette.Text, QColor(255, 255, 255))
-    pal.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    try:
-        pal.setColor(QPalette.PlaceholderText, QColor(200, 200, 200))
-    except Exception:
-        pass
+    def _verdraengt(self, key) -> None:
+        # Rückruf vom Budget
+        self._daten.pop(key, None)
 
-    pal.setColor(QPalette.Button, QColor(28, 28, 32))
-    pal.setColor(QPalette.Highlight, QColor(78, 130, 255))
-    pal.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
-    pal.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-    pal.setColor(QPalette.ToolTipText, QColor(0, 0, 0))
-    app.setPalette(pal)
 
+# Ein Budget für die ganze Anwendung (Limit per --speicher-mb)
+speicher_budget = SpeicherBudget(512 * MIB)
 
-def apply_light_palette(app: QApplication) -> None:
-    app.setPalette(app.style().standardPalette())
 
+class SpeicherDruckWaechter(QObject):
+    """
+    Fragt periodisch /proc/meminfo und PSI (/proc/pressure/memory) ab.
+    Qt selbst liefert unter Linux kein Speicherdruck-Signal.
+    """
+    druck_geaendert = Signal(bool)
 
-# ---- Datenmodell ------------------------------------------------------------
+    def __init__(self, parent=None, intervall_ms: int = 2000):
+        super().__init__(parent)
+        self.unter_druck = False
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._pruefe)
+        self._timer.start(intervall_ms)
+
+    @staticmethod
+    def _meminfo() -> Dict[str, int]:
+        werte: Dict[str, int] = {}
+        try:
+            with open("/proc/meminfo", "r", encoding="ascii") as f:
+                for line in f:
+                    name, _, rest = line.partition(":")
+                    werte[name] = int(rest.split()[0]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        return werte
+
+    @staticmethod
+    def _psi_avg10() -> float:
+        try:
+            with open("/proc/pressure/memory", "r", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("some"):
+                        for teil in line.split():
+                            if teil.startswith("avg10="):
+                                return float(teil[6:])
+        except (OSError, ValueError):
+            pass
+        return 0.0
 
-@dataclass
-class MediaItem:
-    path: str
+    @Slot()
+    def _pruefe(self) -> None:
+        info = self._meminfo()
+        frei = info.get("MemAvailable")
+        gesamt = info.get("MemTotal")
+        knapp = frei is not None and gesamt and (frei < 256 * MIB or frei < gesamt // 10)
+        druck = bool(knapp) or self._psi_avg10() > 10.0
+        if druck != self.unter_druck:
+            self.unter_druck = druck
+            self.druck_geaendert.emit(druck)
 
-    @property
-    def name(self) -> str:
-        return os.path.basename(self.path)
 
-    @property
-    def kind(self) -> str:
-        if is_image(self.path):
-            return "bild"
-        if is_video(self.path):
-            return "video"
-        return "anders"
+# ---- Lokale Kopien (Staging für langsame/Netzwerk-Ordner) -------------------
+
+STAGING_BLOCK = 8 * MIB  # große sequentielle Lesevorgänge
+STAGING_VORAUS = 6       # so viele kommende Medien lokal bereithalten
+
+
+class LokalKopien(QObject):
+    """
+    Kopiert kommende Medien im Hintergrund in einen lokalen Ordner (z. B. SSD),
+    damit die Anzeige nicht von Aussetzern eines SMB/NFS-Shares abhängt.
+
+    Dateiname der Kopie = Hash aus Pfad, Größe und mtime der Quelle, dadurch bleiben
+    Kopien über Programmstarts gültig. Der Ordner hat eine Größenobergrenze, verdrängt
+    wird die am längsten nicht benutzte Kopie (außer gerade gezeigten/vorgemerkten).
+    """
+    kopiert = Signal(str)  # Quellpfad, lokale Kopie liegt bereit
+
+    def __init__(self, ordner: str, limit_bytes: int, parent=None):
+        super().__init__(parent)
+        self.ordner = ordner
+        self.limit = limit_bytes
+        self.belegt = 0
+        self.fehler = 0
+        self._lock = threading.Condition()
+        self._dateien: "OrderedDict[str, int]" = OrderedDict()  # Name -> Größe, älteste zuerst
+        self._quelle: Dict[str, str] = {}  # Quellpfad -> Name
+        self._auftraege: deque = deque()
+        self._gesperrt: set = set()  # Quellpfade, die nicht verdrängt werden
+        self._bytes = 0
+        self._sekunden = 0.0
+        self._aktiv = True
+        self._einlesen()
+        self._thread = threading.Thread(target=self._run, name="staging", daemon=True)
+        self._thread.start()
+
+    def _einlesen(self) -> None:
+        os.makedirs(self.ordner, exist_ok=True)
+        vorhanden = []
+        for e in os.scandir(self.ordner):
+            if not e.is_file():
+                continue
+            if e.name.endswith(".teil"):  # abgebrochene Kopie
+                try:
+                    os.remove(e.path)
+                except OSError:
+                    pass
+                continue
+            st = e.stat()
+            vorhanden.append((st.st_atime, e.name, st.st_size))
+        for _, name, groesse in sorted(vorhanden):
+            self._dateien[name] = groesse
+            self.belegt += groesse
+
+    @staticmethod
+    def _name(path: str, st: os.stat_result) -> str:
+        h = hashlib.blake2b(f"{path}\0{st.st_size}\0{st.st_mtime_ns}".encode("utf-8", "surrogateescape"),
+                            digest_size=16).hexdigest()
+        return h + os.path.splitext(path)[1].lower()
+
+    def lokal(self, path: str) -> Optional[str]:
+        """Pfad der fertigen lokalen Kopie oder None (dann direkt von der Quelle lesen)."""
+        with self._lock:
+            name = self._quelle.get(path)
+            if name is None or name not in self._dateien:
+                return None
+            self._dateien.move_to_end(name)
+            return os.path.join(self.ordner, name)
+
+    def vormerken(self, pfade: List[str]) -> None:
+        """Diese Medien (aktuelles zuerst) bereithalten; ältere Aufträge sind damit erledigt."""
+        with self._lock:
+            self._gesperrt = set(pfade)
+            self._auftraege = deque(p for p in pfade if self._quelle.get(p) not in self._dateien)
+            self._lock.notify()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._aktiv = False
+            self._lock.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while self._aktiv and not self._auftraege:
+                    self._lock.wait()
+                if not self._aktiv:
+                    return
+                path = self._auftraege.popleft()
+            try:
+                self._hole(path)
+            except OSError as e:
+                with self._lock:
+                    self.fehler += 1
+                print(f"MySlide: Staging fehlgeschlagen: {path}: {e}", file=sys.stderr)
+
+    def _hole(self, path: str) -> None:
+        st = os.stat(path)
+        name = self._name(path, st)
+        with self._lock:
+            if name in self._dateien:
+                self._quelle[path] = name
+                self._dateien.move_to_end(name)
+                return
+        if st.st_size > self.limit // 2:
+            return  # passt nicht sinnvoll in den Ordner, direkt lesen
+        if not self._platz_schaffen(st.st_size):
+            return  # der Rest ist gezeigt/vorgemerkt und bleibt: direkt von der Quelle lesen
+
+        ziel = os.path.join(self.ordner, name)
+        teil = ziel + ".teil"
+        t0 = time.perf_counter()
+        puffer = bytearray(STAGING_BLOCK)
+        ansicht = memoryview(puffer)
+        try:
+            with open(path, "rb", buffering=0) as q, open(teil, "wb", buffering=0) as z:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(q.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while True:
+                    n = q.readinto(puffer)
+                    if not n:
+                        break
+                    z.write(ansicht[:n])
+            os.replace(teil, ziel)
+        except BaseException:
+            # halbe Kopie nicht liegen lassen (Platte voll, Quelle weg …); sie zählt nirgends mit
+            try:
+                os.remove(teil)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self._bytes += st.st_size
+            self._sekunden += time.perf_counter() - t0
+            self._dateien[name] = st.st_size
+            self.belegt += st.st_size
+            self._quelle[path] = name
+        self.kopiert.emit(path)
+
+    def _platz_schaffen(self, groesse: int) -> bool:
+        """Älteste Kopien verdrängen, bis groesse passt; False = passt trotzdem nicht."""
+        weg = []
+        with self._lock:
+            geschuetzt = {self._quelle.get(p) for p in self._gesperrt}
+            for name in list(self._dateien):
+                if self.belegt + groesse <= self.limit:
+                    break
+                if name in geschuetzt:
+                    continue
+                self.belegt -= self._dateien.pop(name)
+                weg.append(name)
+            passt = self.belegt + groesse <= self.limit
+        for name in weg:
+            try:
+                os.remove(os.path.join(self.ordner, name))
+            except OSError:
+                pass
+        return passt
+
+    def statistik(self) -> str:
+        with self._lock:
+            rate = self._bytes / MIB / self._sekunden if self._sekunden else 0.0
+            return (
+                f"Staging: {len(self._dateien)} Dateien, {self.belegt / MIB:.0f}/{self.limit / MIB:.0f} MB "
+                f"| {len(self._auftraege)} ausstehend | {rate:.0f} MB/s | Fehler: {self.fehler}"
+            )
+
+
+# ---- Folien-Takt -------------------------------------------------------------
+
+class FolienTakt:
+    """Zeitplan der Bildfolien: jede Folie hat eine feste Fälligkeit.
+
+    Die nächste Fälligkeit rechnet vom Soll-Zeitpunkt des Wechsels, nicht vom Ende
+    der Dekodierung – so läuft die Diashow nicht nach. Die Vorbereitung der nächsten
+    Folie beginnt um die gemessene Dekodier- und Skalierdauer (plus Reserve) früher.
+    """
+
+    TOLERANZ_MS = 20.0    # später gewechselt = Termin verpasst
+    NACHLAUF_S = 1.0      # noch später: neuer Takt ab jetzt statt Aufholen
+    RESERVE_MS = 50.0
+    START_DEKODIEREN_MS = 200.0  # Annahmen, solange noch nichts gemessen ist
+    START_SKALIEREN_MS = 50.0
+
+    def __init__(self) -> None:
+        self.faellig: Optional[float] = None  # perf_counter-Zeit des nächsten Wechsels
+        self._dekodieren: deque = deque(maxlen=20)
+        self._skalieren: deque = deque(maxlen=20)
+        self.puenktlich = 0
+        self.verpasst = 0
+        self.max_spaet_ms = 0.0
+
+    def plane(self, dauer_ms: int, anschluss: bool = False) -> None:
+        jetzt = time.perf_counter()
+        basis = jetzt
+        if anschluss and self.faellig is not None and jetzt - self.faellig < self.NACHLAUF_S:
+            basis = self.faellig
+        self.faellig = basis + dauer_ms / 1000.0
+
+    def aussetzen(self) -> int:
+        rest = self.rest_ms()
+        self.faellig = None
+        return rest
+
+    def rest_ms(self) -> int:
+        if self.faellig is None:
+            return 0
+        return max(0, int(-(-(self.faellig - time.perf_counter()) * 1000.0 // 1)))  # aufrunden: nie zu früh
+
+    def vorlauf_ms(self) -> float:
+        # pessimistisch: langsamste der letzten Messungen, die Folie könnte noch nicht dekodiert sein
+        d = max(self._dekodieren) if self._dekodieren else self.START_DEKODIEREN_MS
+        s = max(self._skalieren) if self._skalieren else self.START_SKALIEREN_MS
+        return (d + s) * 1.5 + self.RESERVE_MS
+
+    def vorbereiten_in_ms(self) -> int:
+        return max(0, int(self.rest_ms() - self.vorlauf_ms()))
+
+    def messe(self, dekodier_ms: Optional[float] = None, skalier_ms: Optional[float] = None) -> None:
+        if dekodier_ms is not None:
+            self._dekodieren.append(dekodier_ms)
+        if skalier_ms is not None:
+            self._skalieren.append(skalier_ms)
+
+    def melde_wechsel(self, soll: Optional[float]) -> Optional[float]:
+        """Wechsel ist erfolgt; liefert die Verspätung in ms, wenn der Termin verpasst wurde."""
+        if soll is None:
+            return None
+        spaet = (time.perf_counter() - soll) * 1000.0
+        self.max_spaet_ms = max(self.max_spaet_ms, spaet)
+        if spaet > self.TOLERANZ_MS:
+            self.verpasst += 1
+            return spaet
+        self.puenktlich += 1
+        return None
+
+    def statistik(self) -> str:
+        return (
+            f"Folien: {self.puenktlich} pünktlich, {self.verpasst} verpasst "
+            f"(max +{self.max_spaet_ms:.0f} ms) | Vorlauf {self.vorlauf_ms():.0f} ms"
+        )
+
+
+# ---- Debug-Overlay ----------------------------------------------------------
+
+class DebugOverlay(QLabel):
+    """Halbtransparente Info-Box oben links (F3)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("debugOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "QLabel#debugOverlay { background: rgba(0,0,0,0.72); color: #7CFC7C;"
+            " font-family: monospace; font-size: 11px; padding: 6px 8px; border-radius: 6px; }"
+        )
+        self.hide()
+
+    def setze_zeilen(self, zeilen: List[str]) -> None:
+        self.setText("\n".join(zeilen))
+        self.adjustSize()
+        self.move(8, 8)
+        self.raise_()
 
 
 # ---- Drag&Drop --------------------------------------------------------------
 
 class DropBereich(QWidget):
-    ordner_fallen_gelassen = Signal(str)
-    dateien_fallen_gelassen = Signal(list)
+    # (Ordner/Archive/Playlists/Dateien, hinzufügen statt ersetzen: Strg/Umschalt beim Loslassen)
+    fallen_gelassen = Signal(list, bool)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -95,21 +3423,15 @@ class DropBereich(QWidget):
             e.acceptProposedAction()
 
     def dropEvent(self, e):
-        urls = [u.toLocalFile() for u in e.mimeData().urls() if u.isLocalFile()]
-        if not urls:
-            return
-        folders = [p for p in urls if os.path.isdir(p)]
-        if folders:
-            self.ordner_fallen_gelassen.emit(folders[0])
-            return
-        files = [p for p in urls if os.path.isfile(p)]
-        if files:
-            self.dateien_fallen_gelassen.emit(files)
+        pfade = [u.toLocalFile() for u in e.mimeData().urls() if u.isLocalFile()]
+        pfade = [p for p in pfade if os.path.isdir(p) or os.path.isfile(p)]
+        if pfade:
+            self.fallen_gelassen.emit(pfade, bool(e.modifiers() & (Qt.ControlModifier | Qt.ShiftModifier)))
 
 
 class DropListe(QListWidget):
-    ordner_fallen_gelassen = Signal(str)
-    dateien_fallen_gelassen = Signal(list)
+    # (Ordner/Archive/Playlists/Dateien, hinzufügen statt ersetzen: Strg/Umschalt beim Loslassen)
+    fallen_gelassen = Signal(list, bool)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -121,16 +3443,10 @@ class DropListe(QListWidget):
             e.acceptProposedAction()
 
     def dropEvent(self, e):
-        urls = [u.toLocalFile() for u in e.mimeData().urls() if u.isLocalFile()]
-        if not urls:
-            return
-        folders = [p for p in urls if os.path.isdir(p)]
-        if folders:
-            self.ordner_fallen_gelassen.emit(folders[0])
-            return
-        files = [p for p in urls if os.path.isfile(p)]
-        if files:
-            self.dateien_fallen_gelassen.emit(files)
+        pfade = [u.toLocalFile() for u in e.mimeData().urls() if u.isLocalFile()]
+        pfade = [p for p in pfade if os.path.isdir(p) or os.path.isfile(p)]
+        if pfade:
+            self.fallen_gelassen.emit(pfade, bool(e.modifiers() & (Qt.ControlModifier | Qt.ShiftModifier)))
 
 
 # ---- Click-to-seek Slider ---------------------------------------------------
@@ -161,20 +3477,18 @@ def ms_to_hms(ms: int) -> str:
 
 # ---- Video via QVideoSink (Overlay-safe) ------------------------------------
 
-class VideoRenderWidget(QWidget):
+class VideoFrameVerteiler(QObject):
     """
-    Rendert QVideoFrame als QImage im paintEvent -> Seekbar-Overlay ist garantiert sichtbar.
+    Ein QVideoSink, ein toImage() pro Frame – beliebig viele VideoRenderWidgets
+    (z. B. ein Vollbild pro Bildschirm) zeichnen dasselbe QImage.
     """
-    hovered = Signal(bool)
-    moved = Signal()
+    frame_bereit = Signal()
 
-    def __init__(self, sink: QVideoSink, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMouseTracking(True)
-        self._sink = sink
-        self._image = None  # QImage
-        self._sink.videoFrameChanged.connect(self._on_frame)
-        self.setStyleSheet("background: black;")
+        self.sink = QVideoSink(self)
+        self._frames = MedienCache("Videoframes", speicher_budget)  # letzter Frame als QImage
+        self.sink.videoFrameChanged.connect(self._on_frame)
 
     @Slot()
     def _on_frame(self, frame):
@@ -182,8 +3496,29 @@ class VideoRenderWidget(QWidget):
             img = frame.toImage()
         except Exception:
             img = None
-        self._image = img if (img is not None and not img.isNull()) else None
-        self.update()
+        if img is not None and not img.isNull():
+            self._frames.lege_ab(0, img, PRIO_AKTUELL)
+        else:
+            self._frames.entferne(0)
+        self.frame_bereit.emit()
+
+    def bild(self) -> Optional[QImage]:
+        return self._frames.hole(0)
+
+
+class VideoRenderWidget(QWidget):
+    """
+    Rendert QVideoFrame als QImage im paintEvent -> Seekbar-Overlay ist garantiert sichtbar.
+    """
+    hovered = Signal(bool)
+    moved = Signal()
+
+    def __init__(self, verteiler: VideoFrameVerteiler, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+        self._verteiler = verteiler
+        self._verteiler.frame_bereit.connect(self.update)
+        self.setStyleSheet("background: black;")
 
     def enterEvent(self, e):
         self.hovered.emit(True)
@@ -201,11 +3536,12 @@ class VideoRenderWidget(QWidget):
         p = QPainter(self)
         p.fillRect(self.rect(), Qt.black)
 
-        if self._image is None:
+        image = self._verteiler.bild()
+        if image is None:
             return
 
-        img_w = self._image.width()
-        img_h = self._image.height()
+        img_w = image.width()
+        img_h = image.height()
         if img_w <= 0 or img_h <= 0:
             return
 
@@ -215,7 +3551,86 @@ class VideoRenderWidget(QWidget):
         h = int(img_h * scale)
         x = dst.x() + (dst.width() - w) // 2
         y = dst.y() + (dst.height() - h) // 2
-        p.drawImage(QRect(x, y, w, h), self._image)
+        p.drawImage(QRect(x, y, w, h), image)
+
+
+class SeekPlaner(QObject):
+    """
+    Live-Scrubbing: höchstens ein Seek gleichzeitig, Zwischenpositionen werden
+    verworfen (nur die neueste wartet). Ein Seek gilt als erledigt, sobald der
+    Player eine Position nahe am Ziel meldet – spätestens nach TIMEOUT_MS.
+
+    QMediaPlayer (Qt 6) bietet keinen Seek-Modus: ob auf den Keyframe oder exakt
+    gesprungen wird, entscheidet das Backend. Ziehen und Loslassen unterscheiden sich
+    daher nur hier: beim Ziehen grob (AUFLOESUNG_MS), gedrosselt und verwerfbar,
+    beim Loslassen genau ein ungedrosselter Seek auf die exakte Position.
+    """
+    MIN_ABSTAND_MS = 40   # höchstens ~25 Seeks/s
+    TIMEOUT_MS = 250
+    AUFLOESUNG_MS = 50    # kleinere Bewegungen lösen keinen Seek aus
+    TOLERANZ_MS = 100     # gemeldete Position so nah am Ziel: Seek angekommen
+
+    def __init__(self, player: QMediaPlayer, parent=None):
+        super().__init__(parent)
+        self.player = player
+        self._wartend: Optional[int] = None
+        self._im_flug = False
+        self._ziel = 0
+        self._letzter: Optional[int] = None
+        self._t_letzter = 0.0
+        self.seeks = 0
+        self.verworfen = 0
+        self._timer = QTimer(self)  # Timeout des laufenden Seeks bzw. Wartezeit bis zum nächsten
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._erledigt)
+        player.positionChanged.connect(self._on_position)
+
+    def anfordern(self, ms: int) -> None:
+        if self._wartend is not None:
+            self.verworfen += 1
+        self._wartend = int(ms)
+        if not self._im_flug and not self._timer.isActive():
+            self._naechster()
+
+    def abschliessen(self, ms: int) -> None:
+        """Loslassen: genau an diese Position, ausstehende Zwischen-Seeks entfallen."""
+        self._wartend = None
+        self._timer.stop()
+        self._im_flug = False
+        self._letzter = int(ms)
+        self.player.setPosition(int(ms))
+
+    def _naechster(self) -> None:
+        ziel = self._wartend
+        if ziel is None:
+            return
+        if self._letzter is not None and abs(ziel - self._letzter) < self.AUFLOESUNG_MS:
+            self._wartend = None
+            return
+        rest = self.MIN_ABSTAND_MS - (time.perf_counter() - self._t_letzter) * 1000
+        if rest > 0:
+            self._timer.start(int(rest) + 1)
+            return
+        self._wartend = None
+        self._im_flug = True
+        self._ziel = ziel
+        self._letzter = ziel
+        self._t_letzter = time.perf_counter()
+        self.seeks += 1
+        self._timer.start(self.TIMEOUT_MS)
+        self.player.setPosition(ziel)
+
+    @Slot(int)
+    def _on_position(self, pos: int) -> None:
+        # normale Wiedergabe-Ticks während des Seeks zählen nicht; sonst greift der Timeout
+        if self._im_flug and abs(pos - self._ziel) < self.TOLERANZ_MS:
+            self._erledigt()
+
+    @Slot()
+    def _erledigt(self) -> None:
+        self._timer.stop()
+        self._im_flug = False
+        self._naechster()
 
 
 class SeekBarWidget(QFrame):
@@ -244,6 +3659,7 @@ class SeekBarWidget(QFrame):
         lay.addWidget(self.label_dur)
 
         self._dragging = False
+        self.planer = SeekPlaner(player, self)
         self.slider.sliderPressed.connect(self._on_press)
         self.slider.sliderReleased.connect(self._on_release)
         self.slider.valueChanged.connect(self._on_value_changed)
@@ -266,11 +3682,12 @@ class SeekBarWidget(QFrame):
 
     def _on_release(self):
         self._dragging = False
-        self.player.setPosition(self.slider.value())
+        self.planer.abschliessen(self.slider.value())
 
     def _on_value_changed(self, v: int):
         if self._dragging:
             self.label_pos.setText(ms_to_hms(v))
+            self.planer.anfordern(v)
 
     def _on_player_pos(self, pos: int):
         if not self._dragging:
@@ -287,11 +3704,12 @@ class SeekBarWidget(QFrame):
 
 class VideoArea(QWidget):
     """Video (QVideoSink) + Seekbar unten eingebettet."""
-    def __init__(self, player: QMediaPlayer, parent=None):
+    def __init__(self, player: QMediaPlayer, parent=None, verteiler: Optional[VideoFrameVerteiler] = None):
         super().__init__(parent)
         self.player = player
-        self.sink = QVideoSink(self)
-        self.video = VideoRenderWidget(self.sink, self)
+        self.verteiler = verteiler or VideoFrameVerteiler(self)
+        self.sink = self.verteiler.sink
+        self.video = VideoRenderWidget(self.verteiler, self)
         self.seekbar = SeekBarWidget(player, self)
         self.seekbar.raise_()
 
@@ -341,6 +3759,13 @@ class VollbildAnzeige(QDialog):
         self.bild_label.hide()
         self.video_area.hide()
 
+        self.debug_overlay = DebugOverlay(self)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        # Bildschirmgröße steht oft erst nach showFullScreen() fest
+        self.parent()._rescale_current()
+
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Space and not (e.modifiers() & Qt.ControlModifier):
             self.parent().toggle_space_action()
@@ -354,12 +3779,236 @@ class VollbildAnzeige(QDialog):
         if e.key() == Qt.Key_Right:
             self._on_next()
             return
+        if e.key() == Qt.Key_F3:
+            self.parent().toggle_debug_overlay()
+            return
         if e.key() == Qt.Key_Escape:
             self.close()
             return
         super().keyPressEvent(e)
 
 
+# ---- Deep Zoom (Kacheln) ----------------------------------------------------
+
+class ZoomAnsicht(QWidget):
+    """
+    Zoom/Pan für eine Bildfolie. Dekodiert werden nur die sichtbaren Kacheln, jeweils in der
+    Auflösungsstufe, die der Bildschirm braucht (Stufe n = 1/2^n, QImageReader mit Ausschnitt
+    und Zielgröße). Darunter liegt die schon dekodierte Übersicht der Folie. Kacheln liegen im
+    Kachel-Cache (Speicherbudget), zusätzlich begrenzt auf ein Vielfaches der sichtbaren Anzahl:
+    der Speicher wächst mit der Fenstergröße, nicht mit der Bildgröße.
+    """
+    kachel_fertig = Signal(object)  # (generation, key, QImage)
+
+    KACHEL = 512
+    MAX_ZOOM = 4.0       # 400 % = Bildpunkte als Blöcke
+    CACHE_FAKTOR = 3     # so viele Bildschirme voll Kacheln behalten
+
+    def __init__(self, cache: MedienCache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.path: Optional[str] = None
+        self.bildgroesse = QSize()
+        self.uebersicht = QImage()
+        self.zoom = 1.0
+        self._min_zoom = 1.0
+        self._mitte = (0.0, 0.0)  # Bildkoordinaten in der Fenstermitte
+        self._ausschnitte = False
+        self._gen = 0
+        self._laufend: Dict[tuple, Future] = {}
+        self._kacheln: "OrderedDict[tuple, None]" = OrderedDict()  # eigene LRU-Reihenfolge
+        self._ziehen_ab = None
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kacheln")
+        self.kachel_fertig.connect(self._on_kachel)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setStyleSheet("background: black;")
+        self.setCursor(Qt.OpenHandCursor)
+
+    def zeige(self, path: str, uebersicht: QImage) -> None:
+        self._gen += 1
+        for f in self._laufend.values():
+            f.cancel()
+        self._laufend.clear()
+        self.path = path
+        self.uebersicht = uebersicht
+        self.bildgroesse, self._ausschnitte = bild_info(path)
+        if not self.bildgroesse.isValid():
+            self.bildgroesse = uebersicht.size()
+        self.einpassen()
+
+    def einpassen(self) -> None:
+        bw, bh = max(1, self.bildgroesse.width()), max(1, self.bildgroesse.height())
+        self._min_zoom = min(self.width() / bw, self.height() / bh, 1.0)
+        self.zoom = self._min_zoom
+        self._mitte = (bw / 2.0, bh / 2.0)
+        self.update()
+
+    def _stufe(self) -> int:
+        # gröbste Stufe, die noch mindestens einen Bildpunkt je Bildschirmpunkt liefert
+        stufe = 0
+        while stufe < 16 and 1.0 / (1 << (stufe + 1)) >= self.zoom:
+            stufe += 1
+        return stufe
+
+    def _ursprung(self) -> Tuple[float, float]:
+        return self.width() / 2.0 - self._mitte[0] * self.zoom, self.height() / 2.0 - self._mitte[1] * self.zoom
+
+    def _begrenze(self) -> None:
+        bw, bh = self.bildgroesse.width(), self.bildgroesse.height()
+        mx = min(max(self._mitte[0], self.width() / 2.0 / self.zoom), bw - self.width() / 2.0 / self.zoom)
+        my = min(max(self._mitte[1], self.height() / 2.0 / self.zoom), bh - self.height() / 2.0 / self.zoom)
+        # kleiner als das Fenster: zentrieren
+        self._mitte = (mx if bw * self.zoom > self.width() else bw / 2.0,
+                       my if bh * self.zoom > self.height() else bh / 2.0)
+
+    def zoome(self, faktor: float, x: float, y: float) -> None:
+        """Um faktor zoomen; der Bildpunkt unter (x, y) bleibt an seiner Stelle."""
+        ox, oy = self._ursprung()
+        bx, by = (x - ox) / self.zoom, (y - oy) / self.zoom
+        self.zoom = min(self.MAX_ZOOM, max(self._min_zoom, self.zoom * faktor))
+        self._mitte = (bx - (x - self.width() / 2.0) / self.zoom, by - (y - self.height() / 2.0) / self.zoom)
+        self._begrenze()
+        self.update()
+
+    def paintEvent(self, e) -> None:
+        p = QPainter(self)
+        p.fillRect(self.rect(), Qt.black)
+        if self.path is None or self.uebersicht.isNull():
+            return
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        ox, oy = self._ursprung()
+        bw, bh = self.bildgroesse.width(), self.bildgroesse.height()
+        p.drawImage(QRectF(ox, oy, bw * self.zoom, bh * self.zoom), self.uebersicht)
+
+        # Übersicht reicht, solange sie mindestens so fein ist wie die Anzeige
+        if not self._ausschnitte or self.uebersicht.width() >= bw * self.zoom:
+            return
+        stufe = self._stufe()
+        s = 1 << stufe
+        k = self.KACHEL * s  # Kachelkante in Originalpixeln
+        x0, y0 = max(0.0, -ox / self.zoom), max(0.0, -oy / self.zoom)
+        x1, y1 = min(float(bw), (self.width() - ox) / self.zoom), min(float(bh), (self.height() - oy) / self.zoom)
+        sichtbar = set()
+        for ty in range(int(y0 // k), int((y1 - 1) // k) + 1):
+            fehlend = []
+            for tx in range(int(x0 // k), int((x1 - 1) // k) + 1):
+                key = (self.path, stufe, tx, ty)
+                sichtbar.add(key)
+                kachel = self.cache.hole(key)
+                if kachel is None:
+                    if key not in self._laufend:
+                        fehlend.append(tx)
+                    continue
+                if key in self._kacheln:
+                    self._kacheln.move_to_end(key)
+                p.drawImage(QRectF(ox + tx * k * self.zoom, oy + ty * k * self.zoom,
+                                   min(k, bw - tx * k) * self.zoom, min(k, bh - ty * k) * self.zoom), kachel)
+            if fehlend:
+                self._anfordern(stufe, ty, fehlend[0], fehlend[-1])
+        # nicht mehr sichtbare, noch nicht begonnene Aufträge verwerfen
+        for key in [key for key in self._laufend if key not in sichtbar]:
+            if self._laufend[key].cancel():
+                del self._laufend[key]
+
+    def _anfordern(self, stufe: int, ty: int, tx0: int, tx1: int) -> None:
+        # eine Kachelzeile am Stück: JPEG muss die Zeilen darüber ohnehin durchlaufen
+        s = 1 << stufe
+        k = self.KACHEL * s
+        bw, bh = self.bildgroesse.width(), self.bildgroesse.height()
+        streifen = QRect(tx0 * k, ty * k, min((tx1 + 1) * k, bw) - tx0 * k, min(k, bh - ty * k))
+        keys = [(self.path, stufe, tx, ty) for tx in range(tx0, tx1 + 1)]
+        gen = self._gen
+        fut = self._pool.submit(self._lies_streifen, self.path, streifen, s, keys)
+
+        def fertig(f: Future) -> None:
+            if f.cancelled():
+                return
+            # exception() statt result(): kein erneutes raise, das den aufrufenden Frame festhält
+            fehler = f.exception()
+            if fehler is not None:  # Keys trotzdem freigeben, sonst wird die Zeile nie wieder angefordert
+                print(f"MySlide: Kacheln aus {keys[0][0]} nicht lesbar: {fehler}", file=sys.stderr)
+            self.kachel_fertig.emit((gen, keys, [] if fehler is not None else f.result()))
+
+        # erst eintragen: ist der Auftrag schon fertig, läuft fertig() sofort in diesem Thread
+        for key in keys:
+            self._laufend[key] = fut
+        fut.add_done_callback(fertig)
+
+    @classmethod
+    def _lies_streifen(cls, path: str, streifen: QRect, s: int, keys: List[tuple]) -> List[QImage]:
+        ziel = QSize(max(1, -(-streifen.width() // s)), max(1, -(-streifen.height() // s)))
+        img = lies_bild(path, streifen, ziel)
+        if img.isNull():
+            return []
+        return [
+            img.copy(i * cls.KACHEL, 0, min(cls.KACHEL, img.width() - i * cls.KACHEL), img.height())
+            for i in range(len(keys))
+        ]
+
+    @Slot(object)
+    def _on_kachel(self, daten) -> None:
+        gen, keys, bilder = daten
+        for key in keys:
+            self._laufend.pop(key, None)
+        if gen != self._gen or not bilder:
+            return  # ohne neue Kacheln nicht neu zeichnen: der nächste Zoom/Pan fordert erneut an
+        for key, img in zip(keys, bilder):
+            self.cache.lege_ab(key, img, PRIO_VORSCHAU)
+            self._kacheln[key] = None
+        grenze = self.CACHE_FAKTOR * (self.width() // self.KACHEL + 2) * (self.height() // self.KACHEL + 2)
+        while len(self._kacheln) > grenze:
+            alt, _ = self._kacheln.popitem(last=False)
+            self.cache.entferne(alt)
+        self.update()
+
+    def resizeEvent(self, e) -> None:
+        super().resizeEvent(e)
+        if self.path is not None:
+            self.einpassen()
+
+    def wheelEvent(self, e) -> None:
+        schritte = e.angleDelta().y() / 120.0
+        if schritte:
+            pos = e.position()
+            self.zoome(1.25 ** schritte, pos.x(), pos.y())
+
+    def mousePressEvent(self, e) -> None:
+        if e.button() == Qt.LeftButton:
+            self._ziehen_ab = e.position()
+            self.setCursor(Qt.ClosedHandCursor)
+
+    def mouseMoveEvent(self, e) -> None:
+        if self._ziehen_ab is None:
+            return
+        d = e.position() - self._ziehen_ab
+        self._ziehen_ab = e.position()
+        self._mitte = (self._mitte[0] - d.x() / self.zoom, self._mitte[1] - d.y() / self.zoom)
+        self._begrenze()
+        self.update()
+
+    def mouseReleaseEvent(self, e) -> None:
+        self._ziehen_ab = None
+        self.setCursor(Qt.OpenHandCursor)
+
+    def mouseDoubleClickEvent(self, e) -> None:
+        # Doppelklick: 1:1 an der Stelle bzw. zurück auf Einpassen
+        if self.zoom < 1.0:
+            self.zoome(1.0 / self.zoom, e.position().x(), e.position().y())
+        else:
+            self.einpassen()
+
+    def keyPressEvent(self, e) -> None:
+        mitte = (self.width() / 2.0, self.height() / 2.0)
+        if e.key() in (Qt.Key_Plus, Qt.Key_Equal):
+            self.zoome(1.25, *mitte)
+        elif e.key() == Qt.Key_Minus:
+            self.zoome(0.8, *mitte)
+        elif e.key() == Qt.Key_0:
+            self.einpassen()
+        else:
+            super().keyPressEvent(e)
+
+
 # ---- Hilfe-Popup ------------------------------------------------------------
 
 class HilfePopup(QFrame):
@@ -381,7 +4030,8 @@ class HilfePopup(QFrame):
             "Strg+R: Dauerschleife an/aus<br>"
             "Strg+Z: Zufall an/aus<br>"
             "Strg+V oder F12: Vollbild (nur Medium) an/aus<br>"
-            "Esc: Vollbild verlassen<br><br>"
+            "Esc: Vollbild verlassen<br>"
+            "F3: Debug-Overlay an/aus<br><br>"
             "<b>Wissenswert</b><br>"
             "• Filter wirkt immer (auch ohne Dauerschleife / nur Zufall).<br>"
             "• Timer gilt nur für Bilder – Videos laufen komplett.<br>"
@@ -393,11 +4043,421 @@ class HilfePopup(QFrame):
         lay.addWidget(txt)
 
 
+# ---- Fernsteuerung ----------------------------------------------------------
+
+STEUER_BEFEHLE = ("toggle", "next", "prev", "stop", "laden", "status")
+STEUER_MAX_BODY = 4096  # Befehle sind klein; größere Anfragen bekommen 413
+STEUER_TOKEN_KOPF = "x-myslide-token"
+_STEUER_HOSTS = ("127.0.0.1", "localhost")
+
+
+def steuer_token() -> str:
+    """Gemeinsames Geheimnis für die HTTP-Steuerung (~/.cache/myslide/steuer-token, nur für den Nutzer lesbar)."""
+    pfad = os.path.join(cache_ordner(), "steuer-token")
+    try:
+        with open(pfad, encoding="ascii") as f:
+            token = f.read().strip()
+        if token:
+            return token
+    except (OSError, ValueError):
+        pass
+    os.makedirs(os.path.dirname(pfad), exist_ok=True)
+    token = secrets.token_urlsafe(32)
+    fd = os.open(pfad, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="ascii") as f:
+        f.write(token + "\n")
+    return token
+
+
+def _lokaler_host(wert: str) -> bool:
+    """Host- bzw. Origin-Angabe zeigt auf diesen Rechner (gegen DNS-Rebinding und fremde Webseiten)."""
+    wert = wert.strip().lower()
+    if "://" in wert:
+        schema, _, wert = wert.partition("://")
+        if schema not in ("http", "https"):
+            return False
+    host = wert.rsplit(":", 1)[0] if wert.count(":") == 1 else wert
+    return host in _STEUER_HOSTS
+
+
+class SteuerServer(QObject):
+    """
+    Lokale Fernsteuerung: HTTP auf 127.0.0.1 und/oder Unix-Socket (eine JSON-Zeile je Befehl).
+    HTTP verlangt das Token aus steuer_token() im Kopf X-MySlide-Token und lehnt fremde
+    Host/Origin-Angaben ab; der Socket ist nur für den Nutzer les- und schreibbar.
+    Der asyncio-Loop läuft in einem eigenen Thread; Befehle gehen per Qt-Signal (queued)
+    in den GUI-Thread und die Antwort per call_soon_threadsafe zurück – das Rendern
+    wird nie vom Netzwerk blockiert.
+    """
+    befehl_empfangen = Signal(object)  # (name, daten: dict, antworte: Callable[[dict], None])
+
+    def __init__(self, port: Optional[int] = None, socket_pfad: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.socket_pfad = socket_pfad
+        self.anzahl_befehle = 0
+        self.token = steuer_token() if port else ""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="steuerung", daemon=True)
+
+    def adresse(self) -> str:
+        teile = []
+        if self.port:
+            teile.append(f"http://127.0.0.1:{self.port}")
+        if self.socket_pfad:
+            teile.append(f"unix:{self.socket_pfad}")
+        return ", ".join(teile)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(1.0)
+        if self.socket_pfad and os.path.exists(self.socket_pfad):
+            try:
+                os.unlink(self.socket_pfad)
+            except OSError:
+                pass
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._starte_server())
+        except OSError as e:
+            print(f"MySlide: Fernsteuerung konnte nicht starten: {e}", file=sys.stderr)
+            return
+        self._loop.run_forever()
+
+    async def _starte_server(self) -> None:
+        if self.port:
+            await asyncio.start_server(self._http_verbindung, "127.0.0.1", self.port)
+        if self.socket_pfad:
+            if os.path.exists(self.socket_pfad):
+                os.unlink(self.socket_pfad)
+            # schon beim Anlegen nur für den Benutzer: ein chmod danach ließe ein Zeitfenster offen
+            alt = os.umask(0o077)
+            try:
+                await asyncio.start_unix_server(self._socket_verbindung, self.socket_pfad)
+            finally:
+                os.umask(alt)
+            os.chmod(self.socket_pfad, 0o600)
+
+    async def _ausfuehren(self, name: str, daten: dict) -> dict:
+        if name not in STEUER_BEFEHLE:
+            return {"fehler": f"unbekannter Befehl: {name}"}
+        self.anzahl_befehle += 1
+        fut = self._loop.create_future()
+
+        def antworte(antwort: dict) -> None:
+            self._loop.call_soon_threadsafe(lambda: fut.done() or fut.set_result(antwort))
+
+        self.befehl_empfangen.emit((name, daten, antworte))
+        try:
+            return await asyncio.wait_for(fut, 5.0)
+        except asyncio.TimeoutError:
+            return {"fehler": "Zeitüberschreitung"}
+
+    # -- HTTP (keep-alive, nur das Nötigste) --
+
+    async def _http_verbindung(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                zeile = await reader.readline()
+                if not zeile:
+                    break
+                methode, pfad, _ = zeile.decode("latin-1").split(" ", 2)
+                laenge = 0
+                offen = True
+                koepfe: Dict[str, str] = {}
+                while True:
+                    kopf = await reader.readline()
+                    if kopf in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, wert = kopf.decode("latin-1").partition(":")
+                    name = name.strip().lower()
+                    koepfe[name] = wert.strip()
+                    if name == "content-length":
+                        laenge = int(wert.strip())
+                    elif name == "connection" and wert.strip().lower() == "close":
+                        offen = False
+
+                if not 0 <= laenge <= STEUER_MAX_BODY:
+                    # Body nicht lesen: Antwort schicken und Verbindung schließen
+                    status, antwort = "413 Payload Too Large", {"fehler": f"höchstens {STEUER_MAX_BODY} Bytes"}
+                    offen = False
+                else:
+                    body = await reader.readexactly(laenge) if laenge else b""
+                    status, antwort = self._http_pruefe(koepfe) or await self._http_befehl(methode, pfad, body)
+                daten = json.dumps(antwort, ensure_ascii=False).encode("utf-8")
+                koepfe = [
+                    f"HTTP/1.1 {status}",
+                    "Content-Type: application/json; charset=utf-8",
+                    f"Content-Length: {len(daten)}",
+                ]
+                if not offen:
+                    koepfe.append("Connection: close")
+                writer.write(("\r\n".join(koepfe) + "\r\n\r\n").encode("latin-1") + daten)
+                await writer.drain()
+                if not offen:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _http_pruefe(self, koepfe: Dict[str, str]) -> Optional[Tuple[str, dict]]:
+        """Fehlerantwort, wenn die Anfrage nicht von einem berechtigten lokalen Client stammt."""
+        if not _lokaler_host(koepfe.get("host", "")):
+            return "403 Forbidden", {"fehler": "Host muss 127.0.0.1 oder localhost sein"}
+        if "origin" in koepfe and not _lokaler_host(koepfe["origin"]):
+            return "403 Forbidden", {"fehler": "fremde Origin"}
+        if not hmac.compare_digest(koepfe.get(STEUER_TOKEN_KOPF, "").encode(), self.token.encode()):
+            return "401 Unauthorized", {"fehler": "Token fehlt oder falsch (X-MySlide-Token)"}
+        return None
+
+    async def _http_befehl(self, methode: str, pfad: str, body: bytes) -> Tuple[str, dict]:
+        name = pfad.split("?", 1)[0].strip("/") or "status"
+        if name not in STEUER_BEFEHLE:
+            return "404 Not Found", {"fehler": f"unbekannter Befehl: {name}"}
+        if methode != ("GET" if name == "status" else "POST"):
+            return "405 Method Not Allowed", {"fehler": "status per GET, alles andere per POST"}
+        try:
+            daten = json.loads(body) if body else {}
+        except ValueError:
+            return "400 Bad Request", {"fehler": "Body ist kein JSON"}
+        antwort = await self._ausfuehren(name, daten if isinstance(daten, dict) else {})
+        return ("400 Bad Request" if "fehler" in antwort else "200 OK"), antwort
+
+    # -- Unix-Socket: {"befehl": "next"} pro Zeile --
+
+    async def _socket_verbindung(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                zeile = await reader.readline()
+                if not zeile:
+                    break
+                try:
+                    daten = json.loads(zeile)
+                    antwort = await self._ausfuehren(str(daten.pop("befehl", "")), daten)
+                except (ValueError, AttributeError):
+                    antwort = {"fehler": "erwartet eine JSON-Zeile mit \"befehl\""}
+                writer.write(json.dumps(antwort, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def benchmark_steuerung(ziel: str, anzahl: int) -> int:
+    """Round-Trip-Latenz von 'status' messen (host:port = HTTP, sonst Unix-Socket)."""
+    host, _, port = ziel.rpartition(":")
+    http = port.isdigit()
+    if http:
+        sock = socket.create_connection((host or "127.0.0.1", int(port)))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        anfrage = (f"GET /status HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+                   f"X-MySlide-Token: {steuer_token()}\r\n\r\n").encode("latin-1")
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(ziel)
+        anfrage = b'{"befehl": "status"}\n'
+    datei = sock.makefile("rb")
+
+    zeiten: List[float] = []
+    try:
+        for _ in range(anzahl):
+            t0 = time.perf_counter()
+            sock.sendall(anfrage)
+            if http:
+                laenge = 0
+                while True:
+                    kopf = datei.readline()
+                    if kopf in (b"\r\n", b""):
+                        break
+                    if kopf.lower().startswith(b"content-length:"):
+                        laenge = int(kopf.split(b":", 1)[1])
+                datei.read(laenge)
+            else:
+                datei.readline()
+            zeiten.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        sock.close()
+
+    zeiten.sort()
+    if not zeiten:
+        return 1
+
+    def p(q: float) -> float:
+        return zeiten[min(len(zeiten) - 1, int(q * len(zeiten)))]
+
+    print(f"{len(zeiten)} Anfragen an {ziel}: p50 {p(0.5):.2f} ms | p95 {p(0.95):.2f} ms | max {zeiten[-1]:.2f} ms")
+    return 0
+
+
+# ---- Hänger-Wächter ---------------------------------------------------------
+
+HAENGER_MS = 1000           # GUI-Thread länger blockiert: als Hänger festhalten (0 = Wächter aus)
+HERZSCHLAG_MS = 50
+HAENGER_SOFORT_MS = 10_000  # dauert ein Hänger so lange, wird er schon währenddessen geschrieben
+HAENGER_STACK_TIEFE = 25
+HAENGER_LOG_BYTES = 1024 * 1024
+HAENGER_LOG_DATEIEN = 3
+
+_DIESE_DATEI = os.path.abspath(__file__)
+
+
+class HaengerWaechter(QObject):
+    """
+    Erkennt eine blockierte Ereignisschleife: ein QTimer im GUI-Thread setzt alle HERZSCHLAG_MS
+    einen Zeitstempel, ein eigener Thread prüft ihn. Bleibt er länger als schwelle_ms aus, wird
+    der Python-Stack des Hauptthreads samt Fensterzustand festgehalten und mit Dauer und Zähler
+    je Stelle ins rotierende Log geschrieben (~/.cache/myslide/haenger.log).
+    """
+
+    def __init__(self, schwelle_ms: int, zustand: Callable[[], Dict[str, str]],
+                 log_pfad: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.schwelle = schwelle_ms / 1000.0
+        self.log_pfad = log_pfad or os.path.join(cache_ordner(), "haenger.log")
+        self._zustand = zustand
+        self._haupt_id = threading.main_thread().ident
+        self._log: Optional[logging.Logger] = None
+        self._lock = threading.Lock()
+        self.stellen: Dict[str, List[float]] = {}  # Stelle -> [Anzahl, Summe s, Max s]
+        self._puls = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(HERZSCHLAG_MS)
+        self._timer.timeout.connect(self._schlag)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._wache, name="haengerwaechter", daemon=True)
+
+    def start(self) -> None:
+        self._puls = time.monotonic()
+        self._timer.start()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        with self._lock:
+            if not self.stellen:
+                return
+            zeilen = sorted(self.stellen.items(), key=lambda kv: -kv[1][1])
+            anzahl = sum(int(w[0]) for _, w in zeilen)
+            summe = sum(w[1] for _, w in zeilen)
+        text = "Zusammenfassung:\n" + "\n".join(
+            f"  {int(n)}× {s:.2f} s (max {m:.2f} s)  {stelle}" for stelle, (n, s, m) in zeilen
+        )
+        self._schreibe(text)
+        print(f"MySlide: {anzahl} Hänger (gesamt {summe:.1f} s), Details in {self.log_pfad}", file=sys.stderr)
+
+    def statistik(self) -> str:
+        with self._lock:
+            werte = list(self.stellen.values())
+        if not werte:
+            return "Hänger: keine"
+        return (f"Hänger: {sum(int(w[0]) for w in werte)} | gesamt {sum(w[1] for w in werte):.1f} s"
+                f" | max {max(w[2] for w in werte):.2f} s")
+
+    @Slot()
+    def _schlag(self) -> None:
+        self._puls = time.monotonic()
+
+    def _wache(self) -> None:
+        seit: Optional[float] = None  # Puls, nach dem der laufende Hänger begann
+        befund = None
+        sofort = False
+        while not self._stop.wait(HERZSCHLAG_MS / 1000.0):
+            puls = self._puls
+            if seit is not None and puls != seit:
+                # Schleife läuft wieder; der verspätete Herzschlag zählt nicht zum Hänger
+                self._melde(max(self.schwelle, puls - seit - HERZSCHLAG_MS / 1000.0), befund, sofort)
+                seit = None
+            alter = time.monotonic() - puls
+            if seit is None and alter >= self.schwelle:
+                seit, befund, sofort = puls, self._befund(), False
+            elif seit is not None and not sofort and alter * 1000.0 >= HAENGER_SOFORT_MS:
+                sofort = True
+                self._schreibe(self._eintrag(alter, befund, None, "dauert an"))
+
+    def _befund(self) -> Tuple[str, str, List[str], Dict[str, str]]:
+        """(Stelle, Vorgang, Stack-Zeilen, Fensterzustand) im Moment der Erkennung."""
+        frame = sys._current_frames().get(self._haupt_id)
+        kette = []
+        while frame is not None:
+            kette.append(frame)
+            frame = frame.f_back
+        kette.reverse()  # außen -> innen
+        stack = traceback.format_list(traceback.extract_stack(kette[-1]))[-HAENGER_STACK_TIEFE:] if kette else []
+        eigene = [f for f in kette if os.path.abspath(f.f_code.co_filename) == _DIESE_DATEI]
+        innen = eigene[-1] if eigene else (kette[-1] if kette else None)
+        stelle = f"{innen.f_code.co_name} (Zeile {innen.f_lineno})" if innen is not None else "?"
+        # äußerste Methode des Fensters: womit war es beschäftigt
+        namen = [getattr(f.f_code, "co_qualname", f.f_code.co_name) for f in kette]
+        vorgang = next((n for n in namen if n.startswith("SlideShowWindow.")), "–")
+        try:
+            zustand = self._zustand()
+        except Exception as e:  # Listen können sich unter dem blockierten Thread gerade ändern
+            zustand = {"Zustand": f"nicht lesbar ({e})"}
+        return stelle, vorgang, stack, zustand
+
+    def _melde(self, dauer: float, befund, schon_geschrieben: bool) -> None:
+        with self._lock:
+            w = self.stellen.setdefault(befund[0], [0, 0.0, 0.0])
+            w[0] += 1
+            w[1] += dauer
+            w[2] = max(w[2], dauer)
+            zaehler = list(w)
+        self._schreibe(self._eintrag(dauer, befund, zaehler, "vorbei" if schon_geschrieben else ""))
+
+    @staticmethod
+    def _eintrag(dauer: float, befund, zaehler: Optional[List[float]], hinweis: str) -> str:
+        stelle, vorgang, stack, zustand = befund
+        kopf = f"Hänger {dauer:.2f} s bei {stelle}"
+        if hinweis:
+            kopf += f" ({hinweis})"
+        if zaehler is not None:
+            kopf += f"  [{int(zaehler[0])}× hier, gesamt {zaehler[1]:.2f} s, max {zaehler[2]:.2f} s]"
+        zeilen = [kopf, f"  Vorgang: {vorgang}"] + [f"  {k}: {v}" for k, v in zustand.items()]
+        if hinweis != "vorbei":
+            zeilen.append("  Stack (Hauptthread):")
+            zeilen += ["  " + z.rstrip("\n").replace("\n", "\n  ") for z in stack]
+        return "\n".join(zeilen)
+
+    def _schreibe(self, text: str) -> None:
+        if self._log is None:
+            self._log = logging.getLogger("myslide.haenger")
+            self._log.propagate = False
+            self._log.setLevel(logging.INFO)
+            try:
+                os.makedirs(os.path.dirname(self.log_pfad), exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    self.log_pfad, maxBytes=HAENGER_LOG_BYTES, backupCount=HAENGER_LOG_DATEIEN, encoding="utf-8"
+                )
+            except OSError as e:
+                print(f"MySlide: Hänger-Log nicht schreibbar ({self.log_pfad}): {e}", file=sys.stderr)
+                handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter("%(asctime)s  %(message)s", "%Y-%m-%d %H:%M:%S"))
+            self._log.addHandler(handler)
+        self._log.info(text)
+
+
 # ---- Hauptfenster -----------------------------------------------------------
 
 class SlideShowWindow(QMainWindow):
-    def __init__(self) -> None:
+    # Worker-Thread -> GUI-Thread: (path, QImage)
+    bild_dekodiert = Signal(object)
+    # Worker-Thread -> GUI-Thread: Ergebnis von bereite_bild_vor
+    bild_vorbereitet = Signal(object)
+    # Bild ist auf einem Ziel sichtbar (Pfad); für Messungen, z. B. den Dauertest
+    inhalt_gezeigt = Signal(str)
+
+    def __init__(self, start: Optional[StartOptionen] = None) -> None:
         super().__init__()
+        start = start or StartOptionen()
         self.setWindowTitle("MySlide")
         self.setMinimumSize(1120, 720)
 
@@ -406,21 +4466,131 @@ class SlideShowWindow(QMainWindow):
         self.playlist: List[MediaItem] = []
         self.play_index: int = -1
 
+        # Quellen (Ordner, Archive, Playlists, Dateien), parallel im Hintergrund eingelesen
+        self._quellen: List[str] = []
+        self._quellen_id = 0
+        self._quellen_scans: List[QuellenScan] = []
+        self._quellen_abspielen = False
+        self._herkunft_zeigen = False
+
+        # Playlist-Import (läuft im Hintergrund, liefert Teile)
+        self._import: Optional[PlaylistImport] = None
+        self._import_id = 0
+        self._import_abspielen = False
+        self._bekannte_pfade: set = set()
+        self._fehlend_in_folge = 0
+
         self.running = False
         self.paused = False
         self._bild_rest_ms: int = 0
 
         self.zufall_an = False
-        self.repeat_an = True
+        self.zufall_seed: int = start.seed if start.seed is not None else seed_zahl(None)
+        self._zufall_bits = 2
+        self._zufall_zyklus = 0
+        self._zufall_verlauf: deque = deque(maxlen=1000)  # nr der zuletzt gezeigten (für Zurück)
+        self._playlist_maske = bytearray()  # 1 = all_items[nr] ist in der Playlist
+        self.filter_index = FilterIndex()
+        self.such_index = TrigrammIndex()
+        self.filter_index.trigramme = self.such_index  # grenzt name:/regex: ein, sobald vollständig
+        # Sortierung: Schlüssel kommen aus dem Hintergrund, nr bleibt dabei unverändert
+        self.sortierung = start.sortierung
+        self.meta = MetadatenIndex()
+        self.meta_scanner = MetadatenScanner(parent=self)
+        self.meta_scanner.teil_fertig.connect(self._on_meta_teil)
+        self.filter_index.werte_quelle = lambda: (self.meta.groesse, self.meta.datum()) if self.meta.fertig else None
+        # Videoprüfung: Dauer/Auflösung je nr, defekte fallen aus der Playlist
+        self.video_info: Dict[int, VideoInfo] = {}
+        self._defekte = 0
+        self.video_pruefer = VideoPruefer(self.meta_scanner.db_pfad, parent=self)
+        self.video_pruefer.teil_fertig.connect(self._on_pruef_teil)
+        self._pruef_timer = QTimer(self)
+        self._pruef_timer.setSingleShot(True)
+        self._pruef_timer.setInterval(300)
+        self._pruef_timer.timeout.connect(self._nach_pruefung)
+        # Lautheit je Video (Pfad → LUFS), gilt ab dem nächsten Start des Clips
+        self.lautheit: Dict[str, Optional[float]] = {}
+        self.lautheits_analyse = LautheitsAnalyse(self.meta_scanner.db_pfad, parent=self)
+        self.lautheits_analyse.gemessen.connect(self._on_lautheit_gemessen)
+        self._laufzeit = (0, 0, 0)  # (Bilder, bekannte Videodauer ms, Videos mit unbekannter Dauer)
+        self._reihenfolge: Optional[array] = None  # nr in Anzeige-Reihenfolge (None = all_items)
+        self._rang: Optional[array] = None         # nr -> Position in _reihenfolge
+        self._items_sortiert: List[MediaItem] = []
+        self._such_timer = QTimer(self)
+        self._such_timer.setInterval(0)
+        self._such_timer.timeout.connect(self._such_index_aufholen)
+        self.filter_text = ""  # erweiterter Filter (Ausdruck), leer = keiner
+        self.duplikate_zusammenfassen = False
+        self._duplikat_suche: Optional[DuplikatSuche] = None
+        self._export: Optional[VideoExport] = None
+        self._duplikat_id = 0
+        self._filter_zusatz = None
+        self.repeat_an = start.schleife
         self.filter_option = "Alles"
         self.dateiname_anzeigen = True
         self.skalierung = "Einpassen"
         self.dunkelmodus = False
 
-        # Bild-Timer
+        # Caches (Größe verwaltet speicher_budget)
+        self.bild_cache = MedienCache("Bilder", speicher_budget)     # path -> dekodiertes QImage
+        self.pixmap_cache = MedienCache("Pixmaps", speicher_budget)  # (path, w, h, modus) -> skaliert
+        self.kachel_cache = MedienCache("Kacheln", speicher_budget)  # (path, stufe, x, y) -> Zoom-Kachel
+        self._aktuell_keys: List[Tuple[MedienCache, object]] = []
+        self._dekodier_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dekodieren")
+        self._dekodierung_laeuft: set = set()
+        self.bild_dekodiert.connect(self._on_bild_dekodiert)
+        self._vorbereitung_laeuft: set = set()
+        self._glaettung_laeuft: set = set()   # pixmap-Keys, deren glatte Fassung im Worker entsteht
+        self._vorschau_keys: set = set()      # pixmap-Keys, die gerade nur die schnelle Fassung zeigen
+        # volle Dekodierung erst, wenn die Folie eine Weile stehen bleibt (schnelles Blättern)
+        self._verweil_auftrag: Optional[Tuple[str, List[QSize], str, str]] = None
+        self._verweil_timer = QTimer(self)
+        self._verweil_timer.setSingleShot(True)
+        self._verweil_timer.setInterval(VERWEILEN_MS)
+        self._verweil_timer.timeout.connect(self._dekodiere_verweilt)
+        self.bild_vorbereitet.connect(self._on_bild_vorbereitet)
+
+        # optional: kommende Medien auf eine lokale Platte kopieren
+        self.staging: Optional[LokalKopien] = None
+        if start.staging_mb > 0:
+            self.staging = LokalKopien(
+                start.staging_ordner or os.path.join(cache_ordner(), "staging"), start.staging_mb * MIB, self
+            )
+            self.staging.kopiert.connect(self._on_lokal_kopiert)
+            QApplication.instance().aboutToQuit.connect(self.staging.stop)
+
+        self._druck_waechter = SpeicherDruckWaechter(self)
+        self._druck_waechter.druck_geaendert.connect(self._on_speicherdruck)
+
+        # Debug-Overlay (F3): jede Quelle liefert eine Zeile
+        self.takt = FolienTakt()
+        self._im_takt = False  # Wechsel kommt vom Takt (nicht vom Benutzer)
+        self._debug_quellen: List[Callable[[], str]] = [speicher_budget.statistik, self.takt.statistik]
+        if self.staging is not None:
+            self._debug_quellen.append(self.staging.statistik)
+        self._debug_timer = QTimer(self)
+        self._debug_timer.timeout.connect(self._refresh_debug_overlay)
+
+        # Hänger-Wächter: blockierte Ereignisschleife mit Stack und Zustand protokollieren
+        self.waechter: Optional[HaengerWaechter] = None
+        if start.haenger_ms > 0:
+            self.waechter = HaengerWaechter(start.haenger_ms, self._haenger_zustand, parent=self)
+            self._debug_quellen.append(self.waechter.statistik)
+            QApplication.instance().aboutToQuit.connect(self.waechter.stop)
+            self.waechter.start()
+
+        # Kiosk-Start: Zeitmessung
+        self._zeitmessung = start.zeitmessung
+        self._erster_inhalt_gemeldet = False
+
+        # Bild-Timer: feuert auf die Fälligkeit aus self.takt, Vorbereitung rechtzeitig davor
         self.bild_timer = QTimer(self)
         self.bild_timer.setSingleShot(True)
-        self.bild_timer.timeout.connect(self.next_item)
+        self.bild_timer.setTimerType(Qt.PreciseTimer)
+        self.bild_timer.timeout.connect(self._on_folie_faellig)
+        self._vorbereitungs_timer = QTimer(self)
+        self._vorbereitungs_timer.setSingleShot(True)
+        self._vorbereitungs_timer.timeout.connect(self._bereite_naechste_folie_vor)
 
         # Player
         self.player = QMediaPlayer(self)
@@ -435,15 +4605,28 @@ class SlideShowWindow(QMainWindow):
         self.bild_label = QLabel("Datei → Ordner öffnen (Strg+O), dann Diashow mit Leertaste starten.")
         self.bild_label.setAlignment(Qt.AlignCenter)
         self.bild_label.setWordWrap(True)
+        self.zoom_ansicht = ZoomAnsicht(self.kachel_cache)
+        self.zoom_ansicht.hide()
+        self._zoom_pausiert = False
 
-        # VideoAreas (normal + vollbild)
+        # VideoAreas (normal + vollbild) an einem Frame-Verteiler: der Player behält seine
+        # Ausgabe, Vollbild an/aus ist nur ein Wechsel der sichtbaren Widgets
         self.video_area = VideoArea(self.player)
-        self.video_area_full = VideoArea(self.player)
+        self.video_area_full = VideoArea(self.player, verteiler=self.video_area.verteiler)
         self.player.setVideoOutput(self.video_area.sink)
+        self._angezeigt: Optional[str] = None  # Pfad des gezeigten Bildes; dekodiert liegt es im bild_cache
+
+        # erstes Video schon während des Fensteraufbaus laden (Pre-Roll)
+        if start.erstes is not None and start.erstes.kind == "video":
+            self.player.setSource(QUrl.fromLocalFile(start.erstes.path))
 
         self.vollbild = VollbildAnzeige(self, self.video_area_full, on_prev=self.prev_item, on_next=self.next_item)
         self.vollbild.finished.connect(self._on_vollbild_closed)
 
+        # Mehrere Bildschirme: weitere Vollbild-Ansichten am selben Frame-Verteiler
+        self.ausgabe_bildschirme: List[int] = list(start.bildschirme)
+        self._zusatz_ansichten: List[VollbildAnzeige] = []
+
         self.overlay = QLabel("")
         self.overlay.setObjectName("overlay")
         self.overlay.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -465,21 +4648,46 @@ class SlideShowWindow(QMainWindow):
             va.video.hovered.connect(self._on_video_hover)
             va.video.moved.connect(self._on_video_move)
             va.seekbar.hover_changed.connect(self._on_seek_hover)
+            if self._zeitmessung:
+                va.sink.videoFrameChanged.connect(self._on_erster_video_frame)
 
         self._build_menubar()
         self._build_ui()
         self._apply_styles()
         apply_light_palette(QApplication.instance())
 
-        self.repeat_btn.setChecked(True)
-        self.zufall_btn.setChecked(False)
-        self.interval_spin.setValue(0)
+        self.repeat_btn.setChecked(start.schleife)
+        self.zufall_btn.setChecked(start.zufall)
+        self.interval_spin.setValue(start.intervall)
+        self._filter_combo.setCurrentText(start.filter_option)
 
         self._rebuild_playlist()
         self._update_status("Bereit")
 
         self.menuBar().installEventFilter(self)
 
+        self._steuerung: Optional[SteuerServer] = None
+        if start.steuer_port or start.steuer_socket:
+            self._steuerung = SteuerServer(start.steuer_port, start.steuer_socket, self)
+            self._steuerung.befehl_empfangen.connect(self._on_steuer_befehl)
+            self._steuerung.start()
+            QApplication.instance().aboutToQuit.connect(self._steuerung.stop)
+            self._debug_quellen.append(
+                lambda: f"Steuerung: {self._steuerung.adresse()} | Befehle: {self._steuerung.anzahl_befehle}"
+            )
+
+        if start.ordner:
+            if start.erstes_bild is not None:
+                # wartet höchstens noch den Rest der Dekodierung ab
+                path, img = start.erstes_bild.result()
+                if not img.isNull():
+                    self.bild_cache.lege_ab(path, img, PRIO_AKTUELL)
+            self.current_dir = start.ordner[0] if os.path.isdir(start.ordner[0]) else os.path.dirname(start.ordner[0])
+            self.folder_label.setText("\n".join(start.ordner))
+            self._load_folders(start.ordner, items=start.items, ausgewaehlt=start.ausgewaehlt)
+        elif start.playlist:
+            self.importiere_playlist(start.playlist, abspielen=start.abspielen)
+
     # ---- Menü ----------------------------------------------------------------
 
     def _build_menubar(self) -> None:
@@ -491,6 +4699,29 @@ class SlideShowWindow(QMainWindow):
         act_open.triggered.connect(self.choose_folder)
         m_file.addAction(act_open)
 
+        act_archiv = QAction("Archiv öffnen…", self)
+        act_archiv.triggered.connect(self.choose_archiv)
+        m_file.addAction(act_archiv)
+
+        act_ordner_dazu = QAction("Ordner hinzufügen…", self)
+        act_ordner_dazu.setShortcut(QKeySequence("Ctrl+Shift+A"))
+        act_ordner_dazu.triggered.connect(self.choose_quelle_hinzufuegen)
+        m_file.addAction(act_ordner_dazu)
+
+        act_dateien_dazu = QAction("Dateien hinzufügen…", self)
+        act_dateien_dazu.triggered.connect(self.choose_dateien_hinzufuegen)
+        m_file.addAction(act_dateien_dazu)
+
+        act_pl_open = QAction("Playlist öffnen…", self)
+        act_pl_open.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        act_pl_open.triggered.connect(self.choose_playlist)
+        m_file.addAction(act_pl_open)
+
+        act_pl_save = QAction("Playlist speichern…", self)
+        act_pl_save.setShortcut(QKeySequence("Ctrl+Shift+S"))
+        act_pl_save.triggered.connect(self.save_playlist)
+        m_file.addAction(act_pl_save)
+
         act_quit = QAction("Beenden", self)
         act_quit.setShortcut(QKeySequence("Ctrl+Q"))
         act_quit.triggered.connect(self.close)
@@ -499,13 +4730,29 @@ class SlideShowWindow(QMainWindow):
 
         m_set = mb.addMenu("Einstellungen")
 
+        act_mischen = QAction("Neu mischen", self)
+        act_mischen.triggered.connect(self._neu_mischen)
+        m_set.addAction(act_mischen)
+
         m_filter = m_set.addMenu("Filter")
-        self._add_combo_to_menu_no_label(
+        self._filter_combo = self._add_combo_to_menu_no_label(
             m_filter,
-            items=["Alles", "Nur ausgewähltes", "Nur Bilder", "Nur Videos"],
+            items=FILTER_OPTIONEN,
             current=self.filter_option,
             on_change=self._set_filter,
         )
+        m_sort = m_set.addMenu("Sortierung")
+        self._sort_combo = self._add_combo_to_menu_no_label(
+            m_sort,
+            items=SORTIERUNGEN,
+            current=self.sortierung,
+            on_change=self._set_sortierung,
+        )
+
+        act_filter = QAction("Erweiterter Filter…", self)
+        act_filter.setShortcut(QKeySequence("Ctrl+F"))
+        act_filter.triggered.connect(self.erweiterter_filter)
+        m_filter.addAction(act_filter)
 
         m_view = m_set.addMenu("Anzeige")
         act_dark = QAction("Dunkelmodus", self, checkable=True)
@@ -526,11 +4773,46 @@ class SlideShowWindow(QMainWindow):
             on_change=self._set_skalierung,
         )
 
+        self.act_zoom = QAction("Zoom/Pan (große Bilder)", self, checkable=True)
+        self.act_zoom.setShortcut(QKeySequence("Z"))
+        self.act_zoom.triggered.connect(self._set_zoom)
+        m_view.addAction(self.act_zoom)
+
         act_fs = QAction("Vollbild (nur Medium) umschalten", self)
         act_fs.triggered.connect(self.toggle_vollbild)
         m_view.addSeparator()
         m_view.addAction(act_fs)
 
+        self.menu_bildschirme = m_view.addMenu("Vollbild auf Bildschirmen")
+        self.menu_bildschirme.aboutToShow.connect(self._fuelle_bildschirm_menue)
+
+        self.act_debug = QAction("Debug-Overlay", self, checkable=True)
+        self.act_debug.setShortcut(QKeySequence("F3"))
+        self.act_debug.triggered.connect(lambda on: self._set_debug_overlay(on))
+        m_view.addAction(self.act_debug)
+
+        act_suche = QAction("Suchen", self)
+        act_suche.setShortcut(QKeySequence("Ctrl+K"))
+        act_suche.triggered.connect(lambda: (self.such_feld.setFocus(), self.such_feld.selectAll()))
+        self.addAction(act_suche)
+
+        m_extras = mb.addMenu("Extras")
+        act_dup = QAction("Duplikate suchen…", self)
+        act_dup.triggered.connect(self.duplikate_suchen)
+        m_extras.addAction(act_dup)
+        self.act_duplikate = QAction("Duplikate in der Playlist zusammenfassen", self, checkable=True)
+        self.act_duplikate.setEnabled(False)
+        self.act_duplikate.triggered.connect(self._set_duplikate_zusammenfassen)
+        m_extras.addAction(self.act_duplikate)
+        m_extras.addSeparator()
+        act_export = QAction("Als Video exportieren…", self)
+        act_export.triggered.connect(self.video_exportieren)
+        m_extras.addAction(act_export)
+        self.act_export_abbrechen = QAction("Export abbrechen", self)
+        self.act_export_abbrechen.setEnabled(False)
+        self.act_export_abbrechen.triggered.connect(self._export_abbrechen)
+        m_extras.addAction(self.act_export_abbrechen)
+
         self.menu_hilfe = mb.addMenu("Hilfe")
 
     def _add_combo_to_menu(self, menu: QMenu, label: str, items: List[str], current: str, on_change) -> None:
@@ -550,7 +4832,7 @@ class SlideShowWindow(QMainWindow):
         act.setDefaultWidget(w)
         menu.addAction(act)
 
-    def _add_combo_to_menu_no_label(self, menu: QMenu, items: List[str], current: str, on_change) -> None:
+    def _add_combo_to_menu_no_label(self, menu: QMenu, items: List[str], current: str, on_change) -> QComboBox:
         w = QWidget()
         lay = QHBoxLayout(w)
         lay.setContentsMargins(10, 6, 10, 6)
@@ -564,6 +4846,7 @@ class SlideShowWindow(QMainWindow):
         act = QWidgetAction(menu)
         act.setDefaultWidget(w)
         menu.addAction(act)
+        return combo
 
     # ---- UI ------------------------------------------------------------------
 
@@ -591,6 +4874,7 @@ class SlideShowWindow(QMainWindow):
 
         self.prev_btn = tbtn(self.style().standardIcon(QStyle.SP_MediaSkipBackward), "Zurück (Pfeil links)")
         self.play_btn = tbtn(self.style().standardIcon(QStyle.SP_MediaPlay), "Start/Pause/Weiter (Leertaste)")
+        self._play_icon_pause = False
         self.stop_btn = tbtn(self.style().standardIcon(QStyle.SP_MediaStop), "Stopp (Strg+S)")
         self.next_btn = tbtn(self.style().standardIcon(QStyle.SP_MediaSkipForward), "Weiter (Pfeil rechts)")
 
@@ -638,10 +4922,16 @@ class SlideShowWindow(QMainWindow):
         self.mute_cb = QCheckBox("Stumm")
         self.mute_cb.stateChanged.connect(self._on_mute_changed)
 
+        self.angleichen_cb = QCheckBox("Angleichen")
+        self.angleichen_cb.setChecked(True)
+        self.angleichen_cb.setToolTip("Lautstärke der Videos angleichen (gemessene Lautheit)")
+        self.angleichen_cb.toggled.connect(self._on_angleichen_changed)
+
         vol_l.addStretch(1)
         vol_l.addWidget(self.vol_label)
         vol_l.addWidget(self.vol_slider)
         vol_l.addWidget(self.mute_cb)
+        vol_l.addWidget(self.angleichen_cb)
         vol_l.addStretch(1)
         outer.addWidget(vol_row)
 
@@ -656,13 +4946,27 @@ class SlideShowWindow(QMainWindow):
         self.folder_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.folder_label.setObjectName("folderLabel")
 
+        self.such_feld = QLineEdit()
+        self.such_feld.setPlaceholderText("Suchen… (Strg+K)")
+        self.such_feld.setClearButtonEnabled(True)
+        self.such_feld.textChanged.connect(self._suche)
+        self.such_feld.returnPressed.connect(self._such_treffer_abspielen)
+
+        self.treffer_liste = QListWidget()
+        self.treffer_liste.setSelectionMode(QListWidget.SingleSelection)
+        self.treffer_liste.itemSelectionChanged.connect(self._on_treffer_auswahl)
+        self.treffer_liste.itemChanged.connect(self._on_treffer_geaendert)
+        self.treffer_liste.itemDoubleClicked.connect(self._on_treffer_doppelklick)
+        self.treffer_liste.hide()
+        self.treffer_label = QLabel("")
+        self.treffer_label.hide()
+
         self.listw = DropListe()
         self.listw.setSelectionMode(QListWidget.SingleSelection)
         self.listw.itemSelectionChanged.connect(self._on_list_selection_changed)
-        self.listw.itemChanged.connect(lambda _: self._rebuild_playlist())
+        self.listw.itemChanged.connect(self._on_item_changed)
         self.listw.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.listw.ordner_fallen_gelassen.connect(self._drop_ordner)
-        self.listw.dateien_fallen_gelassen.connect(self._drop_dateien)
+        self.listw.fallen_gelassen.connect(self._drop_quellen)
 
         self.interval_spin = QSpinBox()
         self.interval_spin.setRange(0, 3600)
@@ -670,6 +4974,9 @@ class SlideShowWindow(QMainWindow):
         self.interval_spin.setToolTip("Bilder-Intervall. 0 = 10 Sekunden. Gilt NICHT für Videos.")
 
         left_l.addWidget(self.folder_label)
+        left_l.addWidget(self.such_feld)
+        left_l.addWidget(self.treffer_label)
+        left_l.addWidget(self.treffer_liste, 1)
         left_l.addWidget(self.listw, 1)
         left_l.addWidget(QLabel("Bild-Intervall (Timer):"))
         left_l.addWidget(self.interval_spin)
@@ -682,12 +4989,12 @@ class SlideShowWindow(QMainWindow):
         right_l.addWidget(self.overlay)
 
         self.drop_viewer = DropBereich()
-        self.drop_viewer.ordner_fallen_gelassen.connect(self._drop_ordner)
-        self.drop_viewer.dateien_fallen_gelassen.connect(self._drop_dateien)
+        self.drop_viewer.fallen_gelassen.connect(self._drop_quellen)
 
         viewer_l = QVBoxLayout(self.drop_viewer)
         viewer_l.setContentsMargins(0, 0, 0, 0)
         viewer_l.addWidget(self.bild_label, 1)
+        viewer_l.addWidget(self.zoom_ansicht, 1)
         viewer_l.addWidget(self.video_area, 1)
 
         right_l.addWidget(self.drop_viewer, 1)
@@ -702,6 +5009,8 @@ class SlideShowWindow(QMainWindow):
         self.status = self.statusBar()
         self.video_area.hide()
 
+        self.debug_overlay = DebugOverlay(self.drop_viewer)
+
         self._setup_shortcuts()
 
     def _apply_styles(self) -> None:
@@ -858,6 +5167,62 @@ class SlideShowWindow(QMainWindow):
         self.skalierung = text
         self._rescale_current()
 
+    # ---- Debug-Overlay / Speicher ---------------------------------------------
+
+    @Slot()
+    def toggle_debug_overlay(self) -> None:
+        self._set_debug_overlay(not self.act_debug.isChecked())
+
+    def _set_debug_overlay(self, on: bool) -> None:
+        self.act_debug.setChecked(on)
+        if on:
+            self._refresh_debug_overlay()
+            self._debug_timer.start(1000)
+        else:
+            self._debug_timer.stop()
+            self.debug_overlay.hide()
+            for a in self._vollbild_ansichten():
+                a.debug_overlay.hide()
+
+    def _haenger_zustand(self) -> Dict[str, str]:
+        """Was das Fenster gerade tut; läuft im Wächter-Thread, liest daher nur Python-Attribute."""
+        i, playlist = self.play_index, self.playlist
+        item = playlist[i] if 0 <= i < len(playlist) else None
+        ausstehend = []
+        if self._dekodierung_laeuft:
+            ausstehend.append(f"Dekodierung ×{len(self._dekodierung_laeuft)}")
+        if self._glaettung_laeuft:
+            ausstehend.append(f"Glättung ×{len(self._glaettung_laeuft)}")
+        if self._verweil_auftrag is not None:
+            ausstehend.append("Dekodierung nach Verweilen")
+        if self._quellen_scans:
+            ausstehend.append("Quellen laden")
+        if self._import is not None:
+            ausstehend.append("Playlist-Import")
+        if self._duplikat_suche is not None:
+            ausstehend.append("Duplikatsuche")
+        if self._export is not None:
+            ausstehend.append("Video-Export")
+        return {
+            "Medium": f"{item.path} ({item.kind})" if item is not None else "–",
+            "Position": f"{i + 1}/{len(playlist)}",
+            "Diashow": ("pausiert" if self.paused else "läuft") if self.running else "steht",
+            "Ausstehend": ", ".join(ausstehend) or "–",
+        }
+
+    @Slot()
+    def _refresh_debug_overlay(self) -> None:
+        zeilen = [quelle() for quelle in self._debug_quellen]
+        for ov in [self.debug_overlay] + [a.debug_overlay for a in self._vollbild_ansichten()]:
+            ov.setze_zeilen(zeilen)
+            ov.show()
+
+    @Slot(bool)
+    def _on_speicherdruck(self, an: bool) -> None:
+        speicher_budget.setze_druck(an)
+        if an:
+            self._update_status("Speicher knapp – Caches verkleinert")
+
     # ---- Vollbild ------------------------------------------------------------
 
     @Slot()
@@ -868,58 +5233,180 @@ class SlideShowWindow(QMainWindow):
             self._enter_vollbild()
 
     def _enter_vollbild(self) -> None:
-        pos = self.player.position()
-        st = self.player.playbackState()
-        was_playing = (st == QMediaPlayer.PlayingState)
-
-        self.vollbild.showFullScreen()
+        self._beende_zoom()
+        screens = self._ausgabe_screens()
+        if screens:
+            self._zeige_auf_screen(self.vollbild, screens[0])
+            for scr in screens[1:]:
+                self._zeige_auf_screen(self._neue_zusatz_ansicht(), scr)
+        else:
+            self.vollbild.showFullScreen()
         self.vollbild.raise_()
         self.vollbild.setFocus()
-
-        # Inhalt im Vollbild anzeigen
-        self._render_current(autoplay=(self.running and not self.paused))
-
-        if self._current_kind() == "video" and self.player.source().isValid():
-            self.player.setVideoOutput(self.video_area_full.sink)
-            self.player.setPosition(pos)
-            if was_playing and self.running and not self.paused:
-                self.player.play()
-            else:
-                self.player.pause()
+        self._zeige_aktuellen_inhalt()
 
     def _leave_vollbild(self) -> None:
         if not self.vollbild.isVisible():
             return
-        pos = self.player.position()
-        st = self.player.playbackState()
-        was_playing = (st == QMediaPlayer.PlayingState)
-
         self.vollbild.close()
 
-        if self._current_kind() == "video" and self.player.source().isValid():
-            self.player.setVideoOutput(self.video_area.sink)
-            self.player.setPosition(pos)
-            if was_playing and self.running and not self.paused:
-                self.player.play()
-            else:
-                self.player.pause()
-
     @Slot()
     def _on_vollbild_closed(self) -> None:
-        if self._current_kind() == "video" and self.player.source().isValid():
-            pos = self.player.position()
-            st = self.player.playbackState()
-            self.player.setVideoOutput(self.video_area.sink)
-            self.player.setPosition(pos)
-            if st == QMediaPlayer.PlayingState and self.running and not self.paused:
-                self.player.play()
-        self._active_seekbar().hide()
+        self._schliesse_zusatz_ansichten()
+        self.video_area_full.seekbar.hide()
+        self._zeige_aktuellen_inhalt()
+
+    def _zeige_aktuellen_inhalt(self) -> None:
+        """
+        Aktuelles Medium in den jetzt aktiven Ansichten zeigen, ohne Plattenzugriff,
+        Seek oder Quellwechsel: Bilder aus dem schon dekodierten QImage, Videos laufen
+        über den gemeinsamen Frame-Verteiler einfach weiter.
+        """
+        item = self.playlist[self.play_index] if 0 <= self.play_index < len(self.playlist) else None
+        vollbild = self.vollbild.isVisible()
+        if vollbild:
+            ziele = [(a.bild_label, a.video_area) for a in self._vollbild_ansichten()]
+        else:
+            ziele = [(self.bild_label, self.video_area)]
+        ist_video = item is not None and item.kind == "video" and self.player.source().isValid()
+        for lbl, va in ziele:
+            lbl.setVisible(not ist_video)
+            va.setVisible(ist_video)
+        if ist_video:
+            return
+        img = self._angezeigtes_bild(item)
+        if img is not None:
+            for lbl, _ in ziele:
+                QTimer.singleShot(0, lambda lbl=lbl: self._set_pixmap_scaled(lbl, item.path, img))
+        else:
+            # Hinweistexte (Datei fehlt, nicht unterstützt …) übernehmen
+            text = (self.bild_label if vollbild else self.vollbild.bild_label).text()
+            for lbl, _ in ziele:
+                lbl.setText(text)
 
     @Slot()
     def _escape_vollbild(self) -> None:
         if self.vollbild.isVisible():
             self._leave_vollbild()
 
+    # ---- Mehrere Bildschirme -------------------------------------------------
+
+    def _vollbild_ansichten(self) -> List[VollbildAnzeige]:
+        return [self.vollbild] + self._zusatz_ansichten
+
+    def _ausgabe_screens(self) -> list:
+        alle = QApplication.screens()
+        return [alle[i] for i in self.ausgabe_bildschirme if 0 <= i < len(alle)]
+
+    @staticmethod
+    def _zeige_auf_screen(ansicht: QDialog, screen) -> None:
+        ansicht.setScreen(screen)
+        ansicht.setGeometry(screen.geometry())
+        ansicht.showFullScreen()
+
+    def _neue_zusatz_ansicht(self) -> VollbildAnzeige:
+        # eigene Widgets, aber derselbe Frame-Verteiler -> nur eine Video-Dekodierung
+        va = VideoArea(self.player, verteiler=self.video_area_full.verteiler)
+        ansicht = VollbildAnzeige(self, va, on_prev=self.prev_item, on_next=self.next_item)
+        ansicht.finished.connect(self._leave_vollbild)
+        if self.act_debug.isChecked():
+            ansicht.debug_overlay.show()
+        self._zusatz_ansichten.append(ansicht)
+        return ansicht
+
+    def _schliesse_zusatz_ansichten(self) -> None:
+        ansichten, self._zusatz_ansichten = self._zusatz_ansichten, []
+        for a in ansichten:
+            a.blockSignals(True)
+            a.close()
+            a.deleteLater()
+
+    @Slot()
+    def _fuelle_bildschirm_menue(self) -> None:
+        self.menu_bildschirme.clear()
+        for i, scr in enumerate(QApplication.screens()):
+            geo = scr.geometry()
+            act = QAction(f"{i + 1}: {scr.name()} ({geo.width()}×{geo.height()})", self.menu_bildschirme, checkable=True)
+            act.setChecked(i in self.ausgabe_bildschirme)
+            act.triggered.connect(lambda on, i=i: self._set_ausgabe_bildschirm(i, on))
+            self.menu_bildschirme.addAction(act)
+
+    def _set_ausgabe_bildschirm(self, index: int, on: bool) -> None:
+        if on and index not in self.ausgabe_bildschirme:
+            self.ausgabe_bildschirme.append(index)
+            self.ausgabe_bildschirme.sort()
+        elif not on and index in self.ausgabe_bildschirme:
+            self.ausgabe_bildschirme.remove(index)
+        if self.vollbild.isVisible():
+            # neu aufbauen, damit die Auswahl sofort gilt
+            self._leave_vollbild()
+            self._enter_vollbild()
+
+    # ---- Fernsteuerung --------------------------------------------------------
+
+    @Slot(object)
+    def _on_steuer_befehl(self, auftrag) -> None:
+        name, daten, antworte = auftrag
+        try:
+            if name == "toggle":
+                self.toggle_space_action()
+            elif name == "next":
+                self.next_item()
+            elif name == "prev":
+                self.prev_item()
+            elif name == "stop":
+                self.stop_slideshow()
+            elif name == "laden":
+                ordner = daten.get("ordner", "")
+                pfade = [os.path.abspath(str(p)) for p in (ordner if isinstance(ordner, list) else [ordner])]
+                fehlend = [p for p in pfade if not os.path.exists(p)]
+                if fehlend or not pfade:
+                    antworte({"fehler": f"nicht gefunden: {', '.join(fehlend)}"})
+                    return
+                hinzufuegen = bool(daten.get("hinzufuegen"))
+                self.lade_quellen(pfade, hinzufuegen=hinzufuegen, abspielen=bool(daten.get("start")) and not hinzufuegen)
+                if hinzufuegen and daten.get("start") and not self.running:
+                    self.toggle_space_action()
+        except Exception as e:
+            antworte({"fehler": str(e)})
+            return
+        antworte(self._steuer_status())
+
+    def _steuer_status(self) -> dict:
+        item = self.playlist[self.play_index] if 0 <= self.play_index < len(self.playlist) else None
+        return {
+            "laeuft": self.running,
+            "pausiert": self.paused,
+            "index": self.play_index,
+            "anzahl": len(self.playlist),
+            "datei": item.path if item else None,
+            "art": item.kind if item else None,
+            "ordner": self.current_dir,
+            "zufall": self.zufall_an,
+            "schleife": self.repeat_an,
+            "filter": self.filter_option,
+            "vollbild": self.vollbild.isVisible(),
+        }
+
+    def closeEvent(self, e) -> None:
+        if self._steuerung is not None:
+            self._steuerung.stop()
+        super().closeEvent(e)
+
+    # ---- Kiosk-Start ---------------------------------------------------------
+
+    def starte(self, vollbild: bool, abspielen: bool) -> None:
+        """Nach show(): optional sofort abspielen und/oder ins Vollbild."""
+        if abspielen and self.playlist:
+            self.running = True
+            self.paused = False
+        if vollbild:
+            self._enter_vollbild()
+        elif self.running:
+            self._render_current(autoplay=True)
+        self._update_play_icon()
+        self._update_status("Wiedergabe" if self.running else "Bereit")
+
     # ---- Space Toggle --------------------------------------------------------
 
     @Slot()
@@ -953,7 +5440,7 @@ class SlideShowWindow(QMainWindow):
     def _pause_everything(self) -> None:
         self.paused = True
         if self._current_kind() == "bild":
-            self._bild_rest_ms = max(0, int(self.bild_timer.remainingTime())) if self.bild_timer.isActive() else self._interval_ms()
+            self._bild_rest_ms = self.takt.aussetzen() if self.bild_timer.isActive() else self._interval_ms()
             self.bild_timer.stop()
         if self._current_kind() == "video" and self.player.source().isValid():
             self.player.pause()
@@ -962,15 +5449,16 @@ class SlideShowWindow(QMainWindow):
         self.paused = False
         if self._current_kind() == "bild":
             rest = self._bild_rest_ms if self._bild_rest_ms > 0 else self._interval_ms()
-            self.bild_timer.start(rest)
+            self._plane_folie(rest)
         if self._current_kind() == "video" and self.player.source().isValid():
             self.player.play()
 
     def _update_play_icon(self) -> None:
-        if not self.running or self.paused:
-            self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        else:
-            self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        pause = self.running and not self.paused
+        if pause == self._play_icon_pause:
+            return  # ein neues QIcon je Folie füllt sonst den Pixmap-Cache (RSS wächst im Dauerbetrieb)
+        self._play_icon_pause = pause
+        self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPause if pause else QStyle.SP_MediaPlay))
 
     # ---- Stop ----------------------------------------------------------------
 
@@ -996,16 +5484,24 @@ class SlideShowWindow(QMainWindow):
         self.player.stop()
         self._active_seekbar().hide()
 
-        self.play_index = 0 if self.play_index < 0 else self.play_index + 1
-        if self.play_index >= len(self.playlist):
-            if self.repeat_an:
-                self.play_index = 0
-            else:
-                self.running = False
-                self.paused = False
-                self._update_play_icon()
-                self._update_status("Ende erreicht")
-                return
+        if self.zufall_an:
+            naechste = self._zufall_position(+1)
+            if naechste is not None:
+                if 0 <= self.play_index < len(self.playlist):
+                    self._zufall_verlauf.append(self.playlist[self.play_index].nr)
+                self.play_index = naechste
+        else:
+            naechste = 0 if self.play_index < 0 else self.play_index + 1
+            if naechste >= len(self.playlist):
+                naechste = 0 if self.repeat_an else None
+            if naechste is not None:
+                self.play_index = naechste
+        if naechste is None:
+            self.running = False
+            self.paused = False
+            self._update_play_icon()
+            self._update_status("Ende erreicht")
+            return
 
         self._render_current(autoplay=(self.running and not self.paused))
         self._update_play_icon()
@@ -1018,13 +5514,56 @@ class SlideShowWindow(QMainWindow):
         self.player.stop()
         self._active_seekbar().hide()
 
-        self.play_index = 0 if self.play_index < 0 else self.play_index - 1
-        if self.play_index < 0:
-            self.play_index = (len(self.playlist) - 1) if self.repeat_an else 0
+        if self.zufall_an:
+            vorige = self._zufall_zurueck()
+            if vorige is not None:
+                self.play_index = vorige
+        else:
+            self.play_index = 0 if self.play_index < 0 else self.play_index - 1
+            if self.play_index < 0:
+                self.play_index = (len(self.playlist) - 1) if self.repeat_an else 0
 
         self._render_current(autoplay=(self.running and not self.paused))
         self._update_play_icon()
 
+    # ---- Zufall --------------------------------------------------------------
+
+    def _zufall_position(self, richtung: int, von_pos: Optional[int] = None,
+                         zyklus: Optional[int] = None, merken: bool = True) -> Optional[int]:
+        pos = self.play_index if von_pos is None else von_pos
+        zyk = self._zufall_zyklus if zyklus is None else zyklus
+        nr = self.playlist[pos].nr if 0 <= pos < len(self.playlist) else None
+        res = zufall_schritt(
+            self.playlist, self._playlist_maske, len(self.all_items), self._zufall_bits,
+            self.zufall_seed, pos, nr, zyk, richtung, self.repeat_an, self._rang,
+        )
+        if res is None:
+            return None
+        if merken:
+            self._zufall_zyklus = res[1]
+        return res[0]
+
+    def _zufall_zurueck(self) -> Optional[int]:
+        # zuerst der echte Verlauf (auch nach Sprüngen per Doppelklick), sonst rückwärts permutieren
+        while self._zufall_verlauf:
+            nr = self._zufall_verlauf.pop()
+            if nr < len(self._playlist_maske) and self._playlist_maske[nr]:
+                return self._playlist_position(nr)
+        return self._zufall_position(-1)
+
+    def _playlist_position(self, nr: int) -> int:
+        rang = self._rang
+        if rang is None:
+            return bisect.bisect_left(self.playlist, nr, key=lambda m: m.nr)
+        return bisect.bisect_left(self.playlist, rang[nr], key=lambda m: rang[m.nr])
+
+    @Slot()
+    def _neu_mischen(self) -> None:
+        self.zufall_seed = seed_zahl(None)
+        self._zufall_zyklus = 0
+        self._zufall_verlauf.clear()
+        self._update_status("Neu gemischt")
+
     # ---- Doppelklick ---------------------------------------------------------
 
     @Slot(QListWidgetItem)
@@ -1032,6 +5571,8 @@ class SlideShowWindow(QMainWindow):
         path = it.data(Qt.UserRole)
         if not path:
             return
+        if self.zufall_an and 0 <= self.play_index < len(self.playlist):
+            self._zufall_verlauf.append(self.playlist[self.play_index].nr)
         self._rebuild_playlist()
         for idx, m in enumerate(self.playlist):
             if m.path == path:
@@ -1048,29 +5589,12 @@ class SlideShowWindow(QMainWindow):
 
     # ---- Drag&Drop -----------------------------------------------------------
 
-    @Slot(str)
-    def _drop_ordner(self, folder: str) -> None:
-        self.current_dir = folder
-        self.folder_label.setText(folder)
-        self._load_folder(folder)
-
-    @Slot(list)
-    def _drop_dateien(self, files: list) -> None:
-        if not files:
-            return
-        first = files[0]
-        folder = os.path.dirname(first)
-        self.current_dir = folder
-        self.folder_label.setText(folder)
-        self._load_folder(folder)
-
-        wanted = set(os.path.abspath(p) for p in files)
-        for i in range(self.listw.count()):
-            it = self.listw.item(i)
-            p = os.path.abspath(it.data(Qt.UserRole))
-            if p in wanted:
-                self.listw.setCurrentRow(i)
-                it.setCheckState(Qt.Checked)
+    @Slot(list, bool)
+    def _drop_quellen(self, pfade: list, hinzufuegen: bool) -> None:
+        if not hinzufuegen and len(pfade) == 1 and is_playlist(pfade[0]):
+            self.importiere_playlist(pfade[0])  # einzelne (evtl. riesige) Playlist gestreamt
+            return
+        self.lade_quellen(pfade, hinzufuegen=hinzufuegen)
 
     # ---- Ordner/Laden --------------------------------------------------------
 
@@ -1083,31 +5607,134 @@ class SlideShowWindow(QMainWindow):
         self.folder_label.setText(d)
         self._load_folder(d)
 
+    @Slot()
+    def choose_archiv(self) -> None:
+        pfad, _ = QFileDialog.getOpenFileName(
+            self, "Archiv öffnen", self.current_dir or os.path.expanduser("~"),
+            "Archive (*.zip *.cbz *.tar *.cbt);;Alle Dateien (*)",
+        )
+        if not pfad:
+            return
+        self.current_dir = os.path.dirname(pfad)
+        self.folder_label.setText(pfad)
+        self._load_folder(pfad)
+
     def _load_folder(self, folder: str) -> None:
+        self.lade_quellen([folder])
+
+    @Slot()
+    def choose_quelle_hinzufuegen(self) -> None:
+        d = QFileDialog.getExistingDirectory(self, "Ordner hinzufügen", self.current_dir or os.path.expanduser("~"))
+        if d:
+            self.lade_quellen([d], hinzufuegen=True)
+
+    @Slot()
+    def choose_dateien_hinzufuegen(self) -> None:
+        endungen = " ".join("*" + e for e in sorted(IMAGE_EXTS | VIDEO_EXTS | ARCHIV_EXTS))
+        pfade, _ = QFileDialog.getOpenFileNames(
+            self, "Dateien hinzufügen", self.current_dir or os.path.expanduser("~"),
+            f"Medien ({endungen} *.m3u8 *.m3u *.json);;Alle Dateien (*)",
+        )
+        if pfade:
+            self.lade_quellen(pfade, hinzufuegen=True)
+
+    def lade_quellen(self, pfade: List[str], hinzufuegen: bool = False, abspielen: bool = False) -> None:
+        """
+        Ordner, Archive, Playlists und einzelne Dateien parallel im Hintergrund einlesen.
+        hinzufuegen: an die laufende Show anhängen (ohne sie anzuhalten), sonst ersetzen.
+        """
+        pfade = [os.path.abspath(p) for p in pfade]
+        if not hinzufuegen:
+            self._import_abbrechen()
+            self._quellen_abbrechen()
+            self.stop_slideshow()
+            self._leere_items()
+            self.playlist = []
+            self._playlist_maske = bytearray()
+            self.play_index = -1
+            self.listw.clear()
+            self._quellen = []
+        neu = [p for p in pfade if p not in self._quellen]
+        if not neu:
+            return
+        self._quellen.extend(neu)
+        erste = neu[0] if os.path.isdir(neu[0]) else os.path.dirname(neu[0])
+        self.current_dir = self.current_dir if hinzufuegen and self.current_dir else erste
+        self.folder_label.setText("\n".join(self._quellen))
+        self._quellen_abspielen = abspielen
+        scan = QuellenScan(neu, self._quellen_id, self)
+        scan.teil_geladen.connect(self._on_quellen_teil)
+        scan.fertig.connect(self._on_quellen_fertig)
+        self._quellen_scans.append(scan)
+        scan.start()
+        self._update_status("Quellen werden geladen…")
+
+    def _quellen_abbrechen(self) -> None:
+        self._quellen_id += 1
+        for scan in self._quellen_scans:
+            scan.abbrechen()
+        self._quellen_scans.clear()
+
+    @Slot(object)
+    def _on_quellen_teil(self, daten) -> None:
+        scan_id, items = daten
+        if scan_id != self._quellen_id:
+            return
+        erster = not self.playlist
+        self._haenge_items_an(items)
+        if not self._herkunft_zeigen and self._mehrere_quellen():
+            self._herkunft_zeigen = True  # ab der zweiten Quelle zeigt die Liste die Herkunft
+            self._fuelle_liste()
+        if erster and self.playlist:
+            if self._quellen_abspielen:
+                self.running = True
+                self.paused = False
+            self._render_current(autoplay=self.running and not self.paused)
+            self._update_play_icon()
+        self._update_status(f"Quellen werden geladen… ({len(self.all_items)})")
+
+    @Slot(object)
+    def _on_quellen_fertig(self, daten) -> None:
+        scan_id, anzahl, fehler = daten
+        self._quellen_scans = [s for s in self._quellen_scans if s is not self.sender()]
+        if scan_id != self._quellen_id:
+            return
+        if self.meta.fertig and self.sortierung != "Ladefolge":
+            self._sortiere()
+        if fehler:
+            QMessageBox.critical(self, "Fehler", "Quelle konnte nicht gelesen werden:\n" + "\n".join(fehler))
+        self._update_status(f"{len(self.all_items)} Medien aus {len(self._quellen)} Quelle(n) geladen")
+
+    def _mehrere_quellen(self) -> bool:
+        erste = self.all_items[0].quelle if self.all_items else ""
+        return any(m.quelle != erste for m in self.all_items)
+
+    def _load_folders(self, folders: List[str], items: Optional[List[MediaItem]] = None,
+                      ausgewaehlt: Optional[bytearray] = None) -> None:
+        self._import_abbrechen()
+        self._quellen_abbrechen()
         self.stop_slideshow()
-        self.all_items.clear()
+        self._leere_items()
+        self._quellen = list(folders)
         self.listw.blockSignals(True)
         self.listw.clear()
 
         try:
-            for name in sorted(os.listdir(folder), key=lambda s: s.lower()):
-                path = os.path.join(folder, name)
-                if not os.path.isfile(path):
-                    continue
-                ext = os.path.splitext(path)[1].lower()
-                if ext in IMAGE_EXTS or ext in VIDEO_EXTS:
-                    self.all_items.append(MediaItem(path))
+            if items is None:
+                items = []
+                for folder in folders:
+                    items.extend(sammle_quelle(folder))
+            self._fuege_items_hinzu(items)
+            if ausgewaehlt is not None and len(ausgewaehlt) == len(self.all_items):
+                self.filter_index.ausgewaehlt[:] = ausgewaehlt
+            self._herkunft_zeigen = self._mehrere_quellen()
         except Exception as e:
             self.listw.blockSignals(False)
             QMessageBox.critical(self, "Fehler", f"Ordner konnte nicht gelesen werden:\n{e}")
             return
 
         for item in self.all_items:
-            it = QListWidgetItem(item.name)
-            it.setData(Qt.UserRole, item.path)
-            it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
-            it.setCheckState(Qt.Unchecked)
-            self.listw.addItem(it)
+            self.listw.addItem(self._neues_listen_item(item))
 
         if self.listw.count() > 0:
             self.listw.setCurrentRow(0)
@@ -1118,6 +5745,528 @@ class SlideShowWindow(QMainWindow):
         self._update_play_icon()
         self._update_status("Ordner geladen")
 
+    def _listen_text(self, item: MediaItem) -> str:
+        info = self.video_info.get(item.nr)
+        zusatz = info.text() if info is not None else ""
+        name = item.name
+        if self._herkunft_zeigen and item.quelle:
+            name = f"{os.path.basename(item.quelle.rstrip(os.sep)) or item.quelle} › {name}"
+        return f"{name}  ({zusatz})" if zusatz else name
+
+    def _neues_listen_item(self, item: MediaItem) -> QListWidgetItem:
+        it = QListWidgetItem(self._listen_text(item))
+        if self._herkunft_zeigen:
+            it.setToolTip(item.path)
+        it.setData(Qt.UserRole, item.path)
+        it.setData(Qt.UserRole + 1, item.nr)
+        it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+        it.setCheckState(Qt.Checked if self.filter_index.ausgewaehlt[item.nr] else Qt.Unchecked)
+        return it
+
+    # ---- Playlist Import/Export ----------------------------------------------
+
+    @Slot()
+    def choose_playlist(self) -> None:
+        pfad, _ = QFileDialog.getOpenFileName(
+            self, "Playlist öffnen", self.current_dir or os.path.expanduser("~"),
+            "Playlists (*.m3u8 *.m3u *.json);;Alle Dateien (*)",
+        )
+        if pfad:
+            self.importiere_playlist(pfad)
+
+    @Slot()
+    def save_playlist(self) -> None:
+        if not self.playlist:
+            self._update_status("Playlist ist leer")
+            return
+        pfad, _ = QFileDialog.getSaveFileName(
+            self, "Playlist speichern", self.current_dir or os.path.expanduser("~"),
+            "M3U8 (*.m3u8);;M3U (*.m3u);;JSON (*.json)",
+        )
+        if not pfad:
+            return
+        if not is_playlist(pfad):
+            pfad += ".m3u8"
+        try:
+            schreibe_playlist(pfad, self.playlist)
+        except OSError as e:
+            QMessageBox.critical(self, "Fehler", f"Playlist konnte nicht gespeichert werden:\n{e}")
+            return
+        self._update_status(f"Playlist gespeichert ({len(self.playlist)} Einträge)")
+
+    def importiere_playlist(self, pfad: str, abspielen: bool = True) -> None:
+        pfad = os.path.abspath(pfad)
+        self._import_abbrechen()
+        self.stop_slideshow()
+        self._leere_items()
+        self.playlist = []
+        self._playlist_maske = bytearray()
+        self.play_index = -1
+        self.listw.clear()
+
+        self.current_dir = os.path.dirname(pfad)
+        self.folder_label.setText(pfad)
+        self._import_id += 1
+        self._import_abspielen = abspielen
+        self._import = PlaylistImport(pfad, self._import_id, self)
+        self._import.teil_geladen.connect(self._on_playlist_teil)
+        self._import.fertig.connect(self._on_playlist_fertig)
+        self._import.start()
+        self._update_status("Playlist wird geladen…")
+
+    def _import_abbrechen(self) -> None:
+        if self._import is not None:
+            self._import.abbrechen()
+            self._import = None
+
+    @Slot(object)
+    def _on_playlist_teil(self, daten) -> None:
+        import_id, items = daten
+        if import_id != self._import_id:
+            return
+        erster = not self.all_items
+        self._haenge_items_an(items)
+        if erster and self.playlist:
+            if self._import_abspielen:
+                self.running = True
+                self.paused = False
+            self._render_current(autoplay=self.running and not self.paused)
+            self._update_play_icon()
+        self._update_status(f"Playlist wird geladen… ({len(self.all_items)})")
+
+    @Slot(object)
+    def _on_playlist_fertig(self, daten) -> None:
+        import_id, anzahl, fehler = daten
+        if import_id != self._import_id:
+            return
+        self._import = None
+        if self.meta.fertig and self.sortierung != "Ladefolge":
+            self._sortiere()
+        if fehler:
+            QMessageBox.critical(self, "Fehler", f"Playlist konnte nicht gelesen werden:\n{fehler}")
+        self._update_status(f"Playlist geladen ({len(self.all_items)} Einträge)")
+
+    def _leere_items(self) -> None:
+        self.all_items.clear()
+        self._bekannte_pfade.clear()
+        self.filter_index.leeren()
+        self.such_index.leeren(self.current_dir)
+        self.meta_scanner.abbrechen()
+        self.meta.leeren()
+        self.video_pruefer.abbrechen()
+        self.lautheits_analyse.abbrechen()
+        self.video_info.clear()
+        self._defekte = 0
+        self._herkunft_zeigen = False
+        self._duplikate_abbrechen()
+        self._reihenfolge = None
+        self._rang = None
+        self._items_sortiert = []
+        self._suche_zuruecksetzen()
+        self._zufall_bits = 2
+        self._zufall_zyklus = 0
+        self._zufall_verlauf.clear()
+
+    def _fuege_items_hinzu(self, items: List[MediaItem]) -> List[MediaItem]:
+        """Hängt neue (noch unbekannte) Medien an all_items an und vergibt ihre Nummer."""
+        neu = []
+        for item in items:
+            if item.path not in self._bekannte_pfade:
+                self._bekannte_pfade.add(item.path)
+                item.nr = len(self.all_items)
+                self.all_items.append(item)
+                neu.append(item)
+        self.filter_index.haenge_an(neu)
+        if neu:
+            self.meta.erweitere(len(neu))
+            self.meta_scanner.auftrag(neu[0].nr, [m.path for m in neu])
+            self.video_pruefer.auftrag([(m.nr, m.path) for m in neu if m.kind == "video"])
+            if self._reihenfolge is not None:
+                # bis zur nächsten Sortierung hinten anstellen
+                for m in neu:
+                    self._rang.append(len(self._reihenfolge))
+                    self._reihenfolge.append(m.nr)
+                self._items_sortiert.extend(neu)
+        if neu and self.such_index.n:
+            self._such_timer.start()  # Index wurde schon benutzt: neue Medien nachziehen
+        # Permutationsraum wächst nur, damit die Zufallsreihenfolge stabil bleibt
+        self._zufall_bits = max(self._zufall_bits, zufall_bits(len(self.all_items)))
+        return neu
+
+    def _haenge_items_an(self, items: List[MediaItem]) -> None:
+        """Neue Einträge anhängen, ohne die bestehende Playlist neu aufzubauen."""
+        neu = self._fuege_items_hinzu(items)
+        if not neu:
+            return
+        self.listw.blockSignals(True)
+        for item in neu:
+            self.listw.addItem(self._neues_listen_item(item))
+        self.listw.blockSignals(False)
+
+        alt = len(self._playlist_maske)
+        self._playlist_maske = self._filter_maske()
+        # neue Medien stehen in all_items wie in der Sortierung am Ende
+        self.playlist.extend(compress(self.all_items[alt:], self._playlist_maske[alt:]))
+        if self.play_index < 0 and self.playlist:
+            self.play_index = self._erste_position()
+        self._berechne_laufzeit()
+
+    @Slot(QListWidgetItem)
+    def _on_item_changed(self, it: QListWidgetItem) -> None:
+        nr = it.data(Qt.UserRole + 1)
+        if nr is not None:
+            self.filter_index.setze_ausgewaehlt(nr, it.checkState() == Qt.Checked)
+        if self.filter_option == "Nur ausgewähltes" or self._filter_zusatz is not None:
+            self._rebuild_playlist()
+
+    # ---- Sortierung ----------------------------------------------------------
+
+    @Slot(object)
+    def _on_meta_teil(self, daten) -> None:
+        scan_id, start_nr, werte = daten
+        if scan_id != self.meta_scanner.scan_id:
+            return
+        self.meta.setze(start_nr, werte)
+        if self.meta.fertig:
+            # Filter nach Größe/Datum ab jetzt aus dem Index statt per os.stat
+            self.filter_index.verwerfe_werte()
+            if self.sortierung != "Ladefolge" and self._import is None:
+                self._sortiere()
+
+    @Slot(str)
+    def _set_sortierung(self, text: str) -> None:
+        self.sortierung = text
+        if text != "Ladefolge" and not self.meta.fertig:
+            self._update_status("Sortierung wird berechnet…")  # _on_meta_teil sortiert danach
+            return
+        self._sortiere()
+
+    def _sortiere(self) -> None:
+        """Neu sortieren aus den gecachten Schlüsseln (kein Plattenzugriff)."""
+        t0 = time.perf_counter()
+        schluessel = self.meta.schluessel(self.sortierung)
+        if schluessel is None:
+            self._reihenfolge = self._rang = None
+            self._items_sortiert = []
+        else:
+            reihenfolge = array("l", sorted(range(len(self.all_items)), key=schluessel.__getitem__))
+            rang = array("l", bytes(reihenfolge.itemsize * len(reihenfolge)))
+            for pos, nr in enumerate(reihenfolge):
+                rang[nr] = pos
+            self._reihenfolge, self._rang = reihenfolge, rang
+            self._items_sortiert = list(map(self.all_items.__getitem__, reihenfolge))
+
+        self._fuelle_liste()
+        self._rebuild_playlist()
+        ms = (time.perf_counter() - t0) * 1000
+        self._update_status(f"Sortiert: {self.sortierung} ({ms:.0f} ms)")
+
+    def _fuelle_liste(self) -> None:
+        aktuell = None
+        if 0 <= self.play_index < len(self.playlist):
+            aktuell = self.playlist[self.play_index].nr
+        items = self.all_items if self._reihenfolge is None else self._items_sortiert
+        self.listw.setUpdatesEnabled(False)
+        self.listw.blockSignals(True)
+        self.listw.clear()
+        for item in items:
+            self.listw.addItem(self._neues_listen_item(item))
+        if aktuell is not None:
+            self.listw.setCurrentRow(self._listen_zeile(aktuell))
+        self.listw.blockSignals(False)
+        self.listw.setUpdatesEnabled(True)
+
+    # ---- Duplikate -----------------------------------------------------------
+
+    @Slot()
+    def duplikate_suchen(self) -> None:
+        bilder = [(m.nr, m.path) for m in self.all_items if m.kind == "bild"]
+        if not bilder:
+            QMessageBox.information(self, "Duplikate", "Keine Bilder geladen.")
+            return
+        radius, ok = QInputDialog.getInt(
+            self, "Duplikate suchen",
+            "Max. abweichende Hash-Bits (0 = nur identische, ~6 = Serienbilder/Re-Exporte):",
+            DUPLIKAT_ABSTAND, 0, 20,
+        )
+        if not ok:
+            return
+        self._duplikate_abbrechen()
+        self._duplikat_radius = radius
+        os.makedirs(os.path.dirname(self.meta_scanner.db_pfad), exist_ok=True)
+        self._duplikat_suche = DuplikatSuche(self._duplikat_id, bilder, self.meta_scanner.db_pfad, self)
+        self._duplikat_suche.fortschritt.connect(self._on_duplikat_fortschritt)
+        self._duplikat_suche.fertig.connect(self._on_duplikate_fertig)
+        self._duplikat_suche.start()
+        self._update_status(f"Duplikate: {len(bilder)} Bilder werden geprüft…")
+
+    def _duplikate_abbrechen(self) -> None:
+        self._duplikat_id += 1
+        if self._duplikat_suche is not None:
+            self._duplikat_suche.abbrechen()
+            self._duplikat_suche = None
+        self.act_duplikate.setChecked(False)
+        self.act_duplikate.setEnabled(False)
+        self.duplikate_zusammenfassen = False
+
+    @Slot(object)
+    def _on_duplikat_fortschritt(self, daten) -> None:
+        such_id, fertig, gesamt = daten
+        if such_id == self._duplikat_id:
+            self._update_status(f"Duplikate: {fertig}/{gesamt} Hashes")
+
+    @Slot(object)
+    def _on_duplikate_fertig(self, daten) -> None:
+        such_id, hashes, fehler = daten
+        if such_id != self._duplikat_id:
+            return
+        self._duplikat_suche = None
+        if fehler:
+            QMessageBox.warning(self, "Duplikate", f"Nicht alle Bilder konnten geprüft werden:\n{fehler}")
+        reihenfolge = list(self._reihenfolge) if self._reihenfolge is not None else list(range(len(self.all_items)))
+        gruppen = duplikat_gruppen(hashes, reihenfolge, self._duplikat_radius)
+
+        maske = self.filter_index.duplikat
+        maske[:] = bytes(len(maske))
+        for gruppe in gruppen:
+            for nr in gruppe[1:]:
+                maske[nr] = 1
+        anzahl = sum(len(g) - 1 for g in gruppen)
+        self.act_duplikate.setEnabled(anzahl > 0)
+        if not anzahl:
+            QMessageBox.information(self, "Duplikate", f"Keine Duplikate unter {len(hashes)} Bildern gefunden.")
+            return
+
+        box = QMessageBox(self)
+        box.setWindowTitle("Duplikate")
+        box.setText(f"{anzahl} Duplikate in {len(gruppen)} Gruppen gefunden.\n"
+                    "Behalten wird jeweils das erste Bild der aktuellen Sortierung.")
+        btn_abwaehlen = box.addButton("Duplikate abwählen", QMessageBox.ActionRole)
+        btn_zusammen = box.addButton("In Playlist zusammenfassen", QMessageBox.ActionRole)
+        box.addButton(QMessageBox.Close)
+        box.exec()
+        if box.clickedButton() is btn_abwaehlen:
+            self._duplikate_abwaehlen()
+        elif box.clickedButton() is btn_zusammen:
+            self.act_duplikate.setChecked(True)
+            self._set_duplikate_zusammenfassen(True)
+
+    def _duplikate_abwaehlen(self) -> None:
+        # ohne bisherige Auswahl: alles auswählen, dann die Duplikate abhaken
+        ausgewaehlt = self.filter_index.ausgewaehlt
+        if not any(ausgewaehlt):
+            ausgewaehlt[:] = b"\x01" * len(ausgewaehlt)
+        for nr, dup in enumerate(self.filter_index.duplikat):
+            if dup:
+                ausgewaehlt[nr] = 0
+        self.listw.blockSignals(True)
+        for row in range(self.listw.count()):
+            it = self.listw.item(row)
+            it.setCheckState(Qt.Checked if ausgewaehlt[it.data(Qt.UserRole + 1)] else Qt.Unchecked)
+        self.listw.blockSignals(False)
+        if self.filter_option != "Nur ausgewähltes":
+            self._filter_combo.setCurrentText("Nur ausgewähltes")
+        else:
+            self._rebuild_playlist()
+        self._update_status("Duplikate abgewählt")
+
+    @Slot(bool)
+    def _set_duplikate_zusammenfassen(self, on: bool) -> None:
+        self.duplikate_zusammenfassen = on
+        self._rebuild_playlist()
+        self._update_status("Duplikate zusammengefasst" if on else "Duplikate werden gezeigt")
+
+    # ---- Video-Export --------------------------------------------------------
+
+    def _abspielfolge(self) -> List[MediaItem]:
+        """Die Playlist in der Reihenfolge, in der die Diashow sie zeigt (ein Durchlauf)."""
+        if not self.zufall_an:
+            return list(self.playlist)
+        out: List[MediaItem] = []
+        pos, nr, zyklus = -1, None, self._zufall_zyklus
+        while len(out) < len(self.playlist):
+            res = zufall_schritt(
+                self.playlist, self._playlist_maske, len(self.all_items), self._zufall_bits,
+                self.zufall_seed, pos, nr, zyklus, +1, False, self._rang,
+            )
+            if res is None:
+                break
+            pos, zyklus = res
+            nr = self.playlist[pos].nr
+            out.append(self.playlist[pos])
+        return out
+
+    @Slot()
+    def video_exportieren(self) -> None:
+        if self._export is not None:
+            QMessageBox.information(self, "Export", "Es läuft bereits ein Export.")
+            return
+        if shutil.which("ffmpeg") is None:
+            QMessageBox.warning(self, "Export", "ffmpeg wurde nicht gefunden (wird für den Video-Export benötigt).")
+            return
+        folge = self._abspielfolge()
+        pfade = [m.path for m in folge if m.kind == "bild"]
+        if not pfade:
+            QMessageBox.information(self, "Export", "Die Playlist enthält keine Bilder.")
+            return
+        aufloesung, ok = QInputDialog.getItem(self, "Als Video exportieren", "Auflösung:",
+                                              list(EXPORT_AUFLOESUNGEN), 0, False)
+        if not ok:
+            return
+        ziel, _ = QFileDialog.getSaveFileName(
+            self, "Video speichern", self.current_dir or os.path.expanduser("~"), "MP4 (*.mp4)",
+        )
+        if not ziel:
+            return
+        if not ziel.lower().endswith(".mp4"):
+            ziel += ".mp4"
+        breite, hoehe = EXPORT_AUFLOESUNGEN[aufloesung]
+        self._export = VideoExport(pfade, ziel, breite, hoehe, self._interval_ms(), self.skalierung,
+                                   self.dateiname_anzeigen, self)
+        self._export.fortschritt.connect(self._on_export_fortschritt)
+        self._export.fertig.connect(self._on_export_fertig)
+        self._export.start()
+        self.act_export_abbrechen.setEnabled(True)
+        uebersprungen = len(folge) - len(pfade)
+        hinweis = f" ({uebersprungen} Videos übersprungen)" if uebersprungen else ""
+        self._update_status(f"Export: {len(pfade)} Folien{hinweis}…")
+
+    @Slot()
+    def _export_abbrechen(self) -> None:
+        if self._export is not None:
+            self._export.abbrechen()
+
+    @Slot(object)
+    def _on_export_fortschritt(self, daten) -> None:
+        fertig, gesamt = daten
+        self._update_status(f"Export: {fertig}/{gesamt} Folien")
+
+    @Slot(object)
+    def _on_export_fertig(self, daten) -> None:
+        ziel, fehler = daten
+        self._export = None
+        self.act_export_abbrechen.setEnabled(False)
+        if fehler == "abgebrochen":
+            self._update_status("Export abgebrochen")
+        elif fehler:
+            self._update_status("Export fehlgeschlagen")
+            QMessageBox.critical(self, "Export", f"Video konnte nicht erstellt werden:\n{fehler}")
+        else:
+            self._update_status(f"Export fertig: {ziel}")
+
+    # ---- Suche ---------------------------------------------------------------
+
+    SUCH_LIMIT = 1000
+    SUCH_SCHRITT = 5000  # Medien je Indexierungs-Häppchen (GUI bleibt bedienbar)
+
+    @Slot()
+    def _such_index_aufholen(self) -> None:
+        fertig = self.such_index.aufholen(self.all_items, self.SUCH_SCHRITT)
+        if fertig:
+            self._such_timer.stop()
+            if self.such_feld.text():
+                self._suche(self.such_feld.text())
+
+    @Slot(str)
+    def _suche(self, text: str) -> None:
+        text = text.strip()
+        if not text:
+            self._suche_zuruecksetzen()
+            return
+        if self.such_index.n < len(self.all_items):
+            # erster Gebrauch bzw. neue Medien: Index im Leerlauf nachziehen, bis dahin prüft
+            # die Suche den Rest direkt
+            self._such_timer.start()
+        t0 = time.perf_counter()
+        treffer, abgeschnitten = self.such_index.suche(text, self.all_items, self.SUCH_LIMIT)
+        ms = (time.perf_counter() - t0) * 1000
+
+        self.treffer_liste.blockSignals(True)
+        self.treffer_liste.clear()
+        for nr in treffer:
+            item = self.all_items[nr]
+            it = QListWidgetItem(item.name)
+            it.setToolTip(item.path)
+            it.setData(Qt.UserRole, item.path)
+            it.setData(Qt.UserRole + 1, nr)
+            it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+            it.setCheckState(Qt.Checked if self.filter_index.ausgewaehlt[nr] else Qt.Unchecked)
+            self.treffer_liste.addItem(it)
+        self.treffer_liste.blockSignals(False)
+
+        anzahl = f"{len(treffer)}+" if abgeschnitten else str(len(treffer))
+        self.treffer_label.setText(f"{anzahl} Treffer ({ms:.1f} ms) – Enter/Doppelklick spielt ab")
+        self.treffer_label.show()
+        self.treffer_liste.show()
+        self.listw.hide()
+
+    def _suche_zuruecksetzen(self) -> None:
+        if not hasattr(self, "treffer_liste"):
+            return
+        self.treffer_liste.clear()
+        self.treffer_liste.hide()
+        self.treffer_label.hide()
+        self.listw.show()
+
+    def _listen_zeile(self, nr: int) -> int:
+        return nr if self._rang is None else self._rang[nr]
+
+    def _listen_item(self, it: QListWidgetItem) -> Optional[QListWidgetItem]:
+        nr = it.data(Qt.UserRole + 1)
+        return self.listw.item(self._listen_zeile(nr)) if nr is not None else None
+
+    @Slot()
+    def _on_treffer_auswahl(self) -> None:
+        sel = self.treffer_liste.selectedItems()
+        if sel:
+            self.listw.setCurrentRow(self._listen_zeile(sel[0].data(Qt.UserRole + 1)))
+
+    @Slot(QListWidgetItem)
+    def _on_treffer_geaendert(self, it: QListWidgetItem) -> None:
+        ziel = self._listen_item(it)
+        if ziel is not None:
+            ziel.setCheckState(it.checkState())
+
+    @Slot(QListWidgetItem)
+    def _on_treffer_doppelklick(self, it: QListWidgetItem) -> None:
+        ziel = self._listen_item(it)
+        if ziel is not None:
+            self._on_item_double_clicked(ziel)
+
+    @Slot()
+    def _such_treffer_abspielen(self) -> None:
+        it = self.treffer_liste.currentItem() or self.treffer_liste.item(0)
+        if it is not None:
+            self._on_treffer_doppelklick(it)
+
+    @Slot()
+    def erweiterter_filter(self) -> None:
+        text, ok = QInputDialog.getText(
+            self, "Erweiterter Filter",
+            "Ausdruck (leer = aus), z. B.  art:bild und endung:jpg,png oder name:*urlaub*\n"
+            "Begriffe: art: endung: groesse:>10mb datum:2024-01-01..2024-06-30 ordner: name: regex: ausgewaehlt",
+            text=self.filter_text,
+        )
+        if ok:
+            self.setze_filter_text(text)
+
+    def setze_filter_text(self, text: str) -> bool:
+        text = text.strip()
+        try:
+            zusatz = parse_filter(text) if text else None
+        except FilterFehler as e:
+            QMessageBox.warning(self, "Filter", str(e))
+            return False
+        self.filter_text = text
+        self._filter_zusatz = zusatz
+        if self.such_index.n < len(self.all_items) and re.search(r"(?i)\b(name|regex):", text):
+            self._such_timer.start()  # Trigramme im Leerlauf nachziehen, bis dahin läuft der Filter über alle Namen
+        t0 = time.perf_counter()
+        self._rebuild_playlist()
+        ms = (time.perf_counter() - t0) * 1000
+        self._update_status(f"Filter: {len(self.playlist)} von {len(self.all_items)} ({ms:.1f} ms)")
+        return True
+
     def _selected_paths(self) -> List[str]:
         paths = []
         for i in range(self.listw.count()):
@@ -1128,40 +6277,115 @@ class SlideShowWindow(QMainWindow):
 
     # ---- Playlist ------------------------------------------------------------
 
-    def _apply_filter(self, items: List[MediaItem]) -> List[MediaItem]:
-        scope = self.filter_option
-        if scope == "Alles":
-            return items
-        if scope == "Nur ausgewähltes":
-            chosen = set(self._selected_paths())
-            return [m for m in items if m.path in chosen]
-        if scope == "Nur Bilder":
-            return [m for m in items if m.kind == "bild"]
-        if scope == "Nur Videos":
-            return [m for m in items if m.kind == "video"]
-        return items
+    def _filter_ausdruck(self):
+        ohne_duplikate = ("nicht", ("duplikat",)) if self.duplikate_zusammenfassen else None
+        # wer ausdrücklich nach "defekt" filtert, soll die defekten Videos auch sehen
+        ohne_defekte = ("nicht", ("defekt",)) if self._defekte and "defekt" not in self.filter_text.lower() else None
+        return filter_ausdruck(self.filter_option, self._filter_zusatz, ohne_duplikate, ohne_defekte)
 
-    def _rebuild_playlist(self) -> None:
-        items = self._apply_filter(list(self.all_items))
-        if self.zufall_an:
-            rnd = random.Random()
-            rnd.seed((self.current_dir or "") + str(len(items)))
-            rnd.shuffle(items)
+    def _filter_maske(self) -> bytearray:
+        return self.filter_index.maske(self._filter_ausdruck())
 
-        current_path = None
+    def _rebuild_playlist(self) -> None:
+        # Playlist folgt der Sortierung (sonst all_items-Reihenfolge); Zufall wird erst beim
+        # Weiterschalten über die Permutation berechnet, der aktuelle Platz geht nicht verloren.
+        current = None
         if 0 <= self.play_index < len(self.playlist):
-            current_path = self.playlist[self.play_index].path
-
-        self.playlist = items
-        if current_path:
-            for idx, m in enumerate(self.playlist):
-                if m.path == current_path:
-                    self.play_index = idx
-                    break
+            current = self.playlist[self.play_index]
+
+        ausdruck = self._filter_ausdruck()
+        self._playlist_maske = maske = self.filter_index.maske(ausdruck)
+        if self._reihenfolge is None:
+            self.playlist = list(self.all_items) if ausdruck is None else list(compress(self.all_items, maske))
+        elif ausdruck is None:
+            self.playlist = list(self._items_sortiert)
+        else:
+            self.playlist = list(compress(self._items_sortiert, map(maske.__getitem__, self._reihenfolge)))
+        if not self.playlist:
+            self.play_index = -1
+        elif current is not None and current.nr < len(self._playlist_maske) and self._playlist_maske[current.nr]:
+            self.play_index = self._playlist_position(current.nr)
+        elif current is not None and self.zufall_an:
+            # aktuelles Medium herausgefiltert: ab seinem Platz in der Zufallsfolge weiter
+            self.play_index = self._zufall_nach_nr(current.nr)
+        else:
+            self.play_index = self._erste_position()
+        self._berechne_laufzeit()
+
+    def _berechne_laufzeit(self) -> None:
+        bilder = video_ms = unbekannt = 0
+        for m in self.playlist:
+            if m.kind == "bild":
+                bilder += 1
+                continue
+            info = self.video_info.get(m.nr)
+            if info is None or info.dauer_ms is None:
+                unbekannt += 1
             else:
-                self.play_index = 0 if self.playlist else -1
+                video_ms += info.dauer_ms
+        self._laufzeit = (bilder, video_ms, unbekannt)
+
+    def _laufzeit_text(self) -> str:
+        bilder, video_ms, unbekannt = self._laufzeit
+        gesamt = bilder * (int(self.interval_spin.value()) or 10) + video_ms / 1000.0
+        return format_dauer(gesamt) + (f" (+{unbekannt} ?)" if unbekannt else "")
+
+    # ---- Videoprüfung --------------------------------------------------------
+
+    @Slot(object)
+    def _on_pruef_teil(self, daten) -> None:
+        pruef_id, infos = daten
+        if pruef_id != self.video_pruefer.pruef_id:
+            return
+        mit_ton = []
+        for nr, info in infos.items():
+            self.video_info[nr] = info
+            if info.audio and not info.fehler and self.all_items[nr].path not in self.lautheit:
+                mit_ton.append(self.all_items[nr].path)
+            if info.fehler and not self.filter_index.defekt[nr]:
+                self.filter_index.defekt[nr] = 1
+                self._defekte += 1
+            it = self.listw.item(self._listen_zeile(nr))
+            if it is not None:
+                it.setText(self._listen_text(self.all_items[nr]))
+                if info.fehler:
+                    it.setToolTip(info.fehler)
+        self.lautheits_analyse.auftrag(mit_ton)
+        self._pruef_timer.start()
+
+    @Slot(object)
+    def _on_lautheit_gemessen(self, daten) -> None:
+        analyse_id, werte = daten
+        if analyse_id == self.lautheits_analyse.analyse_id:
+            self.lautheit.update(werte)
+
+    @Slot()
+    def _nach_pruefung(self) -> None:
+        # gesammelt statt je Teil: Playlist nur neu aufbauen, wenn Defekte hinzukamen
+        if self._defekte and any(self.filter_index.defekt[m.nr] for m in self.playlist):
+            aktuell = self.playlist[self.play_index] if 0 <= self.play_index < len(self.playlist) else None
+            self._rebuild_playlist()
+            if aktuell is not None and self.filter_index.defekt[aktuell.nr] and self.playlist:
+                self._render_current(autoplay=self.running and not self.paused)
         else:
-            self.play_index = 0 if self.playlist else -1
+            self._berechne_laufzeit()
+        self._update_status()
+
+    def _erste_position(self) -> int:
+        if self.zufall_an:
+            pos = self._zufall_position(+1, von_pos=-1)
+            return 0 if pos is None else pos
+        return 0
+
+    def _zufall_nach_nr(self, nr: int) -> int:
+        res = zufall_schritt(
+            self.playlist, self._playlist_maske, len(self.all_items), self._zufall_bits,
+            self.zufall_seed, -1, nr, self._zufall_zyklus, +1, True, self._rang,
+        )
+        if res is None:
+            return 0
+        self._zufall_zyklus = res[1]
+        return res[0]
 
     # ---- Vorschau ------------------------------------------------------------
 
@@ -1199,9 +6423,30 @@ class SlideShowWindow(QMainWindow):
 
     def _render_current(self, autoplay: bool) -> None:
         if 0 <= self.play_index < len(self.playlist):
-            self._render_item(self.playlist[self.play_index], autoplay=autoplay)
+            item = self.playlist[self.play_index]
+            # Playlist-Einträge werden erst hier geprüft (lazy)
+            if not medium_existiert(item.path):
+                self._ueberspringe_fehlend(item, autoplay)
+                return
+            self._fehlend_in_folge = 0
+            self._render_item(item, autoplay=autoplay)
+            self._vorausladen()
+
+    def _ueberspringe_fehlend(self, item: MediaItem, autoplay: bool) -> None:
+        self._refresh_overlay(item)
+        self.player.stop()
+        self.bild_timer.stop()
+        for lbl in self._bild_ziele():
+            lbl.setText(f"Datei fehlt:\n{item.path}")
+        self._fehlend_in_folge += 1
+        if autoplay and self._fehlend_in_folge < len(self.playlist):
+            QTimer.singleShot(0, self.next_item)
 
     def _render_item(self, item: MediaItem, autoplay: bool) -> None:
+        self._beende_zoom()
+        self._vorschau_keys.clear()
+        self._verweil_timer.stop()
+        self._verweil_auftrag = None
         self._refresh_overlay(item)
         self._active_seekbar().hide()
 
@@ -1211,42 +6456,53 @@ class SlideShowWindow(QMainWindow):
             self.bild_label.show()
 
             if self.vollbild.isVisible():
-                self.video_area_full.hide()
-                self.vollbild.video_area.hide()
-                self.vollbild.bild_label.show()
-
-            pix = QPixmap(item.path)
-            if pix.isNull():
-                lbl = self.vollbild.bild_label if self.vollbild.isVisible() else self.bild_label
-                lbl.setText(f"Konnte Bild nicht laden:\n{item.name}")
-                return
+                for a in self._vollbild_ansichten():
+                    a.video_area.hide()
+                    a.bild_label.show()
 
-            lbl = self.vollbild.bild_label if self.vollbild.isVisible() else self.bild_label
-            QTimer.singleShot(0, lambda: self._set_pixmap_scaled(lbl, pix))
+            if item.path not in self.bild_cache and self._zeige_vorschau(item):
+                self._angezeigt = None  # volle Auflösung folgt über _on_bild_vorbereitet
+            else:
+                img = self._lade_bild(item)
+                if img.isNull():
+                    self._angezeigt = None
+                    for lbl in self._bild_ziele():
+                        lbl.setText(f"Konnte Bild nicht laden:\n{item.name}")
+                    return
+                self._angezeigt = item.path
+
+                # einmal dekodiert, je Ziel (Bildschirm) nur skaliert; vorbereitete Folie sofort tauschen
+                for lbl in self._bild_ziele():
+                    if self._pixmap_key(lbl, item.path) in self.pixmap_cache:
+                        self._set_pixmap_scaled(lbl, item.path, img)
+                    else:
+                        QTimer.singleShot(0, lambda lbl=lbl: self._set_pixmap_scaled(lbl, item.path, img))
 
             self.bild_timer.stop()
             if autoplay:
                 self._bild_rest_ms = self._interval_ms()
-                self.bild_timer.start(self._bild_rest_ms)
+                self._plane_folie(self._bild_rest_ms)
             return
 
         if item.kind == "video":
             self.bild_timer.stop()
 
-            # Videobereich sichtbar (normal oder vollbild)
+            # Videobereich sichtbar (normal oder vollbild), Ausgabe bleibt der gemeinsame Verteiler
+            self._angezeigt = None
             if self.vollbild.isVisible():
-                self.vollbild.bild_label.hide()
-                self.vollbild.video_area.show()
-                self.player.setVideoOutput(self.video_area_full.sink)
+                for a in self._vollbild_ansichten():
+                    a.bild_label.hide()
+                    a.video_area.show()
             else:
                 self.bild_label.hide()
                 self.video_area.show()
-                self.player.setVideoOutput(self.video_area.sink)
 
             # Quelle nur setzen, wenn anderes Video (kein Neustart)
             current = self.player.source().toLocalFile() if self.player.source().isValid() else ""
-            if os.path.abspath(current) != os.path.abspath(item.path):
-                self.player.setSource(QUrl.fromLocalFile(item.path))
+            quelle = self._quelle(item.path)
+            if os.path.abspath(current) not in (os.path.abspath(item.path), os.path.abspath(quelle)):
+                self.player.setSource(QUrl.fromLocalFile(quelle))
+            self._setze_lautstaerke(item.path)
 
             if autoplay:
                 self.player.play()
@@ -1261,15 +6517,312 @@ class SlideShowWindow(QMainWindow):
         self.bild_label.show()
         self.bild_label.setText(f"Nicht unterstützter Typ:\n{item.name}")
 
-    def _set_pixmap_scaled(self, target_label: QLabel, pix: QPixmap) -> None:
+    # ---- Zoom/Pan -------------------------------------------------------------
+
+    @Slot(bool)
+    def _set_zoom(self, on: bool) -> None:
+        if not on:
+            self._beende_zoom()
+            if self._zoom_pausiert and self.running and self.paused:
+                self._resume_everything()
+                self._update_play_icon()
+            self._zoom_pausiert = False
+            return
+        item = self.playlist[self.play_index] if 0 <= self.play_index < len(self.playlist) else None
+        img = None if item is None or item.kind != "bild" or self.vollbild.isVisible() else self._angezeigtes_bild(item)
+        if img is None:
+            self.act_zoom.setChecked(False)
+            self._update_status("Zoom nur für Bilder im Fenster")
+            return
+        # solange gezoomt wird, steht die Diashow
+        self._zoom_pausiert = self.running and not self.paused
+        if self._zoom_pausiert:
+            self._pause_everything()
+            self._update_play_icon()
+        self.bild_label.hide()
+        self.zoom_ansicht.show()
+        self.zoom_ansicht.zeige(item.path, img)
+        self.zoom_ansicht.setFocus()
+        self._update_status("Zoom: Mausrad/+/−, Ziehen, Doppelklick 1:1, 0 = Einpassen, Z = zurück")
+
+    def _beende_zoom(self) -> None:
+        if not self.zoom_ansicht.isVisible():
+            return
+        self.zoom_ansicht.hide()
+        self.zoom_ansicht.path = None
+        self.bild_label.show()
+        self.act_zoom.setChecked(False)
+
+    def _bild_ziele(self) -> List[QLabel]:
+        if self.vollbild.isVisible():
+            return [a.bild_label for a in self._vollbild_ansichten()]
+        return [self.bild_label]
+
+    def _lade_bild(self, item: MediaItem) -> QImage:
+        img = self.bild_cache.hole(item.path)
+        if img is None:
+            t0 = time.perf_counter()
+            img = dekodiere_bild(self._quelle(item.path))
+            self.takt.messe(dekodier_ms=(time.perf_counter() - t0) * 1000.0)
+            if not img.isNull():
+                self.bild_cache.lege_ab(item.path, img, PRIO_AKTUELL)
+        self._markiere_aktuell(self.bild_cache, item.path)
+        return img
+
+    def _angezeigtes_bild(self, item: Optional[MediaItem]) -> Optional[QImage]:
+        """Das gezeigte Bild aus dem bild_cache (kein eigener Verweis am Budget vorbei); None, wenn nicht gezeigt."""
+        if item is None or self._angezeigt != item.path:
+            return None
+        img = self.bild_cache.hole(item.path)
+        if img is None:  # vom Budget verdrängt: neu dekodieren
+            img = self._lade_bild(item)
+        return None if img.isNull() else img
+
+    def _markiere_aktuell(self, cache: MedienCache, key, neu: bool = True) -> None:
+        # neue Folie: bisher aktuelle Einträge zu "alt" herabstufen
+        if neu and cache is self.bild_cache:
+            for c, k in self._aktuell_keys:
+                c.setze_prio(k, PRIO_ALT)
+            self._aktuell_keys.clear()
+        cache.setze_prio(key, PRIO_AKTUELL)
+        self._aktuell_keys.append((cache, key))
+
+    def _pixmap_key(self, target_label: QLabel, path: str):
         target = target_label.size()
         if target.width() <= 1 or target.height() <= 1:
+            return None
+        return (path, target.width(), target.height(), self.skalierung)
+
+    def _set_pixmap_scaled(self, target_label: QLabel, path: str, img: QImage) -> None:
+        key = self._pixmap_key(target_label, path)
+        if key is None:
             return
-        if self.skalierung == "Füllen (Zuschneiden)":
-            scaled = pix.scaled(target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        scaled = self.pixmap_cache.hole(key)
+        if scaled is None and img.width() * img.height() >= VORSCHAU_AB_PIXEL:
+            # zweistufig: sofort grob skaliert zeigen, die glatte Fassung tauscht _on_bild_vorbereitet ein
+            target_label.setPixmap(QPixmap.fromImage(skaliere_bild(img, target_label.size(), self.skalierung, True)))
+            self._vorschau_keys.add(key)
+            self._glaette(key, img, target_label.size())
         else:
-            scaled = pix.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        target_label.setPixmap(scaled)
+            if scaled is None:
+                scaled = QPixmap.fromImage(skaliere_bild(img, target_label.size(), self.skalierung))
+                self.pixmap_cache.lege_ab(key, scaled, PRIO_AKTUELL)
+            self._markiere_aktuell(self.pixmap_cache, key, neu=False)
+            self._vorschau_keys.discard(key)
+            target_label.setPixmap(scaled)
+        self._melde_erster_inhalt()
+        self.inhalt_gezeigt.emit(path)
+
+    def _zeige_vorschau(self, item: MediaItem) -> bool:
+        """Noch nicht dekodiertes Bild als Vorschau zeigen (EXIF/verkleinert); False, wenn das nicht geht."""
+        ziele = [lbl for lbl in self._bild_ziele() if self._pixmap_key(lbl, item.path) is not None]
+        if not ziele:
+            return False
+        groesste = max((lbl.size() for lbl in ziele), key=lambda g: g.width() * g.height())
+        quelle = self._quelle(item.path)
+        vorschau = lies_vorschau(quelle, groesste, self.skalierung)
+        if vorschau is None:
+            return False
+        for lbl in ziele:
+            bild = vorschau if lbl.size() == groesste else skaliere_bild(vorschau, lbl.size(), self.skalierung, True)
+            lbl.setPixmap(QPixmap.fromImage(bild))
+            self._vorschau_keys.add(self._pixmap_key(lbl, item.path))
+        self._melde_erster_inhalt()
+        self.inhalt_gezeigt.emit(item.path)
+        self._verweil_auftrag = (item.path, [lbl.size() for lbl in ziele], self.skalierung, quelle)
+        self._verweil_timer.start()
+        return True
+
+    @Slot()
+    def _dekodiere_verweilt(self) -> None:
+        if self._verweil_auftrag is None:
+            return
+        path, groessen, skalierung, quelle = self._verweil_auftrag
+        self._verweil_auftrag = None
+        if path in self._vorbereitung_laeuft:
+            return  # Folien-Takt bereitet sie schon vor, das Ergebnis tauscht die Vorschau
+        self._vorbereitung_laeuft.add(path)
+        img = self.bild_cache.hole(path)  # evtl. inzwischen vom Vorausladen dekodiert
+        fut = self._dekodier_pool.submit(bereite_bild_vor, path, img, groessen, skalierung, quelle)
+        fut.add_done_callback(lambda f, p=path, s=skalierung: self._melde_vorbereitet(f, p, s))
+
+    def _glaette(self, key, img: QImage, groesse: QSize) -> None:
+        if key in self._glaettung_laeuft:
+            return
+        self._glaettung_laeuft.add(key)
+        fut = self._dekodier_pool.submit(bereite_bild_vor, key[0], img, [groesse], self.skalierung)
+        fut.add_done_callback(lambda f, p=key[0], s=self.skalierung: self._melde_vorbereitet(f, p, s))
+
+    def _tausche_vorschau(self, path: str, img: QImage) -> None:
+        """Glatte Fassung an die Stelle der schnellen setzen (gleiche Größe, daher ohne Sprung)."""
+        if not any(key[0] == path for key in self._vorschau_keys):
+            return  # inzwischen weitergeblättert (auch Listen-Vorschau außerhalb der Playlist)
+        if self._angezeigt is None:
+            self._angezeigt = path
+            self._markiere_aktuell(self.bild_cache, path)
+        for lbl in self._bild_ziele():
+            key = self._pixmap_key(lbl, path)
+            if key in self._vorschau_keys and key in self.pixmap_cache:
+                self._set_pixmap_scaled(lbl, path, img)
+
+    # ---- Vorausladen ---------------------------------------------------------
+
+    def _kommende_items(self, n: int) -> List[MediaItem]:
+        out: List[MediaItem] = []
+        if not self.playlist:
+            return out
+        i = self.play_index
+        zyklus = self._zufall_zyklus
+        for _ in range(n):
+            if self.zufall_an:
+                res = zufall_schritt(
+                    self.playlist, self._playlist_maske, len(self.all_items), self._zufall_bits,
+                    self.zufall_seed, i, self.playlist[i].nr if 0 <= i < len(self.playlist) else None,
+                    zyklus, +1, self.repeat_an, self._rang,
+                )
+                if res is None:
+                    break
+                i, zyklus = res
+            else:
+                i += 1
+                if i >= len(self.playlist):
+                    if not self.repeat_an:
+                        break
+                    i = 0
+            if i == self.play_index:
+                break
+            out.append(self.playlist[i])
+        return out
+
+    def _quelle(self, path: str) -> str:
+        """Lokale Kopie (Staging), falls schon vorhanden, sonst der Originalpfad."""
+        if self.staging is None:
+            return path
+        return self.staging.lokal(path) or path
+
+    def _vorausladen(self) -> None:
+        kommend = self._kommende_items(max(2, STAGING_VORAUS if self.staging else 0))
+        if self.staging is not None:
+            aktuell = [self.playlist[self.play_index].path] if 0 <= self.play_index < len(self.playlist) else []
+            self.staging.vormerken([p for p in aktuell + [i.path for i in kommend] if archiv_teile(p) is None])
+        for item in kommend[:2]:
+            if item.kind != "bild":
+                continue
+            if item.path in self.bild_cache:
+                self.bild_cache.setze_prio(item.path, PRIO_NAECHSTES)
+                continue
+            if item.path in self._dekodierung_laeuft:
+                continue
+            quelle = self._quelle(item.path)
+            if self.staging is not None and quelle == item.path and archiv_teile(item.path) is None:
+                continue  # erst kopieren, dann lokal dekodieren (_on_lokal_kopiert)
+            self._dekodierung_laeuft.add(item.path)
+            fut = self._dekodier_pool.submit(dekodiere_bild, quelle)
+            fut.add_done_callback(lambda f, p=item.path: self._melde_dekodiert(f, p))
+
+    def _melde_dekodiert(self, fut: Future, path: str) -> None:
+        """Done-Callback des Vorausladens: eine Ausnahme im Dekoder kommt als leeres Bild an."""
+        fehler = fut.exception()
+        if fehler is not None:
+            print(f"MySlide: Dekodieren von {path} fehlgeschlagen: {fehler}", file=sys.stderr)
+        self.bild_dekodiert.emit((path, QImage() if fehler is not None else fut.result()))
+
+    @Slot(str)
+    def _on_lokal_kopiert(self, path: str) -> None:
+        if any(i.path == path for i in self._kommende_items(2)):
+            self._vorausladen()
+
+    @Slot(object)
+    def _on_bild_dekodiert(self, result) -> None:
+        path, img = result
+        self._dekodierung_laeuft.discard(path)
+        if img.isNull() or path in self.bild_cache:
+            return
+        self.bild_cache.lege_ab(path, img, PRIO_NAECHSTES)
+
+    # ---- Folien-Takt ---------------------------------------------------------
+
+    def _plane_folie(self, dauer_ms: int) -> None:
+        self.takt.plane(dauer_ms, anschluss=self._im_takt)
+        self.bild_timer.start(self.takt.rest_ms())
+        self._vorbereitungs_timer.start(self.takt.vorbereiten_in_ms())
+
+    @Slot()
+    def _on_folie_faellig(self) -> None:
+        soll = self.takt.faellig
+        self._im_takt = True
+        try:
+            self.next_item()
+        finally:
+            self._im_takt = False
+        spaet = self.takt.melde_wechsel(soll)
+        if spaet is not None and self._zeitmessung:
+            print(f"MySlide: Folienwechsel {spaet:.0f} ms zu spät", file=sys.stderr)
+
+    @Slot()
+    def _bereite_naechste_folie_vor(self) -> None:
+        if not self.running or self.paused or not self.bild_timer.isActive():
+            return
+        kommend = self._kommende_items(1)
+        if not kommend or kommend[0].kind != "bild":
+            return
+        path = kommend[0].path
+        if path in self._vorbereitung_laeuft:
+            return
+        if path in self._dekodierung_laeuft:
+            # Vorausladen dekodiert gerade – gleich noch einmal versuchen statt doppelt
+            self._vorbereitungs_timer.start(10)
+            return
+        groessen = []
+        for lbl in self._bild_ziele():
+            key = self._pixmap_key(lbl, path)
+            if key is not None and key not in self.pixmap_cache:
+                groessen.append(lbl.size())
+        if not groessen:
+            return
+        img = self.bild_cache.hole(path)
+        self._vorbereitung_laeuft.add(path)
+        fut = self._dekodier_pool.submit(bereite_bild_vor, path, img, groessen, self.skalierung, self._quelle(path))
+        fut.add_done_callback(lambda f, p=path, s=self.skalierung: self._melde_vorbereitet(f, p, s))
+
+    def _melde_vorbereitet(self, fut: Future, path: str, skalierung: str) -> None:
+        """Done-Callback von bereite_bild_vor: eine Ausnahme im Worker kommt als leeres Bild an."""
+        fehler = fut.exception()
+        if fehler is None:
+            self.bild_vorbereitet.emit((skalierung, fut.result()))
+            return
+        print(f"MySlide: Vorbereitung von {path} fehlgeschlagen: {fehler}", file=sys.stderr)
+        self.bild_vorbereitet.emit((skalierung, (path, QImage(), [], None, 0.0)))
+
+    @Slot(object)
+    def _on_bild_vorbereitet(self, result) -> None:
+        skalierung, (path, img, skaliert, dekodier_ms, skalier_ms) = result
+        self._vorbereitung_laeuft.discard(path)
+        self._glaettung_laeuft.difference_update((path, w, h, skalierung) for w, h, _ in skaliert)
+        self.takt.messe(dekodier_ms, skalier_ms if skaliert else None)
+        if img.isNull():
+            # fehlgeschlagen: auch laufende Glättungen freigeben, die Anzeige bleibt bei der schnellen Fassung
+            self._glaettung_laeuft.difference_update([k for k in self._glaettung_laeuft if k[0] == path])
+            return
+        if path not in self.bild_cache:
+            self.bild_cache.lege_ab(path, img, PRIO_NAECHSTES)
+        for w, h, bild in skaliert:
+            self.pixmap_cache.lege_ab((path, w, h, skalierung), QPixmap.fromImage(bild), PRIO_NAECHSTES)
+        if self._vorschau_keys:
+            self._tausche_vorschau(path, img)
+
+    # ---- Zeitmessung (Kiosk) -------------------------------------------------
+
+    def _melde_erster_inhalt(self) -> None:
+        if not self._zeitmessung or self._erster_inhalt_gemeldet:
+            return
+        self._erster_inhalt_gemeldet = True
+        ms = (time.perf_counter() - T_START) * 1000.0
+        print(f"MySlide: erster Inhalt nach {ms:.0f} ms", file=sys.stderr)
+
+    @Slot()
+    def _on_erster_video_frame(self, frame) -> None:
+        self._melde_erster_inhalt()
 
     def resizeEvent(self, e) -> None:
         super().resizeEvent(e)
@@ -1279,10 +6832,12 @@ class SlideShowWindow(QMainWindow):
         if 0 <= self.play_index < len(self.playlist):
             item = self.playlist[self.play_index]
             if item.kind == "bild":
-                pix = QPixmap(item.path)
-                if not pix.isNull():
-                    lbl = self.vollbild.bild_label if self.vollbild.isVisible() else self.bild_label
-                    QTimer.singleShot(0, lambda: self._set_pixmap_scaled(lbl, pix))
+                img = self._angezeigtes_bild(item)  # schon dekodiert, nur neu skalieren
+                if img is None:
+                    img = self._lade_bild(item)
+                if not img.isNull():
+                    for lbl in self._bild_ziele():
+                        QTimer.singleShot(0, lambda lbl=lbl: self._set_pixmap_scaled(lbl, item.path, img))
 
     def _refresh_overlay(self, item: Optional[MediaItem] = None) -> None:
         if not self.dateiname_anzeigen:
@@ -1295,6 +6850,7 @@ class SlideShowWindow(QMainWindow):
     @Slot()
     def _toggle_zufall(self, on: bool) -> None:
         self.zufall_an = on
+        self._zufall_verlauf.clear()
         self._rebuild_playlist()
         self._update_status("Zufall geändert")
 
@@ -1303,9 +6859,25 @@ class SlideShowWindow(QMainWindow):
         self.repeat_an = on
         self._update_status("Dauerschleife geändert")
 
+    def _setze_lautstaerke(self, path: Optional[str] = None) -> None:
+        """Regler-Lautstärke, bei Videos mit gemessener Lautheit auf den Zielpegel angeglichen."""
+        faktor = 1.0
+        if path is not None and self.angleichen_cb.isChecked():
+            faktor = lautheit_faktor(self.lautheit.get(path))
+        self.audio.setVolume(max(0.0, min(1.0, self.vol_slider.value() / 100.0 * faktor)))
+
+    def _aktuelles_video(self) -> Optional[str]:
+        if 0 <= self.play_index < len(self.playlist) and self.playlist[self.play_index].kind == "video":
+            return self.playlist[self.play_index].path
+        return None
+
     @Slot()
     def _on_volume_changed(self, v: int) -> None:
-        self.audio.setVolume(max(0.0, min(1.0, v / 100.0)))
+        self._setze_lautstaerke(self._aktuelles_video())
+
+    @Slot(bool)
+    def _on_angleichen_changed(self, an: bool) -> None:
+        self._setze_lautstaerke(self._aktuelles_video())
 
     @Slot()
     def _on_mute_changed(self) -> None:
@@ -1338,23 +6910,379 @@ class SlideShowWindow(QMainWindow):
         ton = "stumm" if self.mute_cb.isChecked() else "an"
         run = "läuft" if self.running else "steht"
         pau = "pausiert" if self.paused else "aktiv"
+        filt = self.filter_option + (f" + {self.filter_text}" if self.filter_text else "")
         msg = (
             f"{(prefix + '  ') if prefix else ''}"
             f"Status: {run}/{pau} | Playlist: {idx}/{total} | Modus: {modus} | "
-            f"Filter: {self.filter_option} | Bild-Timer: {interval}s | Dauerschleife: {rep} | Ton: {ton}"
+            f"Filter: {filt} | Bild-Timer: {interval}s | Laufzeit: {self._laufzeit_text()} | "
+            f"Dauerschleife: {rep} | Ton: {ton}"
         )
         self.status.showMessage(msg)
 
 
+# ---- Dauertest (Soak) -------------------------------------------------------
+
+def prozess_rss() -> int:
+    """Resident Set Size in Bytes (0, wenn nicht ermittelbar)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _quantil(werte: List[float], q: float) -> float:
+    if not werte:
+        return 0.0
+    werte = sorted(werte)
+    return werte[min(len(werte) - 1, int(q * len(werte)))]
+
+
+class Dauertest(QObject):
+    """
+    Treibt das Fenster durch viele Zyklen aus Weiter/Zurück/Vollbild/Filter und misst dabei
+    RSS, Python-Objekte je Typ und die Zeit bis zum sichtbaren Inhalt je Folie.
+    Verglichen wird ab dem Ende der Aufwärmphase (Caches gefüllt) bis zum Schluss;
+    überschreitet Wachstum oder Drift die Grenzen, endet die Anwendung mit Exit-Code 1.
+    """
+
+    ZYKLUS = ("weiter", "weiter", "weiter", "weiter", "weiter", "zurueck", "zurueck",
+              "vollbild", "weiter", "weiter", "vollbild", "filter", "weiter")
+    FILTER = ("Nur Bilder", "Nur Videos", "Alles")
+    PROBE_ALLE = 200          # Schritte zwischen zwei Messpunkten
+    AUFWAERMEN = 0.25         # Anteil der Schritte bis zur Basismessung
+    PAUSE_MS = 5              # zwischen zwei Schritten (Vorausladen läuft weiter)
+    HAENGER_MS = 5000         # ohne Inhalt nach dieser Zeit: Hänger, nächster Schritt
+    MAX_RSS_MB = 64           # erlaubtes RSS-Wachstum nach dem Aufwärmen
+    MAX_RSS_TREND_KB = 512    # erlaubter RSS-Anstieg je 1000 Schritte (Ausgleichsgerade)
+    MAX_OBJEKTE = 2000        # erlaubtes Wachstum je Objekttyp nach dem Aufwärmen
+    MAX_DRIFT = 1.5           # p95 der Latenz: letztes Viertel / erstes Viertel nach dem Aufwärmen
+    MIN_DRIFT_MS = 20.0       # kleinere Unterschiede gelten nicht als Drift
+
+    def __init__(self, fenster: "SlideShowWindow", zyklen: int, bericht: Optional[str] = None):
+        super().__init__(fenster)
+        self.w = fenster
+        self.schritte = max(1, zyklen) * len(self.ZYKLUS)
+        self.bericht_pfad = bericht
+        self._schritt = 0
+        self._filter_nr = 0
+        self._warte: Optional[Tuple[str, float]] = None  # (pfad, t0) bis der Inhalt sichtbar ist
+        self._sichtbar: Optional[Tuple[str, float]] = None  # zuletzt sichtbar geworden: (pfad, t)
+        self._latenzen: List[Tuple[int, float]] = []   # (schritt, ms)
+        self._haenger = 0
+        self._proben: List[dict] = []
+        self._basis: Optional[Tuple[int, Counter]] = None
+        self._typen: Counter = Counter()
+        self._t_start = 0.0
+        self._haenger_timer = QTimer(self)
+        self._haenger_timer.setSingleShot(True)
+        self._haenger_timer.setInterval(self.HAENGER_MS)
+        self._haenger_timer.timeout.connect(self._on_haenger)
+        fenster.inhalt_gezeigt.connect(self._on_inhalt)
+        fenster.player.mediaStatusChanged.connect(self._on_media_status)
+
+    def start(self) -> None:
+        self._t_start = time.perf_counter()
+        print(f"MySlide: Dauertest mit {self.schritte} Schritten", file=sys.stderr)
+        self._probe()
+        QTimer.singleShot(0, self._naechster_schritt)
+
+    # ---- Schritte --------------------------------------------------------------
+
+    @Slot()
+    def _naechster_schritt(self) -> None:
+        if self._schritt >= self.schritte:
+            self._ende()
+            return
+        if self._schritt % self.PROBE_ALLE == 0 and self._schritt:
+            self._probe()
+        aktion = self.ZYKLUS[self._schritt % len(self.ZYKLUS)]
+        self._schritt += 1
+        w = self.w
+        self._sichtbar = None
+        t0 = time.perf_counter()
+        if aktion == "vollbild":
+            w.toggle_vollbild()
+        elif aktion == "filter":
+            w._set_filter(self.FILTER[self._filter_nr % len(self.FILTER)])
+            self._filter_nr += 1
+        elif w.playlist:
+            (w.next_item if aktion == "weiter" else w.prev_item)()
+            item = self._aktuell()
+            if item is not None:
+                if item.kind == "video" and w.player.mediaStatus() in (
+                    QMediaPlayer.LoadedMedia, QMediaPlayer.BufferedMedia
+                ):
+                    self._sichtbar = (item.path, time.perf_counter())  # Quelle war schon geladen
+                if self._sichtbar is not None and self._sichtbar[0] == item.path:
+                    self._messe(t0, self._sichtbar[1])  # vorbereitete Folie: sofort getauscht
+                    return
+                self._warte = (item.path, t0)
+                self._haenger_timer.start()
+                return
+        QTimer.singleShot(self.PAUSE_MS, self._naechster_schritt)
+
+    def _aktuell(self) -> Optional[MediaItem]:
+        w = self.w
+        return w.playlist[w.play_index] if 0 <= w.play_index < len(w.playlist) else None
+
+    def _messe(self, t0: float, t1: float) -> None:
+        self._warte = None
+        self._haenger_timer.stop()
+        self._latenzen.append((self._schritt, (t1 - t0) * 1000.0))
+        QTimer.singleShot(self.PAUSE_MS, self._naechster_schritt)
+
+    def _sichtbar_geworden(self, path: str) -> None:
+        self._sichtbar = (path, time.perf_counter())
+        if self._warte is not None and self._warte[0] == path:
+            self._messe(self._warte[1], self._sichtbar[1])
+
+    @Slot(str)
+    def _on_inhalt(self, path: str) -> None:
+        self._sichtbar_geworden(path)
+
+    @Slot(object)
+    def _on_media_status(self, status) -> None:
+        item = self._aktuell()
+        if item is not None and item.kind == "video" and status in (
+            QMediaPlayer.LoadedMedia, QMediaPlayer.BufferedMedia, QMediaPlayer.InvalidMedia
+        ):
+            self._sichtbar_geworden(item.path)
+
+    @Slot()
+    def _on_haenger(self) -> None:
+        # z. B. Bild nicht lesbar: zählt nicht zur Latenz, aber in den Bericht
+        self._haenger += 1
+        self._warte = None
+        QTimer.singleShot(0, self._naechster_schritt)
+
+    # ---- Messung ---------------------------------------------------------------
+
+    def _probe(self) -> None:
+        gc.collect()
+        typen = Counter(type(o).__name__ for o in gc.get_objects())
+        probe = {
+            "schritt": self._schritt,
+            "sekunden": round(time.perf_counter() - self._t_start, 1),
+            "rss": prozess_rss(),
+            "cache_bytes": speicher_budget.belegt,
+            "objekte": sum(typen.values()),
+        }
+        self._proben.append(probe)
+        if self._basis is None and self._schritt >= self.schritte * self.AUFWAERMEN:
+            self._basis = (len(self._proben) - 1, typen)
+        self._typen = typen
+
+    @staticmethod
+    def _rss_trend_kb(proben: List[dict]) -> float:
+        """Steigung der Ausgleichsgeraden durch (schritt, rss) in KB je 1000 Schritte."""
+        if len(proben) < 2:
+            return 0.0
+        xs = [p["schritt"] for p in proben]
+        ys = [p["rss"] / 1024 for p in proben]
+        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+        nenner = sum((x - mx) ** 2 for x in xs)
+        return 1000 * sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / nenner if nenner else 0.0
+
+    def _latenz_p95(self, von: int, bis: int) -> Tuple[float, int]:
+        werte = [ms for schritt, ms in self._latenzen if von < schritt <= bis]
+        return _quantil(werte, 0.95), len(werte)
+
+    def _ende(self) -> None:
+        self._probe()
+        fehler: List[str] = []
+        zeilen = [f"Dauertest: {self.schritte} Schritte in {self._proben[-1]['sekunden']:.0f} s, "
+                  f"{len(self._latenzen)} Folien gemessen, {self._haenger} Hänger"]
+        if self._basis is None or self._basis[0] == len(self._proben) - 1:
+            zeilen.append("zu wenige Schritte für einen Vergleich nach dem Aufwärmen")
+        else:
+            basis_nr, basis_typen = self._basis
+            basis, ende = self._proben[basis_nr], self._proben[-1]
+            if basis["rss"] and ende["rss"]:
+                plus_mb = (ende["rss"] - basis["rss"]) / MIB
+                zeilen.append(f"RSS: {basis['rss'] / MIB:.0f} MB -> {ende['rss'] / MIB:.0f} MB ({plus_mb:+.1f} MB), "
+                              f"Caches {ende['cache_bytes'] / MIB:.0f} MB")
+                if plus_mb > self.MAX_RSS_MB:
+                    fehler.append(f"RSS wächst um {plus_mb:.1f} MB (Grenze {self.MAX_RSS_MB} MB)")
+                trend = self._rss_trend_kb(self._proben[basis_nr:])
+                zeilen.append(f"RSS-Trend: {trend:+.0f} KB je 1000 Schritte")
+                if trend > self.MAX_RSS_TREND_KB:
+                    fehler.append(f"RSS steigt stetig um {trend:.0f} KB je 1000 Schritte "
+                                  f"(Grenze {self.MAX_RSS_TREND_KB} KB)")
+            wachstum = (self._typen - basis_typen).most_common(8)
+            zeilen.append(f"Objekte: {basis['objekte']} -> {ende['objekte']}; größter Zuwachs: "
+                          + (", ".join(f"{n} +{d}" for n, d in wachstum) or "keiner"))
+            for name, d in wachstum:
+                if d > self.MAX_OBJEKTE:
+                    fehler.append(f"{name}: +{d} Objekte (Grenze {self.MAX_OBJEKTE})")
+
+            start = basis["schritt"]
+            viertel = (self.schritte - start) // 4
+            frueh, n_frueh = self._latenz_p95(start, start + viertel)
+            spaet, n_spaet = self._latenz_p95(self.schritte - viertel, self.schritte)
+            zeilen.append(f"Latenz p95: {frueh:.1f} ms ({n_frueh} Folien) -> {spaet:.1f} ms ({n_spaet} Folien)")
+            if n_frueh and n_spaet and spaet - frueh > self.MIN_DRIFT_MS and spaet > frueh * self.MAX_DRIFT:
+                fehler.append(f"Latenz driftet: p95 {frueh:.1f} -> {spaet:.1f} ms")
+        alle = [ms for _, ms in self._latenzen]
+        zeilen.append(f"Latenz gesamt: p50 {_quantil(alle, 0.5):.1f} ms | p95 {_quantil(alle, 0.95):.1f} ms | "
+                      f"max {max(alle, default=0.0):.1f} ms")
+        zeilen.extend("FEHLER: " + f for f in fehler)
+        zeilen.append("Ergebnis: " + ("nicht bestanden" if fehler else "bestanden"))
+        print("\n".join(zeilen), file=sys.stderr)
+
+        if self.bericht_pfad:
+            try:
+                with open(self.bericht_pfad, "w", encoding="utf-8") as f:
+                    json.dump({"proben": self._proben, "latenzen_ms": [round(ms, 2) for ms in alle],
+                               "haenger": self._haenger, "fehler": fehler}, f, ensure_ascii=False, indent=1)
+            except OSError as e:
+                print(f"MySlide: Bericht konnte nicht geschrieben werden: {e}", file=sys.stderr)
+        QApplication.exit(1 if fehler else 0)
+
+
 # ---- Start ------------------------------------------------------------------
 
-def main() -> int:
+CLI_FILTER = {
+    "alles": "Alles",
+    "ausgewaehlt": "Nur ausgewähltes",
+    "bilder": "Nur Bilder",
+    "videos": "Nur Videos",
+}
+
+
+def parse_argumente(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="myslide", description="MySlide – Diashow für Bilder und Videos.")
+    p.add_argument("ordner", nargs="*", help="Ordner mit Bildern/Videos (mehrere möglich)")
+    p.add_argument("--filter", choices=list(CLI_FILTER), default="alles", help="Filter (Standard: alles)")
+    p.add_argument("--playlist", default=None, metavar="DATEI", help="M3U/M3U8/JSON-Playlist laden")
+    p.add_argument("--zufall", "--shuffle", action="store_true", help="Zufallsmodus einschalten")
+    p.add_argument("--seed", default=None, help="fester Startwert für den Zufallsmodus")
+    p.add_argument("--intervall", "--interval", type=int, default=0, metavar="SEK",
+                   help="Bild-Intervall in Sekunden (0 = 10 Sekunden)")
+    p.add_argument("--schleife", "--loop", action=argparse.BooleanOptionalAction, default=True,
+                   help="Dauerschleife (Standard: an)")
+    p.add_argument("--vollbild", "--fullscreen", action="store_true", help="direkt im Vollbild (nur Medium) starten")
+    p.add_argument("--start", action="store_true", help="Diashow sofort starten")
+    p.add_argument("--kiosk", action="store_true", help="wie --vollbild --start")
+    p.add_argument("--bildschirme", default="", metavar="LISTE",
+                   help="Vollbild auf mehreren Bildschirmen, z. B. '1,2' oder 'alle'")
+    p.add_argument("--zeitmessung", action="store_true", help="Zeit bis zum ersten Inhalt auf stderr ausgeben")
+    p.add_argument("--steuerung", type=int, default=None, metavar="PORT",
+                   help="lokale HTTP-Fernsteuerung auf 127.0.0.1:PORT")
+    p.add_argument("--steuer-socket", default=None, metavar="PFAD", help="Fernsteuerung über Unix-Socket")
+    p.add_argument("--steuer-benchmark", default=None, metavar="ZIEL",
+                   help="Latenz einer laufenden Fernsteuerung messen (host:port oder Socket-Pfad) und beenden")
+    p.add_argument("--haenger-ms", type=int, default=HAENGER_MS, metavar="MS",
+                   help=f"GUI-Blockaden ab MS ins Hänger-Log schreiben (Standard: {HAENGER_MS}, 0 = aus)")
+    p.add_argument("--dekoder-benchmark", default=None, metavar="ORDNER",
+                   help="Bild-Dekoder an Beispielbildern messen, schnellsten je Format merken und beenden")
+    p.add_argument("--sortierung", "--sort", choices=list(CLI_SORTIERUNG), default="ladefolge",
+                   help="Reihenfolge; Schlüssel werden im Hintergrund berechnet und im Index gecacht")
+    p.add_argument("--speicher-mb", type=int, default=512, metavar="MB",
+                   help="Obergrenze für alle Bild-/Frame-Caches zusammen (Standard: 512)")
+    p.add_argument("--staging-mb", type=int, default=0, metavar="MB",
+                   help="kommende Medien vorab in einen lokalen Ordner kopieren, bis MB groß (0 = aus)")
+    p.add_argument("--staging-ordner", default=None, metavar="PFAD",
+                   help="Ordner für die lokalen Kopien (Standard: ~/.cache/myslide/staging)")
+    p.add_argument("--dauertest", type=int, default=0, metavar="ZYKLEN",
+                   help="Dauertest: Weiter/Zurück/Vollbild/Filter in ZYKLEN Durchläufen, Bericht auf stderr")
+    p.add_argument("--dauertest-bericht", default=None, metavar="DATEI", help="Messwerte des Dauertests als JSON")
+    args = p.parse_args(argv)
+    if not 0 <= args.intervall <= 3600:
+        p.error("--intervall muss zwischen 0 und 3600 liegen")
+    if args.bildschirme and args.bildschirme != "alle":
+        try:
+            args.bildschirme = [int(t) - 1 for t in args.bildschirme.split(",") if t.strip()]
+        except ValueError:
+            p.error("--bildschirme erwartet Nummern (ab 1), getrennt durch Komma, oder 'alle'")
+    return args
+
+
+def baue_startoptionen(args: argparse.Namespace) -> StartOptionen:
+    start = StartOptionen(
+        filter_option=CLI_FILTER[args.filter],
+        zufall=args.zufall,
+        seed=seed_zahl(args.seed),
+        sortierung=CLI_SORTIERUNG[args.sortierung],
+        intervall=args.intervall,
+        schleife=args.schleife,
+        vollbild=args.vollbild or args.kiosk,
+        abspielen=args.start or args.kiosk,
+        zeitmessung=args.zeitmessung,
+        steuer_port=args.steuerung,
+        steuer_socket=args.steuer_socket,
+        playlist=args.playlist,
+        staging_mb=max(0, args.staging_mb),
+        staging_ordner=args.staging_ordner,
+        haenger_ms=max(0, args.haenger_ms),
+    )
+    if args.bildschirme == "alle":
+        start.bildschirme = list(range(len(QApplication.screens())))
+    elif args.bildschirme:
+        start.bildschirme = args.bildschirme
+
+    items: List[MediaItem] = []
+    ordner = [os.path.abspath(o) for o in args.ordner]
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(ordner))), thread_name_prefix="quelle") as pool:
+        for folder, ergebnis in zip(ordner, pool.map(QuellenScan._lies, ordner)):
+            gefunden, fehler = ergebnis
+            if fehler:
+                print(f"MySlide: Quelle konnte nicht gelesen werden: {fehler}", file=sys.stderr)
+                continue
+            items.extend(gefunden)
+            start.ordner.append(folder)
+    if not start.ordner:
+        return start
+    items = ohne_duplikate(items)
+    for nr, item in enumerate(items):
+        item.nr = nr
+    start.items = items
+
+    # erstes Element genauso bestimmen wie _rebuild_playlist es tun wird, also mit derselben Auswahl
+    index = FilterIndex()
+    index.haenge_an(items)
+    if start.filter_option == "Nur ausgewähltes":
+        # von der Kommandozeile gibt es noch keine Haken: wie beim Duplikate-Abwählen ist dann alles ausgewählt
+        index.ausgewaehlt[:] = b"\x01" * len(items)
+        start.ausgewaehlt = index.ausgewaehlt
+    maske = index.maske(filter_ausdruck(start.filter_option))
+    playlist = list(compress(items, maske))
+    erste_pos = 0
+    if start.zufall and playlist:
+        res = zufall_schritt(playlist, maske, len(items), zufall_bits(len(items)),
+                             start.seed, -1, None, 0, +1, True)
+        erste_pos = res[0] if res else 0
+    if playlist:
+        start.erstes = playlist[erste_pos]
+        if start.erstes.kind == "bild":
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vorab")
+            path = start.erstes.path
+            start.erstes_bild = pool.submit(lambda: (path, dekodiere_bild(path)))
+            pool.shutdown(wait=False)
+    return start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     app = QApplication(sys.argv)
     app.setApplicationName("MintSlide")
     app.setOrganizationName("Local")
 
-    w = SlideShowWindow()
+    args = parse_argumente(app.arguments()[1:] if argv is None else argv)
+    if args.steuer_benchmark:
+        return benchmark_steuerung(args.steuer_benchmark, 1000)
+    erweitere_bildformate()
+    if args.dekoder_benchmark:
+        return benchmark_dekoder(args.dekoder_benchmark)
+    speicher_budget.setze_limit(args.speicher_mb * MIB)
+    start = baue_startoptionen(args)
+
+    w = SlideShowWindow(start)
     w.show()
+    if start.ordner or start.playlist:
+        w.starte(vollbild=start.vollbild, abspielen=start.abspielen)
+    if args.dauertest > 0:
+        test = Dauertest(w, args.dauertest, args.dauertest_bericht)
+        QTimer.singleShot(0, test.start)
     return app.exec()
 
 